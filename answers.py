@@ -0,0 +1,161 @@
+"""
+Tolking og retting av elevsvar.
+
+Et svar kan være et tall med komma ("12,5") eller et regnestykke med enkle funksjoner:
+"3,6*4,2*1,1", "sqrt(3^2+4^2)", "√(25)", "2·3", "1 200". Komma er alltid desimaltegn.
+Vinkelfunksjonene regner i grader, som i resten av appen.
+
+Svaret kan ha enhet ("16,63 m²", "130 mm", "1 200 kr"). Tall, tusenskille og enhet
+leses med ett forhåndskompilert regulært uttrykk (_QUANTITY), og verdien regnes om
+til oppgavens enhet (units.py) før den sammenlignes med tol.
+
+Uttrykk tolkes med sympy etter en streng hviteliste (tall, + - * / ^, parenteser og
+navnene i ANSWER_FUNCTIONS), kompileres med lambdify til vanlig flyttallsregning og
+caches i en LRU på normalisert tekst. Hele tall gjøres om til flyttall før tolkingen,
+så "9^9^9" gir overflow med en gang i stedet for å regnes ut eksakt.
+"""
+import math
+import re
+from functools import lru_cache
+
+try:
+    import sympy
+    from sympy.parsing.sympy_parser import parse_expr, standard_transformations
+except Exception:
+    sympy = None
+
+from units import UNITS, canonical_unit, convert_unit
+
+ANSWER_CACHE_SIZE = 4096  # normaliserte uttrykk
+MAX_ANSWER_LENGTH = 80
+
+ANSWER_FUNCTIONS = {
+    "sqrt": math.sqrt,
+    "rot": math.sqrt,
+    "abs": abs,
+    "sin": lambda x: math.sin(math.radians(x)),
+    "cos": lambda x: math.cos(math.radians(x)),
+    "tan": lambda x: math.tan(math.radians(x)),
+    "asin": lambda x: math.degrees(math.asin(x)),
+    "acos": lambda x: math.degrees(math.acos(x)),
+    "atan": lambda x: math.degrees(math.atan(x)),
+}
+ANSWER_CONSTANTS = {"pi": math.pi}
+
+_REPLACEMENTS = str.maketrans({",": ".", "×": "*", "·": "*", "÷": "/", ":": "/", "−": "-"})
+_DIGIT_SPACE = re.compile(r"(?<=\d)\s+(?=\d)")  # "1 200" -> "1200"
+_ROOT_NUMBER = re.compile(r"√\s*([\d.,]+)")  # "√25" -> "sqrt(25)"
+_ALLOWED = re.compile(r"[0-9.+\-*/()a-z]*")
+_NAME = re.compile(r"[a-z]+")
+_INT = re.compile(r"(?<![\d.])(\d+)(?![\d.])")
+
+
+def normalize_answer(text: str) -> str:
+    s = _DIGIT_SPACE.sub("", (text or "").strip().lower())
+    s = _ROOT_NUMBER.sub(r"sqrt(\1)", s).replace("√", "sqrt").replace("π", "pi")
+    return s.translate(_REPLACEMENTS).replace(" ", "").replace("^", "**")
+
+
+# Det eneste parse_expr får se i tillegg til local_dict (ingen builtins)
+_SYMPY_NAMES = {name: getattr(sympy, name) for name in
+                ("Add", "Mul", "Pow", "Float", "Integer", "Rational", "Symbol", "Function")} if sympy else {}
+
+
+@lru_cache(maxsize=ANSWER_CACHE_SIZE)
+def compile_answer(expr: str):
+    """Normalisert uttrykk -> funksjon uten argumenter som gir svaret, eller None hvis ugyldig."""
+    if sympy is None or not expr or len(expr) > MAX_ANSWER_LENGTH or not _ALLOWED.fullmatch(expr):
+        return None
+    names = set(_NAME.findall(expr))
+    if not names <= ANSWER_FUNCTIONS.keys() | ANSWER_CONSTANTS.keys():
+        return None
+    local = {name: sympy.Function(name) for name in names & ANSWER_FUNCTIONS.keys()}
+    local.update({name: sympy.Float(ANSWER_CONSTANTS[name]) for name in names & ANSWER_CONSTANTS.keys()})
+    try:
+        parsed = parse_expr(_INT.sub(r"\1.0", expr), local_dict=local, global_dict=_SYMPY_NAMES,
+                            transformations=standard_transformations, evaluate=False)
+        if parsed.free_symbols:
+            return None
+        return sympy.lambdify((), parsed, modules=[ANSWER_FUNCTIONS, "math"])
+    except Exception:
+        return None
+
+
+def parse_answer(text: str) -> float | None:
+    """Tallverdien av et elevsvar, eller None hvis det ikke kan tolkes."""
+    s = normalize_answer(text)
+    if not s:
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        pass
+    f = compile_answer(s)
+    if f is None:
+        return None
+    try:
+        v = float(f())
+    except (ArithmeticError, ValueError, TypeError):
+        return None
+    return v if math.isfinite(v) else None
+
+
+# tall (med norsk tusenskille) eller regnestykke, evt. fulgt av en enhet
+_QUANTITY = re.compile(r"""
+    ^\s*
+    (?:
+        (?P<num>[-+−]?
+            (?:\d{1,3}(?:[ \u00a0\u202f]\d{3})+   # 1 200 000
+             | \d{1,3}(?:\.\d{3})+(?=,)            # 1.200,50
+             | \d+)
+            (?:[.,]\d+)?
+            (?:e[-+−]?\d+)?)                       # 1e3, 2,5E-3
+      | (?P<expr>.+?)
+    )
+    (?:(?<=[\d).])\s*(?P<unit>%|°c?|[a-zæøå]+\.?(?:\^?[23²³])?))?
+    \s*$""", re.VERBOSE | re.IGNORECASE)
+_THOUSANDS = str.maketrans("", "", " \u00a0\u202f")
+
+
+def parse_quantity(text: str):
+    """(verdi, enhet) fra et elevsvar; enhet er None hvis eleven ikke skrev noen. None hvis ugyldig."""
+    m = _QUANTITY.match(text or "")
+    if m is None:
+        return None
+    num = m.group("num")
+    if num is not None:
+        num = num.translate(_THOUSANDS).replace("−", "-")
+        if "," in num:
+            num = num.replace(".", "").replace(",", ".")
+        value = float(num)
+        if not math.isfinite(value):  # 1e999
+            return None
+    else:
+        value = parse_answer(m.group("expr"))
+        if value is None:
+            return None
+    unit = m.group("unit")
+    return value, (canonical_unit(unit) if unit else None)
+
+
+def answer_value(user_text: str, unit: str = "") -> float | None:
+    """Elevsvaret regnet om til enheten unit, eller None hvis det ikke kan tolkes/sammenlignes."""
+    parsed = parse_quantity(user_text)
+    if parsed is None:
+        return None
+    v, given = parsed
+    if given is not None and given not in UNITS and given != canonical_unit(unit):
+        return None  # "2pi", "5 abc": teksten etter tallet er ingen enhet vi kjenner
+    if given is not None and unit:
+        return convert_unit(v, given, unit)  # None ved feil dimensjon, f.eks. m² når oppgaven spør etter m
+    return v
+
+
+def check_answer(user_text: str, q: dict):
+    v = answer_value(user_text, q.get("unit", ""))
+    if v is None:
+        return False, None
+    if q.get("integer"):
+        v = int(v)
+    ok = abs(v - float(q["answer"])) <= float(q.get("tol", 0.0))
+    return ok, v
@@ -0,0 +1,540 @@
+"""
+Spørsmål i Læringsarena: 10 per elev, tema og nivå.
+
+Spørsmålene er deklarert som maler i et register (QuestionTemplate), nøklet på
+(tema, nivåbånd). Hver mal oppgir parameterverdier, svarformel, enhet og toleranse.
+Registeret bygges én gang ved import, og (tema, nivå) slås opp direkte. Et nytt
+tema er bare nye register_template()-kall.
+
+Frøet er en SHA-256 av (elev, tema, nivå), så samme elev får de samme spørsmålene
+etter omstart og på alle servere (Pythons hash() er saltet per prosess). Alle 10
+spørsmålene lages i én omgang fra samme tallstrøm og holdes i en begrenset
+LRU-cache, så en rerun bare slår opp i cachen.
+
+generate_question_batch() lager spørsmål for mange elever/tema/nivåer samtidig med
+NumPy (arbeidsark, prøver), fra de samme malene.
+
+Hver mal har også en løsning: trinn av typen enhet, formel, innsetting og svar, som
+fylles ut med spørsmålets tall. solution_text() gir mellomregningen som tekst og er
+cachet per (frø, tema, nivå, nr), så en rerun ikke regner den ut på nytt.
+"""
+import hashlib
+import itertools
+import math
+import random
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import SimpleNamespace
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+from curriculum import QUESTIONS_PER_TOPIC
+from units import fmt, fmt_exact
+
+QUESTION_CACHE_SIZE = 2048  # (elev, tema, nivå)-sett i minnet, ca. 5 kB hver
+SOLUTION_CACHE_SIZE = 4096  # enkeltspørsmål med ferdig mellomregning
+
+SOLUTION_STEP_KINDS = ("enhet", "formel", "innsetting", "svar")
+
+# Svarformlene får et av disse som første argument, så samme formel virker både på
+# enkelttall (math) og på hele kolonner (numpy).
+MATH_OPS = SimpleNamespace(atan=math.atan, tan=math.tan, degrees=math.degrees, radians=math.radians,
+                           hypot=math.hypot, ceil=math.ceil, maximum=max)
+NUMPY_OPS = SimpleNamespace(atan=np.arctan, tan=np.tan, degrees=np.degrees, radians=np.radians,
+                            hypot=np.hypot, ceil=np.ceil, maximum=np.maximum) if np is not None else None
+
+MISSING_QUESTION = {"prompt": "(mangler)", "answer": 0.0, "unit": "", "tol": 0.0}
+
+
+# ============================================================
+# Maler
+# ============================================================
+@dataclass(frozen=True)
+class QuestionTemplate:
+    """
+    Én spørsmålstype. params er (navn, verdier) i trekkrekkefølge; derive kan legge til
+    avledede verdier (f.eks. sider i en skalert 3-4-5-trekant) som prompt og answer bruker.
+    solution er (type, tekst)-trinn; tekstene kan bruke parametrene, mellomresultatene fra
+    work, {svar} og {enhet}.
+    """
+    topic: str
+    levels: tuple
+    prompt: str
+    answer: object  # answer(ops, **verdier) -> tall
+    unit: str
+    tol: float
+    params: tuple
+    integer: bool = False
+    derive: object = None  # derive(ops, **params) -> dict
+    solution: tuple = ()
+    work: object = None  # work(ops, **verdier) -> dict med mellomresultater til løsningen
+    radix: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "radix", tuple(len(values) for _, values in self.params))
+
+    @property
+    def space_size(self) -> int:
+        return math.prod(self.radix)
+
+    def values_at(self, index: int) -> dict:
+        """Parameterkombinasjon nr. index (blandet tallsystem, første parameter mest signifikant)."""
+        values = {}
+        for (name, domain), n in zip(reversed(self.params), reversed(self.radix)):
+            index, i = divmod(index, n)
+            values[name] = domain[i]
+        return {name: values[name] for name, _ in self.params}
+
+    def iter_space(self):
+        """Alle parameterkombinasjoner, i samme rekkefølge som values_at."""
+        names = [name for name, _ in self.params]
+        for combo in itertools.product(*(domain for _, domain in self.params)):
+            yield dict(zip(names, combo))
+
+    def render(self, values: dict) -> dict:
+        if self.derive is not None:
+            values = {**values, **self.derive(MATH_OPS, **values)}
+        q = {"prompt": self.prompt.format(**values), "answer": self.answer(MATH_OPS, **values),
+             "unit": self.unit, "tol": self.tol}
+        if self.integer:
+            q["integer"] = True
+        return q
+
+    def solve(self, values: dict) -> tuple:
+        """Løsningstrinnene utfylt for én parameterkombinasjon: ((type, tekst), ...)."""
+        if self.derive is not None:
+            values = {**values, **self.derive(MATH_OPS, **values)}
+        shown = dict(values)  # oppgitte tall vises som i prompt, mellomregninger med alle siffer
+        if self.work is not None:
+            shown.update({k: fmt_exact(v) for k, v in self.work(MATH_OPS, **values).items()})
+        shown["svar"] = fmt(self.answer(MATH_OPS, **values))
+        shown["enhet"] = f" {self.unit}" if self.unit else ""
+        return tuple((kind, text.format(**shown)) for kind, text in self.solution)
+
+
+QUESTION_TEMPLATES = {}  # (tema, nivåer) -> maler (én trekkes med lik sannsynlighet)
+_TEMPLATES_BY_LEVEL = {}  # (tema, nivå) -> maler
+
+
+def register_template(template: QuestionTemplate) -> QuestionTemplate:
+    key = (template.topic, tuple(template.levels))
+    if any(kind not in SOLUTION_STEP_KINDS for kind, _ in template.solution):
+        raise ValueError(f"{template.topic}: ukjent løsningstrinn i {template.prompt!r}")
+    for level in key[1]:
+        existing = _TEMPLATES_BY_LEVEL.get((template.topic, level))
+        if existing and (existing[0].topic, existing[0].levels) != key:
+            raise ValueError(f"{template.topic} nivå {level} ligger allerede i et annet nivåbånd")
+    QUESTION_TEMPLATES[key] = QUESTION_TEMPLATES.get(key, ()) + (template,)
+    for level in key[1]:
+        _TEMPLATES_BY_LEVEL[(template.topic, level)] = QUESTION_TEMPLATES[key]
+    return template
+
+
+def templates_for(topic_key: str, level: int) -> tuple:
+    return _TEMPLATES_BY_LEVEL.get((topic_key, level), ())
+
+
+def _t(topic, levels, prompt, answer, unit, tol, integer=False, derive=None, solution=(), work=None, **params):
+    register_template(QuestionTemplate(topic, tuple(levels), prompt, answer, unit, tol,
+                                       tuple((k, tuple(v)) for k, v in params.items()), integer, derive,
+                                       tuple(solution), work))
+
+
+SMALL = (2, 3, 4, 5, 6, 7, 8)  # barneskole
+MEDIUM = (2.4, 3.0, 3.6, 4.2, 4.8, 5.4, 6.0)  # ungdomsskole
+LARGE = (6.0, 7.2, 8.4, 9.6, 10.8, 12.0)  # vgs/lærling
+
+# --- Areal ---
+_RECT_AREA = (("formel", "A = L × B"), ("innsetting", "A = {L} m × {B} m"), ("svar", "A = {svar} m²"))
+_t("areal", (1, 2), "Finn arealet av et rektangel: L={L} m og B={B} m. (m²)",
+   lambda ops, L, B: L * B, "m²", 0.01, L=SMALL, B=(1, 2, 3, 4, 5), solution=_RECT_AREA)
+_t("areal", (3, 4), "Et rom er {L} m langt og {B} m bredt. Finn gulvarealet (m²).",
+   lambda ops, L, B: L * B, "m²", 0.02, L=MEDIUM, B=(2.0, 2.5, 3.0, 3.5, 4.0), solution=_RECT_AREA)
+# VG1-VG3: vegg, halvparten med én dør (0,9×2,1) trukket fra
+_t("areal", (5, 6, 7), "En vegg er {L} m lang og {H} m høy. Finn arealet (m²).",
+   lambda ops, H, L: H * L, "m²", 0.05, H=(2.4, 2.7, 3.0), L=LARGE,
+   solution=(("formel", "A = L × H"), ("innsetting", "A = {L} m × {H} m"), ("svar", "A = {svar} m²")))
+_t("areal", (5, 6, 7), "En vegg er {L} m lang og {H} m høy. Trekk fra én dør (0,9×2,1 m). Finn nettoareal (m²).",
+   lambda ops, H, L: ops.maximum(0.0, H * L - 0.9 * 2.1), "m²", 0.05, H=(2.4, 2.7, 3.0), L=LARGE,
+   work=lambda ops, H, L: {"gross": H * L, "door": 0.9 * 2.1},
+   solution=(("formel", "A = L × H − dør"), ("innsetting", "Vegg: {L} m × {H} m = {gross} m²"),
+             ("innsetting", "Dør: 0.9 m × 2.1 m = {door} m²"), ("svar", "A = {gross} − {door} = {svar} m²")))
+
+# --- Omkrets ---
+_RECT_PERIMETER = (("formel", "O = 2 × (L + B)"), ("innsetting", "O = 2 × ({L} m + {B} m)"), ("svar", "O = {svar} m"))
+_t("omkrets", (1, 2), "Finn omkretsen av et rektangel: L={L} m og B={B} m. (m)",
+   lambda ops, L, B: 2 * (L + B), "m", 0.01, L=SMALL, B=(1, 2, 3, 4, 5), solution=_RECT_PERIMETER)
+_t("omkrets", (3, 4), "Du skal sette gulvlister rundt et rom {L} m × {B} m. Finn omkrets (m).",
+   lambda ops, L, B: 2 * (L + B), "m", 0.02, L=MEDIUM, B=(2.0, 2.5, 3.0, 3.5), solution=_RECT_PERIMETER)
+_t("omkrets", (5,), "Du skal ha lister rundt et rom {L} m × {B} m. Finn løpemeter (m).",
+   lambda ops, L, B: 2 * (L + B), "m", 0.05, L=LARGE, B=(3.6, 4.2, 4.8, 5.4), solution=_RECT_PERIMETER)
+_t("omkrets", (6, 7), "Du skal ha lister rundt et rom {L} m × {B} m. Legg til {waste}% svinn. Hvor mange meter bestiller du?",
+   lambda ops, L, B, waste: 2 * (L + B) * (1 + waste / 100), "m", 0.2, L=LARGE, B=(3.6, 4.2, 4.8, 5.4), waste=(5, 8, 10),
+   work=lambda ops, L, B, waste: {"O": 2 * (L + B), "factor": 1 + waste / 100},
+   solution=(("formel", "Bestilling = O × (1 + svinn / 100), O = 2 × (L + B)"),
+             ("innsetting", "O = 2 × ({L} m + {B} m) = {O} m"),
+             ("innsetting", "Bestilling = {O} m × (1 + {waste} / 100) = {O} m × {factor}"),
+             ("svar", "{svar} m")))
+
+# --- Enhetsomregning ---
+def _convert_steps(rule, formula, op, unit):
+    return (("enhet", rule), ("formel", formula), ("innsetting", "{val} " + op), ("svar", "{svar} " + unit))
+
+
+_MM_TO_CM = _convert_steps("1 cm = 10 mm", "cm = mm / 10", "/ 10", "cm")
+_t("enheter", (1, 2), "Gjør om {val} mm til cm.", lambda ops, val: val / 10, "cm", 0.001,
+   val=(10, 25, 50, 120, 250, 500, 1000), solution=_MM_TO_CM)
+_t("enheter", (3, 4), "Gjør om {val} cm til meter (m).", lambda ops, val: val / 100, "m", 0.0005,
+   val=(30, 45, 60, 90, 120, 150, 240), solution=_convert_steps("1 m = 100 cm", "m = cm / 100", "/ 100", "m"))
+# VG1+: blandede enheter slik elevene møter i verksted
+_t("enheter", (5, 6, 7), "Gjør om {val} mm til m.", lambda ops, val: val / 1000, "m", 0.001,
+   val=(18, 22, 48, 70, 98, 148), solution=_convert_steps("1 m = 1000 mm", "m = mm / 1000", "/ 1000", "m"))
+_t("enheter", (5, 6, 7), "Gjør om {val} m til mm.", lambda ops, val: val * 1000, "mm", 0.01,
+   val=(0.6, 1.2, 2.4, 3.6), solution=_convert_steps("1 m = 1000 mm", "mm = m × 1000", "× 1000", "mm"))
+_t("enheter", (5, 6, 7), "Gjør om {val} cm til mm.", lambda ops, val: val * 10, "mm", 0.01,
+   val=(7.3, 9.8, 14.8), solution=_convert_steps("1 cm = 10 mm", "mm = cm × 10", "× 10", "mm"))
+_t("enheter", (5, 6, 7), "Gjør om {val} mm til cm.", lambda ops, val: val / 10, "cm", 0.001,
+   val=(600, 1200, 2400, 3600), solution=_MM_TO_CM)
+
+# --- Vinkler (rettvinklet trekant, A hosliggende, B motstående) ---
+_t("vinkler", (1, 2, 3), "Rettvinklet trekant: A={A} og B={B}. Finn vinkelen θ (grader).",
+   lambda ops, A, B: ops.degrees(ops.atan(B / A)), "°", 0.6, A=(2, 3, 4, 5, 6), B=(1, 2, 3, 4),
+   work=lambda ops, A, B: {"ratio": B / A},
+   solution=(("formel", "θ = arctan(B / A)"), ("innsetting", "B / A = {B} / {A} = {ratio}"),
+             ("innsetting", "θ = arctan({ratio})"), ("svar", "θ = {svar}°")))
+_t("vinkler", (4, 5), "Du skal lage skråavstivning. A={A} m og θ={theta}°. Finn B (m).",
+   lambda ops, A, theta: A * ops.tan(ops.radians(theta)), "m", 0.05,
+   A=(2.4, 3.0, 3.6, 4.2), theta=(15, 20, 25, 30, 35, 40, 45),
+   work=lambda ops, A, theta: {"tan": ops.tan(ops.radians(theta))},
+   solution=(("formel", "B = A × tan(θ)"), ("innsetting", "tan({theta}°) = {tan}"),
+             ("innsetting", "B = {A} m × {tan}"), ("svar", "B = {svar} m")))
+# VG2/VG3: takvinkel
+_t("vinkler", (6, 7), "Tak: horisontal lengde (A)={run} m og høyde (B)={rise} m. Finn takvinkel θ (grader).",
+   lambda ops, run, rise: ops.degrees(ops.atan(rise / run)), "°", 0.6,
+   run=(3.6, 4.2, 4.8, 5.4), rise=(1.2, 1.5, 1.8, 2.1),
+   work=lambda ops, run, rise: {"ratio": rise / run},
+   solution=(("formel", "θ = arctan(B / A)"), ("innsetting", "B / A = {rise} / {run} = {ratio}"),
+             ("innsetting", "θ = arctan({ratio})"), ("svar", "θ = {svar}°")))
+
+# --- Diagonal ---
+_HYPOTENUSE = (("formel", "C = √(A² + B²)"), ("innsetting", "C = √({a}² + {b}²) = √{sum}"), ("svar", "C = {svar}{enhet}"))
+_t("diagonal", (1, 2, 3), "Finn diagonal C når A={a} og B={b}. (C = √(A²+B²))",
+   lambda ops, a, b: ops.hypot(a, b), "", 0.1, a=(3, 4, 5, 6), b=(4, 5, 6, 7, 8),
+   work=lambda ops, a, b: {"sum": a * a + b * b}, solution=_HYPOTENUSE)
+_t("diagonal", (4, 5), "Ramme: A={a} m og B={b} m. Finn diagonal C (m) for å sjekke vinkel.",
+   lambda ops, a, b: ops.hypot(a, b), "m", 0.03, a=(1.2, 2.4, 3.6, 4.8), b=(1.6, 2.0, 3.2, 4.0),
+   work=lambda ops, a, b: {"sum": a * a + b * b}, solution=_HYPOTENUSE)
+
+
+def _sides_345(ops, k):
+    return {"a": 3 * k, "b": 4 * k, "c": 5 * k}
+
+
+# VG2/VG3: 3-4-5 skalert, spør etter én av sidene
+_t("diagonal", (6, 7), "Kontrollmål: A={a} m og B={b} m. Hva skal C være (m) for rett vinkel?",
+   lambda ops, c, **_: c, "m", 0.05, derive=_sides_345, k=(1.0, 1.5, 2.0, 2.5),
+   work=lambda ops, a, b, **_: {"sum": a * a + b * b}, solution=_HYPOTENUSE)
+_t("diagonal", (6, 7), "Kontrollmål: C={c} m og B={b} m. Hva skal A være (m)?",
+   lambda ops, a, **_: a, "m", 0.05, derive=_sides_345, k=(1.0, 1.5, 2.0, 2.5),
+   work=lambda ops, b, c, **_: {"diff": c * c - b * b},
+   solution=(("formel", "A = √(C² − B²)"), ("innsetting", "A = √({c}² − {b}²) = √{diff}"), ("svar", "A = {svar} m")))
+_t("diagonal", (6, 7), "Kontrollmål: C={c} m og A={a} m. Hva skal B være (m)?",
+   lambda ops, b, **_: b, "m", 0.05, derive=_sides_345, k=(1.0, 1.5, 2.0, 2.5),
+   work=lambda ops, a, c, **_: {"diff": c * c - a * a},
+   solution=(("formel", "B = √(C² − A²)"), ("innsetting", "B = √({c}² − {a}²) = √{diff}"), ("svar", "B = {svar} m")))
+
+# --- Volum ---
+_t("volum", (1, 2, 3), "Finn volum: L={L}, B={B}, H={H}. (V=L×B×H)",
+   lambda ops, L, B, H: L * B * H, "", 0.01, L=(2, 3, 4, 5), B=(1, 2, 3), H=(1, 2, 3),
+   solution=(("formel", "V = L × B × H"), ("innsetting", "V = {L} × {B} × {H}"), ("svar", "V = {svar}")))
+_t("volum", (4, 5), "Betongplate: {L} m × {B} m × {t} m. Finn volum (m³).",
+   lambda ops, L, B, t: L * B * t, "m³", 0.01, L=(2.4, 3.6, 4.8, 6.0), B=(1.2, 2.4, 3.0), t=(0.05, 0.08, 0.10),
+   solution=(("formel", "V = L × B × t"), ("innsetting", "V = {L} m × {B} m × {t} m"), ("svar", "V = {svar} m³")))
+# VG2/VG3: tykkelse i mm
+_t("volum", (6, 7), "Plate: {L} m × {B} m × {tmm} mm. Finn volum (m³).",
+   lambda ops, L, B, tmm: L * B * (tmm / 1000), "m³", 0.02, L=(6.0, 7.2, 8.4), B=(2.4, 3.0, 3.6), tmm=(80, 100, 120, 150),
+   work=lambda ops, tmm, **_: {"t": tmm / 1000},
+   solution=(("enhet", "t = {tmm} mm = {t} m"), ("formel", "V = L × B × t"),
+             ("innsetting", "V = {L} m × {B} m × {t} m"), ("svar", "V = {svar} m³")))
+
+# --- Fall ---
+_t("fall", (1, 2, 3), "Fall er {fall_cm} cm over {lengde_m} m. Finn fall i %.",
+   lambda ops, fall_cm, lengde_m: (fall_cm / 100 / lengde_m) * 100, "%", 0.2,
+   fall_cm=(2, 3, 4, 5, 6), lengde_m=(2, 3, 4, 5),
+   work=lambda ops, fall_cm, **_: {"fall_m": fall_cm / 100},
+   solution=(("enhet", "{fall_cm} cm = {fall_m} m"), ("formel", "Fall % = fall / lengde × 100"),
+             ("innsetting", "Fall % = {fall_m} m / {lengde_m} m × 100"), ("svar", "{svar} %")))
+_t("fall", (4, 5), "Du har fall {per_m} mm per meter over {lengde_m} m. Hvor mange mm fall totalt?",
+   lambda ops, per_m, lengde_m: per_m * lengde_m, "mm", 1.0, per_m=(10, 15, 20, 25), lengde_m=(2.0, 3.0, 4.0, 5.0),
+   solution=(("formel", "Fall = fall per meter × lengde"), ("innsetting", "Fall = {per_m} mm/m × {lengde_m} m"),
+             ("svar", "{svar} mm")))
+# VG2/VG3: fall i % -> mm
+_t("fall", (6, 7), "Prosjekt: Fall {pct}% over {lengde_m} m. Hvor mange mm fall blir det?",
+   lambda ops, pct, lengde_m: (pct / 100) * lengde_m * 1000, "mm", 2.0,
+   pct=(1.0, 1.5, 2.0, 2.5), lengde_m=(3.0, 4.0, 5.0, 6.0),
+   work=lambda ops, lengde_m, **_: {"lengde_mm": lengde_m * 1000},
+   solution=(("enhet", "{lengde_m} m = {lengde_mm} mm"), ("formel", "Fall = % / 100 × lengde"),
+             ("innsetting", "Fall = {pct} / 100 × {lengde_mm} mm"), ("svar", "{svar} mm")))
+
+# --- Prosent ---
+_t("prosent", (1, 2, 3), "Hva er {p}% av {base}?", lambda ops, base, p: (p / 100) * base, "", 0.2,
+   base=(50, 80, 100, 120, 200), p=(10, 20, 25, 50),
+   solution=(("formel", "Del = p / 100 × grunnlag"), ("innsetting", "Del = {p} / 100 × {base}"), ("svar", "{svar}")))
+_t("prosent", (4, 5), "Du trenger {qty} stk. Legg til {waste}% svinn. Hvor mange bestiller du? (avrund opp)",
+   lambda ops, qty, waste: ops.ceil(qty * (100 + waste) / 100), "stk", 0.0, integer=True,
+   qty=(20, 25, 30, 40, 50), waste=(5, 10, 12, 15),
+   work=lambda ops, qty, waste: {"factor": 1 + waste / 100, "exact": qty * (100 + waste) / 100},
+   solution=(("formel", "Bestilling = antall × (1 + svinn / 100), rundet opp"),
+             ("innsetting", "{qty} × {factor} = {exact}"), ("svar", "Rundet opp: {svar} stk")))
+# VG2/VG3: prisendring
+_t("prosent", (6, 7), "En vare koster {old} kr. Prisøkning {change}%. Hva er ny pris?",
+   lambda ops, old, change: old * (1 + change / 100), "kr", 1.0,
+   old=(1200, 1500, 2000, 2500, 3200), change=(8, 10, 12, 15, 20),
+   work=lambda ops, change, **_: {"factor": 1 + change / 100},
+   solution=(("formel", "Ny pris = pris × (1 + økning / 100)"), ("innsetting", "Ny pris = {old} kr × {factor}"),
+             ("svar", "{svar} kr")))
+_t("prosent", (6, 7), "En vare koster {old} kr. Rabatt {change}%. Hva er ny pris?",
+   lambda ops, old, change: old * (1 - change / 100), "kr", 1.0,
+   old=(1200, 1500, 2000, 2500, 3200), change=(8, 10, 12, 15, 20),
+   work=lambda ops, change, **_: {"factor": 1 - change / 100},
+   solution=(("formel", "Ny pris = pris × (1 − rabatt / 100)"), ("innsetting", "Ny pris = {old} kr × {factor}"),
+             ("svar", "{svar} kr")))
+
+
+# ============================================================
+# Dekning og trekking uten tilbakelegging
+# ============================================================
+def space_size(topic_key: str, level: int) -> int:
+    """Antall ulike spørsmål som finnes for (tema, nivå)."""
+    return sum(t.space_size for t in templates_for(topic_key, level))
+
+
+def coverage_stats() -> list:
+    """Én rad per mal: tema, nivåer, antall parameterkombinasjoner og prompt."""
+    return [{"topic": t.topic, "levels": t.levels, "space_size": t.space_size, "prompt": t.prompt}
+            for templates in QUESTION_TEMPLATES.values() for t in templates]
+
+
+def sample_without_replacement(topic_key: str, level: int, k: int, rnd: random.Random | None = None) -> list:
+    """k ulike spørsmål for (tema, nivå), trukket fra hele parameterrommet (maks space_size)."""
+    templates = templates_for(topic_key, level)
+    sizes = [t.space_size for t in templates]
+    rnd = rnd or random.Random()
+    out = []
+    for index in rnd.sample(range(sum(sizes)), min(k, sum(sizes))):
+        for t, n in zip(templates, sizes):
+            if index < n:
+                out.append(t.render(t.values_at(index)))
+                break
+            index -= n
+    return out
+
+
+# ============================================================
+# Én elev: 10 spørsmål fra en stabil tallstrøm
+# ============================================================
+def question_seed(student_id: str, topic_key: str, level: int) -> int:
+    digest = hashlib.sha256(f"{student_id}:{topic_key}:{level}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def deterministic_rng(student_id: str, topic_key: str, level: int) -> random.Random:
+    return random.Random(question_seed(student_id, topic_key, level))
+
+
+def _pick(rnd: random.Random, templates: tuple) -> tuple:
+    t = templates[rnd.randrange(len(templates))] if len(templates) > 1 else templates[0]
+    return t, {name: rnd.choice(domain) for name, domain in t.params}
+
+
+@lru_cache(maxsize=QUESTION_CACHE_SIZE)
+def question_specs(seed: int, topic_key: str, level: int) -> tuple:
+    """(mal, parameterverdier) for de 10 spørsmålene fra frøet; tom hvis (tema, nivå) mangler maler."""
+    templates = templates_for(topic_key, level)
+    if not templates:
+        return ()
+    rnd = random.Random(seed)
+    return tuple(_pick(rnd, templates) for _ in range(QUESTIONS_PER_TOPIC))
+
+
+@lru_cache(maxsize=QUESTION_CACHE_SIZE)
+def question_set(student_id: str, topic_key: str, level: int) -> tuple:
+    """Alle spørsmålene for (elev, tema, nivå), i rekkefølge. Ikke endre dictene."""
+    specs = question_specs(question_seed(student_id, topic_key, level), topic_key, level)
+    if not specs:
+        return (MISSING_QUESTION,) * QUESTIONS_PER_TOPIC
+    return tuple(t.render(values) for t, values in specs)
+
+
+def generate_question(student_id: str, topic_key: str, level: int, qn: int) -> dict:
+    """
+    10 spørsmål per tema per nivå (qn=0..9).
+    Vokser fra 7. trinn -> VG3 lærling.
+    """
+    questions = question_set(student_id, topic_key, level)
+    return dict(questions[max(0, min(len(questions) - 1, qn))])
+
+
+@lru_cache(maxsize=SOLUTION_CACHE_SIZE)
+def solution_steps(seed: int, topic_key: str, level: int, qn: int) -> tuple:
+    """Løsningstrinnene for spørsmål qn (0..9): ((type, tekst), ...)."""
+    specs = question_specs(seed, topic_key, level)
+    if not 0 <= qn < len(specs):
+        return ()
+    t, values = specs[qn]
+    return t.solve(values)
+
+
+@lru_cache(maxsize=SOLUTION_CACHE_SIZE)
+def _solution_text(seed: int, topic_key: str, level: int, qn: int) -> str:
+    return "\n".join(text for _, text in solution_steps(seed, topic_key, level, qn))
+
+
+def solution_text(student_id: str, topic_key: str, level: int, qn: int) -> str:
+    """Mellomregningen for spørsmål qn som tekst (som "Vis mellomregning"), cachet."""
+    return _solution_text(question_seed(student_id, topic_key, level), topic_key, level, qn)
+
+
+# ============================================================
+# Batch (NumPy): hele klasser på én gang, f.eks. for arbeidsark
+# ============================================================
+def _render_batch(rng, t: QuestionTemplate, k: int) -> list:
+    """k spørsmål fra én mal: parametrene trekkes som kolonner, svarene regnes med numpy."""
+    cols = {name: np.asarray(domain)[rng.integers(0, len(domain), k)] for name, domain in t.params}
+    if t.derive is not None:
+        cols.update(t.derive(NUMPY_OPS, **cols))
+    answers = np.broadcast_to(np.asarray(t.answer(NUMPY_OPS, **cols), dtype=float), (k,)).tolist()
+    names = list(cols)
+    prompts = [t.prompt.format(**dict(zip(names, row))) for row in zip(*(cols[n].tolist() for n in names))]
+    extra = {"integer": True} if t.integer else {}
+    return [{"prompt": p, "answer": a, "unit": t.unit, "tol": t.tol, **extra} for p, a in zip(prompts, answers)]
+
+
+def batch_seed(student_ids, topic_keys, levels) -> int:
+    """Stabilt frø for en hel bestilling, så samme arbeidsark kan lages på nytt."""
+    h = hashlib.sha256()
+    for row in zip(student_ids, topic_keys, levels):
+        h.update(("%s:%s:%s|" % row).encode("utf-8"))
+    return int.from_bytes(h.digest()[:8], "big")
+
+
+def generate_question_batch(student_ids, topic_keys, levels, n: int = QUESTIONS_PER_TOPIC, seed: int | None = None) -> list:
+    """
+    n spørsmål for hver rad (student_ids[i], topic_keys[i], levels[i]); skalarer kringkastes.
+    Returnerer én liste med n spørsmål per rad. Alle tall trekkes med én NumPy-Generator
+    per bestilling (frø fra batch_seed), så arkene er et eget sett, ikke elevens 10 i arenaen.
+    """
+    if np is None:
+        raise RuntimeError("Batch-generering krever numpy.")
+    sids, topics, lvls = np.broadcast_arrays(
+        np.asarray(student_ids, dtype=object), np.asarray(topic_keys, dtype=object), np.asarray(levels, dtype=np.int64))
+    sids, topics, lvls = np.atleast_1d(sids), np.atleast_1d(topics), np.atleast_1d(lvls)
+    if seed is None:
+        seed = batch_seed(sids.tolist(), topics.tolist(), lvls.tolist())
+    rng = np.random.default_rng(seed)
+    out = [[MISSING_QUESTION] * n for _ in range(len(sids))]
+
+    # Grupper radene per mal-gruppe (tema, nivåbånd), trekk mal per spørsmål, så kolonnevis per mal
+    groups = {}
+    for r, (topic, level) in enumerate(zip(topics.tolist(), lvls.tolist())):
+        templates = templates_for(topic, level)
+        if templates:
+            groups.setdefault(templates, []).append(r)
+    for templates, rows in groups.items():
+        slots = [(r, j) for r in rows for j in range(n)]
+        which = rng.integers(0, len(templates), len(slots))
+        for ti, t in enumerate(templates):
+            picked = np.flatnonzero(which == ti).tolist()
+            for i, q in zip(picked, _render_batch(rng, t, len(picked))):
+                r, j = slots[i]
+                out[r][j] = q
+    return out
+
+
+# ============================================================
+# Faste øvingssett (nivåbasert)
+# ============================================================
+def make_tasks(level: int):
+    """Fast sett med 5 oppgaver per nivå (1-3), likt for alle elever."""
+    rnd = random.Random(1000 + level)  # stabilt sett per nivå
+
+    tasks = []
+    # nivå 1: enkle rektangel (areal/omkrets)
+    if level == 1:
+        for _ in range(5):
+            L = rnd.choice([2, 3, 4, 5, 6, 7])
+            B = rnd.choice([1, 1.5, 2, 2.5, 3])
+            task_type = rnd.choice(["area", "perimeter"])
+            if task_type == "area":
+                tasks.append({
+                    "topic": "Areal",
+                    "prompt": f"Et gulv er {L} m langt og {B} m bredt. Finn arealet i m².",
+                    "answer": L * B,
+                    "unit": "m²",
+                    "tolerance": 0.01,
+                })
+            else:
+                tasks.append({
+                    "topic": "Omkrets",
+                    "prompt": f"En ramme er {L} m × {B} m. Finn omkretsen i meter.",
+                    "answer": 2 * (L + B),
+                    "unit": "m",
+                    "tolerance": 0.01,
+                })
+
+    # nivå 2: volum + prosent (svinn)
+    elif level == 2:
+        for _ in range(5):
+            t = rnd.choice(["volume", "waste"])
+            if t == "volume":
+                L = rnd.choice([2, 3, 4, 5])
+                B = rnd.choice([1.5, 2, 2.5, 3])
+                H = rnd.choice([0.05, 0.08, 0.1, 0.12, 0.15])
+                tasks.append({
+                    "topic": "Volum",
+                    "prompt": f"En plate/flate er {L} m × {B} m med tykkelse {H} m. Finn volumet i m³.",
+                    "answer": L * B * H,
+                    "unit": "m³",
+                    "tolerance": 0.001,
+                })
+            else:
+                qty = rnd.choice([20, 25, 30, 40, 50])
+                waste = rnd.choice([10, 12, 15])
+                tasks.append({
+                    "topic": "Prosent",
+                    "prompt": f"Du trenger {qty} stk. Legg til {waste}% svinn. Hvor mange bør du bestille? (avrund opp til helt tall)",
+                    "answer": math.ceil(qty * (100 + waste) / 100),
+                    "unit": "stk",
+                    "tolerance": 0.0,
+                    "integer": True
+                })
+
+    # nivå 3: diagonal + fall
+    else:
+        for _ in range(5):
+            t = rnd.choice(["diag", "slope"])
+            if t == "diag":
+                a = rnd.choice([1.2, 1.5, 2.0, 2.5, 3.0])
+                b = rnd.choice([1.6, 2.0, 2.4, 3.2, 4.0])
+                tasks.append({
+                    "topic": "Diagonal",
+                    "prompt": f"En rektangulær ramme har sider a={a} m og b={b} m. Finn diagonal c i meter (2 desimaler).",
+                    "answer": math.sqrt(a*a + b*b),
+                    "unit": "m",
+                    "tolerance": 0.02,
+                })
+            else:
+                fall_m = rnd.choice([0.04, 0.06, 0.08, 0.1])
+                lengde_m = rnd.choice([2.0, 3.0, 4.0, 5.0])
+                tasks.append({
+                    "topic": "Fall",
+                    "prompt": f"Det er fall {fall_m} m over lengde {lengde_m} m. Finn fall i % (2 desimaler).",
+                    "answer": (fall_m/lengde_m)*100,
+                    "unit": "%",
+                    "tolerance": 0.05,
+                })
+
+    return tasks
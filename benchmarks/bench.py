@@ -0,0 +1,277 @@
+"""
+Ytelsesmålinger for de rene, varme kodebanene i Byggmatte.
+
+    python benchmarks/bench.py                      # kjør alt, sammenlign med baseline.json
+    python benchmarks/bench.py -k progress          # bare målinger med "progress" i navnet
+    python benchmarks/bench.py --save-baseline      # lagre denne kjøringen som ny baseline
+    python benchmarks/bench.py --threshold 0.5      # tillat 50 % tregere p50 før det feiler
+
+Hver måling kjøres i `--repeat` runder etter oppvarming. En runde tar tiden på en batch
+av kall, og tiden per kall blir én prøve. Søppeltømmingen er slått av mens det måles,
+som i timeit. Rapporten viser p50/p90/p99 og min i mikrosekunder per kall.
+
+Kjøringen feiler med exit-kode 1 hvis p50 for en måling er mer enn threshold over
+baseline. En måling som ser ut til å ha blitt tregere, måles på nytt (--retries) før den
+regnes som regresjon, så et kort støt av annen last på maskinen ikke gir falsk alarm.
+
+baseline.json gjelder maskinen den ble laget på. Lag en ny med --save-baseline på maskinen
+som skal sammenligne (f.eks. CI) før ytelsesarbeid.
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("BYGGMATTE_PROGRESS_MODE", "json")
+
+import progress_store  # noqa: E402
+from answers import check_answer  # noqa: E402
+from arena_questions import generate_question, question_set  # noqa: E402
+from curriculum import LEVEL_NUMBERS, QUESTIONS_PER_TOPIC, TOPIC_KEYS  # noqa: E402
+from images import ASSET_DIR, image_bytes  # noqa: E402
+from units import AREA_UNITS, LENGTH_UNITS, area_to_m2, fmt, from_m, to_m  # noqa: E402
+from vty_tasks import _task_source, vty_tasks  # noqa: E402
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25  # 25 % tregere p50 enn baseline = regresjon
+PROGRESS_SIZES = (100, 1_000, 10_000)
+
+DISK_THRESHOLD = 1.0  # skriving til disk varierer mye mer enn ren Python-kode
+
+BENCHMARKS = []  # (navn, lag_funksjon, kall per runde, maks runder, egen terskel)
+
+
+def benchmark(name: str, number: int = 1, max_repeat: int | None = None, threshold: float | None = None):
+    """
+    Registrer en måling. Funksjonen lager og returnerer det som skal kalles (oppsett utenfor
+    tiden). max_repeat begrenser antall runder for målinger som tar over et halvt sekund, og
+    threshold gir målingen en videre terskel enn --threshold.
+    """
+    def register(make):
+        BENCHMARKS.append((name, make, number, max_repeat, threshold))
+        return make
+    return register
+
+
+# ============================================================
+# Målingene
+# ============================================================
+_ALL_PAIRS = [(topic, level) for topic in TOPIC_KEYS for level in LEVEL_NUMBERS]
+
+
+@benchmark("generate_question/alle tema og nivå (varm cache)", number=10)
+def _generate_warm():
+    for topic, level in _ALL_PAIRS:
+        question_set("bench", topic, level)
+
+    def run():
+        for topic, level in _ALL_PAIRS:
+            for qn in range(QUESTIONS_PER_TOPIC):
+                generate_question("bench", topic, level, qn)
+    return run
+
+
+@benchmark("generate_question/alle tema og nivå (kald cache)", number=1)
+def _generate_cold():
+    def run():
+        question_set.cache_clear()
+        for topic, level in _ALL_PAIRS:
+            for qn in range(QUESTIONS_PER_TOPIC):
+                generate_question("bench", topic, level, qn)
+    return run
+
+
+_ANSWERS = [
+    ("12", {"answer": 12.0, "tol": 0.01}),
+    ("16,63", {"answer": 16.632, "tol": 0.05, "unit": "m²"}),
+    ("16,63 m²", {"answer": 16.632, "tol": 0.05, "unit": "m²"}),
+    ("13 cm", {"answer": 130.0, "tol": 1.0, "unit": "mm"}),
+    ("1 200 kr", {"answer": 1200.0, "tol": 1.0, "unit": "kr"}),
+    ("3,6*4,2", {"answer": 15.12, "tol": 0.02, "unit": "m²"}),
+    ("sqrt(3^2+4^2)", {"answer": 5.0, "tol": 0.01, "unit": "m"}),
+    ("tull", {"answer": 1.0, "tol": 0.0}),
+]
+
+
+@benchmark("check_answer/blandede svar", number=500)
+def _check_answer():
+    def run():
+        for text, q in _ANSWERS:
+            check_answer(text, q)
+    return run
+
+
+@benchmark("units/to_m + from_m + area_to_m2", number=20_000)
+def _conversions():
+    def run():
+        for u in LENGTH_UNITS:
+            from_m(to_m(2.4, u), u)
+        for u in AREA_UNITS:
+            area_to_m2(12.5, u)
+    return run
+
+
+_FMT_VALUES = [0.0, 0.001234, 2.4, 12.5, 999.99, 1234.5, 98765.4321, -3.5]
+
+
+@benchmark("units/fmt", number=5_000)
+def _fmt():
+    def run():
+        for x in _FMT_VALUES:
+            fmt(x)
+    return run
+
+
+@benchmark("images/alle illustrasjoner (varm cache)", number=200)
+def _images():
+    paths = sorted(ASSET_DIR.glob("*.png"))
+
+    def run():
+        for p in paths:
+            image_bytes(p)
+    return run
+
+
+def synthetic_db(n: int) -> dict:
+    """n elever med progresjon på et par nivåer, omtrent som i en ekte progress.json."""
+    db = {}
+    for i in range(n):
+        rec = progress_store.new_student_record(f"elev{i:05d}")
+        rec["class_name"] = f"VG1BA-{i % 12}"
+        rec["global_level"] = 1 + i % 7
+        for topic in TOPIC_KEYS[: 1 + i % len(TOPIC_KEYS)]:
+            for level in (1, 2):
+                progress_store.ensure_topic_level_state(rec, topic, level)
+                rec["topics"][topic]["levels"][str(level)].update(answered=10, correct=i % 11, total_answered=10)
+        db[rec["student_id"]] = rec
+    return db
+
+
+def _progress_benchmarks():
+    for n in PROGRESS_SIZES:
+        number = max(1, 1000 // n)
+        max_repeat = 11 if n >= 10_000 else None
+
+        @benchmark(f"progress/load_progress_db ({n} elever)", number=number, max_repeat=max_repeat)
+        def _load(n=n):
+            progress_store.save_progress_db(synthetic_db(n))
+            return progress_store.load_progress_db
+
+        @benchmark(f"progress/save_progress_db ({n} elever)", number=number, max_repeat=max_repeat,
+                   threshold=DISK_THRESHOLD)
+        def _save(n=n):
+            db = synthetic_db(n)
+            return lambda: progress_store.save_progress_db(db)
+
+
+_progress_benchmarks()
+
+
+@benchmark("vty_tasks/bygg oppgavebanken (NO + EN)", number=20)
+def _vty_build():
+    def run():
+        for language in ("NO", "EN"):
+            _task_source(language)
+    return run
+
+
+@benchmark("vty_tasks/oppslag (varm cache)", number=20_000)
+def _vty_warm():
+    def run():
+        vty_tasks("NO")
+        vty_tasks("EN")
+    return run
+
+
+# ============================================================
+# Kjøring og rapport
+# ============================================================
+def measure(make, number: int, repeat: int, warmup: int) -> list:
+    """Tid per kall i mikrosekunder, én prøve per runde."""
+    fn = make()
+    for _ in range(warmup):
+        fn()
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter_ns()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter_ns() - t0) / number / 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+def summarize(samples: list) -> dict:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive") if len(samples) > 1 else samples * 99
+    return {"p50": statistics.median(samples), "p90": cuts[89], "p99": cuts[98], "min": min(samples),
+            "n": len(samples)}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Ytelsesmålinger for Byggmatte.")
+    ap.add_argument("-k", dest="pattern", default="", help="bare målinger som inneholder teksten")
+    ap.add_argument("--repeat", type=int, default=30, help="antall runder per måling")
+    ap.add_argument("--warmup", type=int, default=3)
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                    help="tillatt økning i p50 før det regnes som regresjon (0.25 = 25 %%)")
+    ap.add_argument("--retries", type=int, default=1, help="nye forsøk før en treg måling regnes som regresjon")
+    ap.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    ap.add_argument("--save-baseline", action="store_true", help="skriv resultatet som ny baseline")
+    ap.add_argument("--json", type=Path, help="skriv alle resultatene til en JSON-fil")
+    args = ap.parse_args()
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    results, regressions = {}, []
+    with tempfile.TemporaryDirectory() as tmp:
+        # progress-målingene skal aldri røre data/ i repoet
+        progress_store.PROGRESS_FILE = Path(tmp) / "progress.json"
+        progress_store.PROGRESS_LOG_FILE = Path(tmp) / "progress.log.jsonl"
+
+        print(f"{'måling':58} {'p50':>10} {'p90':>10} {'p99':>10} {'min':>10} {'baseline':>10}")
+        for name, make, number, max_repeat, threshold in BENCHMARKS:
+            if args.pattern not in name:
+                continue
+            repeat, warmup = (min(args.repeat, max_repeat), 1) if max_repeat else (args.repeat, args.warmup)
+            base = baseline.get(name, {}).get("p50")
+            threshold = max(args.threshold, threshold) if threshold else args.threshold
+            limit = base * (1 + threshold) if base else float("inf")
+            stats = summarize(measure(make, number, repeat, warmup))
+            for _ in range(args.retries):
+                if stats["p50"] <= limit:
+                    break
+                stats = min(stats, summarize(measure(make, number, repeat, warmup)), key=lambda s: s["p50"])
+            results[name] = stats
+            flag = ""
+            if stats["p50"] > limit:
+                regressions.append(name)
+                flag = f"  REGRESJON +{stats['p50'] / base - 1:.0%}"
+            print(f"{name:58} {stats['p50']:10.2f} {stats['p90']:10.2f} {stats['p99']:10.2f} {stats['min']:10.2f} "
+                  f"{(f'{base:.2f}' if base else '–'):>10}{flag}", flush=True)
+
+    print("(mikrosekunder per kall)")
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({**baseline, **results}, ensure_ascii=False, indent=2) + "\n",
+                                 encoding="utf-8")
+        print(f"Baseline lagret i {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} måling(er) er tregere enn baseline utover terskelen: {', '.join(regressions)}",
+              file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Kommandolinjeverktøy for Byggmatte (drift av progresjonslagringen, import/eksport).
+
+    python byggmatte_cli.py maintain                    # én kjøring
+    python byggmatte_cli.py maintain --max-age-days 300 --keep 30
+    python byggmatte_cli.py maintain --every 24         # kjør hvert døgn til den stoppes
+
+    python byggmatte_cli.py import elever.csv           # elevliste eller progresjon (CSV/JSONL)
+    python byggmatte_cli.py export skole.jsonl
+    python byggmatte_cli.py export - --class VG1BA-1 --format csv
+
+    python byggmatte_cli.py worksheets --level 5 --class VG1BA-1   # arbeidsark + fasit (HTML/zip)
+
+    python byggmatte_cli.py grade svar.csv --out resultat.csv     # rett en papirprøve
+    python byggmatte_cli.py grade svar.csv --dry-run --out -      # bare vis resultatet
+
+    python byggmatte_cli.py questions                  # valider alle spørsmål og skriv tabellen
+    python byggmatte_cli.py questions --check          # bare valider
+
+Vedlikehold fra cron, f.eks. hver natt kl. 03:
+    0 3 * * *  cd /sti/til/byggkalkulatoren && python byggmatte_cli.py maintain
+
+Modus og lagringssted styres av de samme miljøvariablene som appen
+(BYGGMATTE_PROGRESS_MODE, SUPABASE_URL, ...).
+"""
+import argparse
+import json
+import sys
+import time
+
+from grading import grade_file, write_results
+from progress_io import detect_format, export_records, import_records, read_records
+from question_bank import build_question_table
+from progress_store import (
+    PROGRESS_MODE,
+    RETENTION_DAYS,
+    SNAPSHOT_KEEP,
+    open_progress_backend,
+    run_maintenance,
+)
+from worksheets import export_worksheets
+
+
+def cmd_maintain(args) -> None:
+    store = open_progress_backend(args.mode)
+    while True:
+        result = run_maintenance(store, max_age_days=args.max_age_days, keep=args.keep)
+        print(json.dumps(result, ensure_ascii=False), flush=True)
+        if not args.every:
+            return
+        time.sleep(args.every * 3600)
+
+
+def cmd_import(args) -> None:
+    store = open_progress_backend(args.mode)
+    fmt = args.format or detect_format(args.file)
+    t0 = time.perf_counter()
+    errors = []
+    with open(args.file, encoding="utf-8-sig", newline="") as f:
+        n = import_records(read_records(f, fmt, errors), store)
+    for e in errors:
+        print(f"Hoppet over {e}", file=sys.stderr)
+    print(f"Importerte {n} elever på {time.perf_counter() - t0:.1f} s ({len(errors)} feil)", file=sys.stderr)
+
+
+def cmd_export(args) -> None:
+    store = open_progress_backend(args.mode)
+    fmt = args.format or detect_format(args.file)
+    t0 = time.perf_counter()
+    if args.file == "-":
+        n = export_records(sys.stdout, fmt, store, args.class_name)
+    else:
+        with open(args.file, "w", encoding="utf-8", newline="") as f:
+            n = export_records(f, fmt, store, args.class_name)
+    print(f"Eksporterte {n} elever på {time.perf_counter() - t0:.1f} s", file=sys.stderr)
+
+
+def cmd_worksheets(args) -> None:
+    store = open_progress_backend(args.mode)
+    students = [(rec["student_id"], rec.get("class_name", "")) for rec in store.iter_records(args.class_name)]
+    t0 = time.perf_counter()
+    zip_path = export_worksheets(students, args.level, args.out, include_legacy=not args.no_legacy,
+                                 workers=args.workers)
+    print(f"{len(students)} arbeidsark på {time.perf_counter() - t0:.1f} s: {zip_path}", file=sys.stderr)
+
+
+def cmd_grade(args) -> None:
+    store = None if args.dry_run else open_progress_backend(args.mode)
+    t0 = time.perf_counter()
+    with open(args.file, encoding="utf-8-sig", newline="") as f:
+        results, n = grade_file(f, args.format or detect_format(args.file), store, save=not args.dry_run)
+    if args.out == "-":
+        write_results(sys.stdout, results, "csv")
+    elif args.out:
+        with open(args.out, "w", encoding="utf-8", newline="") as f:
+            write_results(f, results, detect_format(args.out))
+    correct = sum(r["correct"] for r in results)
+    print(f"Rettet {len(results)} svar ({correct} riktige), {n} elever lagret på {time.perf_counter() - t0:.2f} s",
+          file=sys.stderr)
+
+
+def cmd_questions(args) -> None:
+    t0 = time.perf_counter()
+    summary = build_question_table(args.out, workers=args.workers, write=not args.check)
+    for p in summary["problems"]:
+        print(f"{p['topic']} nivå {p['level']}: {p['problem']} – {p['prompt']}", file=sys.stderr)
+    where = f": {summary['path']}" if summary["path"] else ""
+    print(f"{summary['questions']} spørsmål, {len(summary['problems'])} feil på {time.perf_counter() - t0:.1f} s{where}",
+          file=sys.stderr)
+    if summary["problems"]:
+        sys.exit(1)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Driftsverktøy for Byggmatte.")
+    ap.add_argument("--mode", default=PROGRESS_MODE, help="lagringsmodus (standard: BYGGMATTE_PROGRESS_MODE)")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("maintain", help="øyeblikksbilde, arkivering av gamle elever og komprimering")
+    p.add_argument("--max-age-days", type=float, default=RETENTION_DAYS,
+                   help="arkiver elever uten aktivitet på så mange dager")
+    p.add_argument("--keep", type=int, default=SNAPSHOT_KEEP, help="antall øyeblikksbilder som beholdes")
+    p.add_argument("--every", type=float, default=0, help="gjenta hver N. time (0 = kjør én gang)")
+    p.set_defaults(func=cmd_maintain)
+
+    p = sub.add_parser("import", help="les elevliste/progresjon fra CSV eller JSON Lines")
+    p.add_argument("file")
+    p.add_argument("--format", choices=("csv", "jsonl"), help="standard: ut fra filendelsen")
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("export", help="skriv progresjon til CSV eller JSON Lines ('-' = stdout)")
+    p.add_argument("file")
+    p.add_argument("--class", dest="class_name", default="", help="bare én klasse")
+    p.add_argument("--format", choices=("csv", "jsonl"), help="standard: ut fra filendelsen")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("worksheets", help="arbeidsark per elev og samlet fasit (HTML, zip)")
+    p.add_argument("--level", type=int, required=True)
+    p.add_argument("--class", dest="class_name", default="", help="bare én klasse")
+    p.add_argument("--out", help="mappe (standard: data/worksheets/<tidspunkt>)")
+    p.add_argument("--no-legacy", action="store_true", help="uten det faste øvingssettet")
+    p.add_argument("--workers", type=int, help="antall prosesser (standard: antall CPU-er)")
+    p.set_defaults(func=cmd_worksheets)
+
+    p = sub.add_parser("grade", help="rett svar fra papirprøver (student_id, topic, level, qn, answer)")
+    p.add_argument("file")
+    p.add_argument("--format", choices=("csv", "jsonl"), help="standard: ut fra filendelsen")
+    p.add_argument("--out", help="skriv resultatet per oppgave til fil ('-' = stdout, CSV)")
+    p.add_argument("--dry-run", action="store_true", help="rett, men ikke lagre progresjonen")
+    p.set_defaults(func=cmd_grade)
+
+    p = sub.add_parser("questions", help="valider hele spørsmålsrommet og skriv en forhåndsberegnet tabell")
+    p.add_argument("--out", help="mappe (standard: data/question_table)")
+    p.add_argument("--check", action="store_true", help="bare valider, ikke skriv tabellen")
+    p.add_argument("--workers", type=int, help="antall prosesser (standard: antall CPU-er)")
+    p.set_defaults(func=cmd_questions)
+
+    args = ap.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Nivåer og tema i Læringsarena. Delt mellom appen, lagringen og verktøyene.
+"""
+
+LEVELS = [
+    (1, "7. trinn", "Grade 7"),
+    (2, "8. trinn", "Grade 8"),
+    (3, "9. trinn", "Grade 9"),
+    (4, "10. trinn", "Grade 10"),
+    (5, "VG1 (grunnnivå)", "VG1 (foundation)"),
+    (6, "VG2 (videre)", "VG2 (intermediate)"),
+    (7, "VG3 (lærling-nivå)", "VG3 (apprentice level)"),
+]
+
+REQUIRED_TOPICS_PER_LEVEL = 3  # må bestå 3 tema i nivået for å låse opp neste
+
+TOPICS = [
+    ("areal", "Areal", "Area"),
+    ("omkrets", "Omkrets", "Perimeter"),
+    ("vinkler", "Vinkler", "Angles"),
+    ("enheter", "Enhetsomregning", "Unit conversion"),
+    ("volum", "Volum", "Volume"),
+    ("diagonal", "Diagonal", "Diagonal"),
+    ("fall", "Fall", "Slope"),
+    ("prosent", "Prosent", "Percent"),
+]
+
+TOPIC_KEYS = tuple(k for k, _, _ in TOPICS)
+LEVEL_NUMBERS = tuple(lv for lv, _, _ in LEVELS)
+QUESTIONS_PER_TOPIC = 10
+PASS_CORRECT = 8  # riktige av QUESTIONS_PER_TOPIC for å bestå et tema
@@ -0,0 +1,137 @@
+"""
+Retting av papirprøver for en hel klasse på én gang.
+
+Inndata er CSV eller JSON Lines med én rad per svar: student_id, topic, level, qn og
+answer, der qn er oppgavenummeret 1–10 slik det står på arbeidsarket (worksheets.py).
+Fasiten regenereres med question_set(), svarene tolkes med answer_value() (tall,
+regnestykke, enhet), og toleransesjekken gjøres for alle radene samlet med NumPy.
+
+Hver elev/tema/nivå regnes som én runde: answered og correct settes til prøveresultatet,
+totalene øker, og temaet er bestått ved PASS_CORRECT av QUESTIONS_PER_TOPIC. Alle radene
+valideres før noe lagres, og elevene skrives med ett put_many (én transaksjon i SQLite,
+ett upsert-kall i Supabase).
+"""
+import csv
+import json
+import time
+
+import numpy as np
+
+from answers import answer_value
+from arena_questions import question_set
+from curriculum import LEVEL_NUMBERS, PASS_CORRECT, QUESTIONS_PER_TOPIC, TOPIC_KEYS
+from progress_io import csv_dicts
+from progress_store import ProgressBackend, default_backend, ensure_topic_level_state, new_student_record
+
+GRADE_FIELDS = ("student_id", "topic", "level", "qn", "answer")
+RESULT_FIELDS = GRADE_FIELDS + ("expected", "unit", "value", "correct")
+
+# Overskrifter fra lærerens eget regneark
+_GRADE_ALIASES = {
+    "elev-id": "student_id", "elevid": "student_id", "elev": "student_id",
+    "tema": "topic", "nivå": "level", "nivaa": "level",
+    "nr": "qn", "oppgave": "qn", "svar": "answer",
+}
+
+
+# ============================================================
+# Lesing
+# ============================================================
+def _answer_row(n: int, row: dict) -> tuple:
+    """(student_id, topic, level, qn, answer) fra én rad; ugyldige rader gir ValueError."""
+    sid = str(row.get("student_id") or "").strip()
+    topic = str(row.get("topic") or "").strip().lower()
+    if not sid:
+        raise ValueError(f"rad {n}: mangler student_id")
+    if topic not in TOPIC_KEYS:
+        raise ValueError(f"rad {n}: ukjent tema {topic!r}")
+    try:
+        level, qn = int(row.get("level")), int(row.get("qn"))
+    except (TypeError, ValueError):
+        raise ValueError(f"rad {n}: level og qn må være heltall") from None
+    if level not in LEVEL_NUMBERS or not 1 <= qn <= QUESTIONS_PER_TOPIC:
+        raise ValueError(f"rad {n}: nivå {level} / oppgave {qn} finnes ikke")
+    return sid, topic, level, qn, str(row.get("answer") or "")
+
+
+def read_answer_rows(f, fmt: str) -> list:
+    """Alle svarradene i filen, validert (filen er en prøve, ikke en hel skole)."""
+    if fmt == "csv":
+        rows = csv_dicts(f, _GRADE_ALIASES, required=("student_id", "topic", "level", "qn"))
+    else:
+        rows = (json.loads(line) for line in f if line.strip())
+    return [_answer_row(n, row) for n, row in enumerate(rows, 1)]
+
+
+# ============================================================
+# Retting
+# ============================================================
+def grade_rows(rows) -> list:
+    """Rett svarradene; én resultat-dict per oppgave (står en oppgave flere ganger, gjelder siste)."""
+    rows = list({row[:4]: row for row in rows}.values())
+    questions = [question_set(sid, topic, level)[qn - 1] for sid, topic, level, qn, _ in rows]
+    n = len(rows)
+    values = np.array([answer_value(row[4], q["unit"]) for row, q in zip(rows, questions)], dtype=float)  # None -> nan
+    expected = np.fromiter((q["answer"] for q in questions), float, n)
+    tol = np.fromiter((q["tol"] for q in questions), float, n)
+    integer = np.fromiter((q.get("integer", False) for q in questions), bool, n)
+    values = np.where(integer, np.trunc(values), values)
+    correct = np.abs(values - expected) <= tol  # nan (ugyldig svar) blir False
+    return [
+        dict(zip(RESULT_FIELDS, (*row, q["answer"], q["unit"], None if np.isnan(v) else float(v), bool(ok))))
+        for row, q, v, ok in zip(rows, questions, values.tolist(), correct.tolist())
+    ]
+
+
+def apply_results(results, store: ProgressBackend | None = None) -> int:
+    """Lagre resultatene som én runde per elev/tema/nivå. Returnerer antall elever skrevet."""
+    store = store or default_backend()
+    rounds = {}
+    for r in results:
+        key = (r["student_id"], r["topic"], r["level"])
+        answered, correct = rounds.get(key, (0, 0))
+        rounds[key] = (answered + 1, correct + r["correct"])
+    if not rounds:
+        return 0
+
+    records = store.get_many({sid for sid, _, _ in rounds})
+    now = time.time()
+    for (sid, topic, level), (answered, correct) in rounds.items():
+        rec = records.setdefault(sid, new_student_record(sid))
+        ensure_topic_level_state(rec, topic, level)
+        t = rec["topics"][topic]["levels"][str(level)]
+        passed = answered >= QUESTIONS_PER_TOPIC and correct >= PASS_CORRECT
+        t.update(
+            q_index=min(QUESTIONS_PER_TOPIC - 1, answered),
+            answered=answered,
+            correct=correct,
+            total_answered=int(t.get("total_answered", 0)) + answered,
+            total_correct=int(t.get("total_correct", 0)) + correct,
+            passed=bool(t.get("passed")) or passed,
+        )
+        if passed:
+            comp = rec.setdefault("completed_topics", {}).setdefault(str(level), [])
+            if topic not in comp:
+                comp.append(topic)
+        rec["updated_at"] = now
+
+    touched = {sid for sid, _, _ in rounds}
+    store.put_many([rec for sid, rec in records.items() if sid in touched])
+    store.flush()
+    return len(touched)
+
+
+def write_results(out, results, fmt: str = "csv") -> None:
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+        return
+    for r in results:
+        out.write(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def grade_file(f, fmt: str, store: ProgressBackend | None = None, save: bool = True) -> tuple:
+    """Les, rett og (med save) lagre en svarfil. Returnerer (resultater, antall elever lagret)."""
+    results = grade_rows(read_answer_rows(f, fmt))
+    return results, (apply_results(results, store) if save else 0)
@@ -0,0 +1,50 @@
+"""
+Logo og illustrasjoner, ferdig skalert og komprimert.
+
+st.image() med en filsti leser filen ved hver kjøring og skalerer den ned igjen hvis den er
+bredere enn der den vises, og et PIL-bilde kodes til PNG på nytt hver gang. Her skaleres
+hvert bilde én gang til bredden det vises i, reduseres til en palett på 256 farger
+(illustrasjonene er flate tegninger) og lagres som PNG-bytes i en LRU i prosessen, med
+(sti, mtime, størrelse) i nøkkelen. Alle økter får de samme bytene, så Streamlit gir dem
+samme medie-URL, og nettleseren henter hvert bilde bare én gang.
+
+PNG og ikke WebP: st.image() koder alt annet enn PNG/JPEG/GIF om igjen ved hvert kall.
+Med output_format="PNG" og et bilde som allerede har riktig bredde, leser Streamlit bare
+filhodet og sender bytene videre som de er.
+"""
+import io
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image
+
+ASSET_DIR = Path(__file__).parent / "assets"
+IMAGE_CACHE_SIZE = 64
+MAX_IMAGE_WIDTH = 1460  # Streamlits grense for bilder i full kolonnebredde (2 × 730 px)
+PALETTE_COLORS = 256
+
+
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def _encoded(path: str, width: int, mtime_ns: int, size: int) -> bytes:
+    """Skalert palett-PNG. mtime_ns og size er bare med i nøkkelen, så en endret fil lages på nytt."""
+    with Image.open(path) as im:
+        if im.width > width:
+            im = im.resize((width, max(1, round(im.height * width / im.width))), Image.LANCZOS)
+        im = im.convert("RGBA").quantize(PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+    out = io.BytesIO()
+    im.save(out, format="PNG", optimize=True)
+    return out.getvalue()
+
+
+def image_bytes(path, width: int = MAX_IMAGE_WIDTH) -> bytes | None:
+    """PNG-bytes for bildet, høyst width piksler bredt. None hvis filen mangler, er tom eller ikke er et bilde."""
+    try:
+        info = Path(path).stat()
+    except OSError:
+        return None
+    if info.st_size == 0:
+        return None
+    try:
+        return _encoded(str(path), width, info.st_mtime_ns, info.st_size)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,195 @@
+"""
+Lokal stand-in for Supabase/PostgREST, for utvikling og testing av supabase-modusen
+uten nettverk eller Supabase-konto. Holder tabellene i minnet.
+
+Støtter det progress_store bruker: select, filtre (eq/neq/lt/lte/gt/gte/in), order,
+offset/limit, upsert med on_conflict og delete.
+
+    python postgrest_standin.py --port 54321
+    BYGGMATTE_PROGRESS_MODE=supabase SUPABASE_URL=http://127.0.0.1:54321 \\
+        SUPABASE_KEY=dev streamlit run streamlit_app.py
+"""
+import argparse
+import csv
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+_OPS = {
+    "eq": lambda a, b: a == b,
+    "neq": lambda a, b: a != b,
+    "lt": lambda a, b: a < b,
+    "lte": lambda a, b: a <= b,
+    "gt": lambda a, b: a > b,
+    "gte": lambda a, b: a >= b,
+    "in": lambda a, b: a in b,
+}
+_RESERVED = {"select", "order", "offset", "limit", "on_conflict", "columns"}
+
+
+def _coerce(raw: str, current):
+    """Filterverdier kommer som tekst; sammenlign med samme type som kolonnen."""
+    if raw.startswith("(") and raw.endswith(")"):
+        # in.(a,b,"c,d")
+        return {_coerce(v, current) for v in next(csv.reader([raw[1:-1]]))}
+    if isinstance(current, bool):
+        return raw == "true"
+    if isinstance(current, (int, float)):
+        try:
+            return type(current)(float(raw)) if isinstance(current, int) else float(raw)
+        except ValueError:
+            return raw
+    return raw
+
+
+class PostgrestStandin:
+    def __init__(self):
+        self.tables = {}  # tabell -> liste med rader
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def _match(self, row: dict, filters: list) -> bool:
+        for col, op, raw in filters:
+            if col not in row:
+                return False
+            try:
+                if not _OPS[op](row[col], _coerce(raw, row[col])):
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    @staticmethod
+    def _parse(query: str):
+        params, filters = {}, []
+        for key, value in parse_qsl(query, keep_blank_values=True):
+            if key in _RESERVED:
+                params[key] = value
+                continue
+            op, _, raw = value.partition(".")
+            if op in _OPS:
+                filters.append((key, op, raw))
+        return params, filters
+
+    def select(self, table: str, query: str) -> list:
+        params, filters = self._parse(query)
+        with self.lock:
+            rows = [r for r in self.tables.get(table, []) if self._match(r, filters)]
+        for part in reversed([p for p in params.get("order", "").split(",") if p]):
+            col, _, direction = part.partition(".")
+            rows.sort(key=lambda r: r.get(col), reverse=direction.startswith("desc"))
+        offset = int(params.get("offset", 0) or 0)
+        rows = rows[offset:]
+        if params.get("limit"):
+            rows = rows[:int(params["limit"])]
+        cols = params.get("select", "*")
+        if cols and cols != "*":
+            keep = [c.strip() for c in cols.split(",")]
+            rows = [{c: r.get(c) for c in keep} for r in rows]
+        return rows
+
+    def upsert(self, table: str, query: str, body) -> list:
+        params, _ = self._parse(query)
+        keys = [k for k in params.get("on_conflict", "").split(",") if k]
+        rows = body if isinstance(body, list) else [body]
+        with self.lock:
+            data = self.tables.setdefault(table, [])
+            if not keys:
+                data.extend(dict(r) for r in rows)
+                return rows
+            pos = {tuple(r.get(k) for k in keys): i for i, r in enumerate(data)}
+            for r in rows:
+                key = tuple(r.get(k) for k in keys)
+                if key in pos:
+                    data[pos[key]] = {**data[pos[key]], **r}
+                else:
+                    pos[key] = len(data)
+                    data.append(dict(r))
+        return rows
+
+    def delete(self, table: str, query: str) -> list:
+        _, filters = self._parse(query)
+        with self.lock:
+            data = self.tables.get(table, [])
+            gone = [r for r in data if self._match(r, filters)]
+            self.tables[table] = [r for r in data if not self._match(r, filters)]
+        return gone
+
+
+def make_handler(db: PostgrestStandin):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _table(self):
+            parts = urlsplit(self.path)
+            prefix = "/rest/v1/"
+            if not parts.path.startswith(prefix):
+                return None, parts.query
+            return parts.path[len(prefix):].strip("/"), parts.query
+
+        def _reply(self, status: int, rows=None):
+            prefer = self.headers.get("Prefer", "")
+            body = b"" if rows is None or "return=minimal" in prefer else json.dumps(rows).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self):
+            n = int(self.headers.get("Content-Length", 0) or 0)
+            return json.loads(self.rfile.read(n) or b"null")
+
+        def do_GET(self):
+            db.requests += 1
+            table, query = self._table()
+            if table is None:
+                return self._reply(404, [])
+            self._reply(200, db.select(table, query))
+
+        def do_POST(self):
+            db.requests += 1
+            table, query = self._table()
+            if table is None:
+                return self._reply(404, [])
+            self._reply(201, db.upsert(table, query, self._body()))
+
+        def do_DELETE(self):
+            db.requests += 1
+            self._body()  # klienten kan sende en (tom) body; les den så tilkoblingen kan gjenbrukes
+            table, query = self._table()
+            if table is None:
+                return self._reply(404, [])
+            self._reply(200, db.delete(table, query))
+
+    return Handler
+
+
+def serve(host: str = "127.0.0.1", port: int = 54321):
+    """Start serveren i en bakgrunnstråd. Returnerer (server, standin)."""
+    db = PostgrestStandin()
+    server = ThreadingHTTPServer((host, port), make_handler(db))
+    threading.Thread(target=server.serve_forever, name="postgrest-standin", daemon=True).start()
+    return server, db
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Lokal PostgREST-stand-in for Byggmatte.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=54321)
+    args = ap.parse_args()
+    db = PostgrestStandin()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(db))
+    print(f"PostgREST stand-in på http://{args.host}:{args.port}/rest/v1/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
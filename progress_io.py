@@ -0,0 +1,291 @@
+"""
+Import og eksport av elevlister og progresjon (CSV og JSON Lines).
+
+Alt strømmes: filen leses linje for linje, og postene går gjennom progress-lagringen
+i biter på IMPORT_CHUNK elever (get_many + put_many), så minnebruken er den samme
+for én klasse som for en hel skole. Eksport leser med backend.iter_records(); i appen
+gjelder nedlastingen én klasse (export_bytes), hele skolen tas med CLI-en.
+
+Formater:
+- JSON Lines: én komplett elevpost per linje (samme form som i progress.json).
+- CSV: én rad per elev-tema-nivå (lang form), se CSV_FIELDS. En elevliste trenger
+  bare kolonnene student_id og class_name (evt. global_level); tomme celler endrer ingenting.
+  Skilletegn (komma, semikolon, tab) gjenkjennes automatisk.
+
+Importerte felt flettes inn i eksisterende elever, slik at en ny elevliste ikke
+sletter progresjon som allerede er lagret. Ugyldige celler (f.eks. Nivå = "tre") og
+linjer hoppes over og meldes i errors-listen til read_records, så en import aldri
+stopper halvveis med noen elever skrevet og andre ikke.
+"""
+import csv
+import io
+import itertools
+import json
+import time
+
+from curriculum import LEVEL_NUMBERS, TOPIC_KEYS
+from progress_store import STAT_FIELDS, ProgressBackend, default_backend, new_student_record
+
+IMPORT_CHUNK = 500  # elever per get_many/put_many
+
+CSV_FIELDS = ("student_id", "class_name", "global_level", "completed_topics", "updated_at",
+              "topic", "level") + STAT_FIELDS
+
+# Overskrifter fra lærerens eget regneark
+_CSV_ALIASES = {
+    "elev-id": "student_id", "elevid": "student_id", "elev": "student_id",
+    "klasse": "class_name", "nivå": "global_level", "nivaa": "global_level",
+}
+
+
+def detect_format(filename: str) -> str:
+    return "csv" if filename.lower().endswith((".csv", ".txt")) else "jsonl"
+
+
+# ============================================================
+# Fletting
+# ============================================================
+def merge_record(base: dict, patch: dict) -> dict:
+    """Legg feltene fra patch oppå base (per tema/nivå og per nivå i completed_topics)."""
+    rec = dict(base)
+    if "class_name" in patch:
+        rec["class_name"] = patch["class_name"] or ""
+    if "global_level" in patch:
+        rec["global_level"] = int(patch["global_level"])
+    if patch.get("completed_topics"):
+        rec["completed_topics"] = {**rec.get("completed_topics", {}), **patch["completed_topics"]}
+    if patch.get("topics"):
+        topics = {k: {"levels": dict(t.get("levels", {}))} for k, t in (rec.get("topics") or {}).items()}
+        for topic, t in patch["topics"].items():
+            topics.setdefault(topic, {"levels": {}})["levels"].update(t.get("levels", {}))
+        rec["topics"] = topics
+    rec["updated_at"] = float(patch.get("updated_at") or time.time())
+    return rec
+
+
+def import_records(records, store: ProgressBackend | None = None, chunk: int = IMPORT_CHUNK) -> int:
+    """Flett postene inn i lagringen, IMPORT_CHUNK elever om gangen. Returnerer antall elever skrevet."""
+    store = store or default_backend()
+    it = iter(records)
+    total = 0
+    while True:
+        batch = list(itertools.islice(it, chunk))
+        if not batch:
+            break
+        existing = store.get_many({p["student_id"] for p in batch})
+        merged = {}
+        for patch in batch:
+            sid = patch["student_id"]
+            base = merged.get(sid) or existing.get(sid) or new_student_record(sid)
+            merged[sid] = merge_record(base, patch)
+        store.put_many(list(merged.values()))
+        total += len(merged)
+    store.flush()
+    return total
+
+
+# ============================================================
+# Lesing
+# ============================================================
+def _int_or_none(value) -> int | None:
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return None
+
+
+def _copy_fields(src: dict, dst: dict, where: str, errors: list) -> None:
+    """class_name, global_level og updated_at fra src til dst; ugyldige verdier hoppes over og meldes."""
+    if "class_name" in src:
+        dst["class_name"] = src["class_name"]
+    if "global_level" in src:
+        level = _int_or_none(src["global_level"])
+        if level in LEVEL_NUMBERS:
+            dst["global_level"] = level
+        else:
+            errors.append(f"{where}: ugyldig nivå {src['global_level']!r}")
+    if src.get("updated_at"):
+        try:
+            dst["updated_at"] = float(src["updated_at"])
+        except (TypeError, ValueError):
+            errors.append(f"{where}: ugyldig updated_at {src['updated_at']!r}")
+
+
+def _stat_cell(raw: dict) -> dict | None:
+    """STAT_FIELDS fra en CSV-rad eller JSON-celle som heltall/bool. None hvis et tall ikke er et heltall."""
+    cell = {f: _int_or_none(raw.get(f) or 0) for f in STAT_FIELDS if f != "passed"}
+    if None in cell.values():
+        return None
+    passed = raw.get("passed", False)
+    cell["passed"] = passed if isinstance(passed, bool) else str(passed).strip().lower() in ("1", "true", "ja", "yes")
+    return cell
+
+
+def _json_progress(raw: dict, rec: dict) -> str | None:
+    """Sjekk topics og completed_topics fra en JSON-linje og legg dem i rec. Feilmelding, eller None."""
+    topics = raw.get("topics")
+    if topics:
+        if not isinstance(topics, dict):
+            return "topics er ikke et objekt"
+        rec["topics"] = {}
+        for topic, t in topics.items():
+            levels = t.get("levels", {}) if isinstance(t, dict) else None
+            if not isinstance(levels, dict):
+                return f"{topic} mangler levels-objekt"
+            cells = {}
+            for level, raw_cell in levels.items():
+                if _int_or_none(level) not in LEVEL_NUMBERS:
+                    return f"ugyldig nivå {level!r} for {topic}"
+                cell = _stat_cell(raw_cell) if isinstance(raw_cell, dict) else None
+                if cell is None:
+                    return f"tallene for {topic} nivå {level} er ikke heltall"
+                cells[str(int(level))] = {**raw_cell, **cell}
+            rec["topics"][topic] = {"levels": cells}
+    completed = raw.get("completed_topics")
+    if completed:
+        if not isinstance(completed, dict) or not all(
+                _int_or_none(level) in LEVEL_NUMBERS and isinstance(ts, list) and all(isinstance(x, str) for x in ts)
+                for level, ts in completed.items()):
+            return "completed_topics må ha formen {nivå: [tema, ...]}"
+        rec["completed_topics"] = {str(int(level)): list(ts) for level, ts in completed.items()}
+    return None
+
+
+def iter_jsonl(lines, errors: list):
+    for n, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            raw = json.loads(line)
+        except ValueError as e:
+            errors.append(f"linje {n}: ugyldig JSON ({e.msg})")
+            continue
+        sid = raw.get("student_id") if isinstance(raw, dict) else None
+        if not isinstance(sid, str) or not sid.strip():
+            errors.append(f"linje {n}: mangler student_id (tekst)")
+            continue
+        rec = {"student_id": sid}
+        problem = _json_progress(raw, rec)
+        if problem:
+            errors.append(f"linje {n}: {problem}")
+            continue
+        _copy_fields(raw, rec, f"linje {n}", errors)
+        yield rec
+
+
+def csv_dicts(lines, aliases: dict = _CSV_ALIASES, required=("student_id",)):
+    """CSV med overskrift -> én dict per rad (kolonnenavn via aliases, tomme celler utelatt)."""
+    lines = iter(lines)
+    header = next(lines, "").lstrip("\ufeff")
+    if not header.strip():
+        return
+    try:
+        dialect = csv.Sniffer().sniff(header, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.reader(itertools.chain([header], lines), dialect)
+    names = [aliases.get(h.strip().lower(), h.strip().lower()) for h in next(reader)]
+    missing = [name for name in required if name not in names]
+    if missing:
+        raise ValueError(f"CSV mangler kolonnen {', '.join(missing)}")
+    for row in reader:
+        yield {k: v.strip() for k, v in zip(names, row) if v.strip()}
+
+
+def iter_csv(lines, errors: list):
+    """CSV-rader gruppert på student_id (påfølgende rader) -> delvise poster."""
+    rows = ((n, r) for n, r in enumerate(csv_dicts(lines), 1) if r.get("student_id"))
+    for sid, group in itertools.groupby(rows, key=lambda nr: nr[1]["student_id"]):
+        yield _csv_record(sid, group, errors)
+
+
+def _csv_record(student_id: str, rows, errors: list) -> dict:
+    rec = {"student_id": student_id}
+    for n, row in rows:
+        _copy_fields(row, rec, f"rad {n}", errors)
+        if "completed_topics" in row:
+            rec["completed_topics"] = _parse_completed(row["completed_topics"])
+        topic, level = row.get("topic"), row.get("level")
+        if topic not in TOPIC_KEYS or not level:
+            continue
+        if _int_or_none(level) not in LEVEL_NUMBERS:
+            errors.append(f"rad {n}: ugyldig nivå {level!r} for {topic}")
+            continue
+        cell = _stat_cell(row)
+        if cell is None:
+            errors.append(f"rad {n}: tallene for {topic} nivå {level} er ikke heltall")
+            continue
+        rec.setdefault("topics", {}).setdefault(topic, {"levels": {}})["levels"][str(int(level))] = cell
+    return rec
+
+
+def _parse_completed(text: str) -> dict:
+    """'1:areal,omkrets;2:volum' -> {"1": ["areal", "omkrets"], "2": ["volum"]}"""
+    completed = {}
+    for part in text.split(";"):
+        level, _, topics = part.partition(":")
+        if level.strip():
+            completed[level.strip()] = [t.strip() for t in topics.split(",") if t.strip()]
+    return completed
+
+
+def read_records(f, fmt: str, errors: list | None = None):
+    """Delvise elevposter fra filen. Hoppede celler/linjer meldes i errors (én tekst per feil)."""
+    errors = [] if errors is None else errors
+    return iter_csv(f, errors) if fmt == "csv" else iter_jsonl(f, errors)
+
+
+# ============================================================
+# Skriving
+# ============================================================
+def csv_rows(record: dict):
+    """Lang form: første rad har elevfeltene, deretter én rad per tema/nivå."""
+    head = {
+        "student_id": record["student_id"],
+        "class_name": record.get("class_name", ""),
+        "global_level": record.get("global_level", 1),
+        "completed_topics": ";".join(f"{lv}:{','.join(ts)}" for lv, ts in record.get("completed_topics", {}).items()),
+        "updated_at": record.get("updated_at", ""),
+    }
+    cells = [(topic, level, cell)
+             for topic, t in (record.get("topics") or {}).items()
+             for level, cell in (t.get("levels") or {}).items()]
+    if not cells:
+        yield head
+        return
+    for i, (topic, level, cell) in enumerate(cells):
+        row = head if i == 0 else {"student_id": record["student_id"]}
+        row.update({"topic": topic, "level": level}, **{f: cell.get(f, 0) for f in STAT_FIELDS})
+        row["passed"] = int(bool(cell.get("passed")))
+        yield row
+
+
+def export_records(out, fmt: str = "jsonl", store: ProgressBackend | None = None, class_name: str = "") -> int:
+    """Skriv alle elever (evt. én klasse) til en åpen tekstfil. Returnerer antall elever."""
+    store = store or default_backend()
+    n = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for rec in store.iter_records(class_name):
+            writer.writerows(csv_rows(rec))
+            n += 1
+        return n
+    for rec in store.iter_records(class_name):
+        out.write(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n")
+        n += 1
+    return n
+
+
+def export_bytes(fmt: str, store: ProgressBackend | None, class_name: str) -> bytes:
+    """
+    For nedlastingsknappen i appen, én klasse om gangen: Streamlit holder hele nedlastingen
+    i minnet, så hele skolen eksporteres med `byggmatte_cli.py export`, som strømmer til fil.
+    """
+    if not class_name:
+        raise ValueError("export_bytes gjelder én klasse; bruk export_records for alle elever")
+    buf = io.BytesIO()
+    with io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True) as out:
+        export_records(out, fmt, store, class_name)
+        return buf.getvalue()
@@ -0,0 +1,1267 @@
+"""
+Lagring av elevprogresjon for Læringsarena (lokal fil i data/).
+
+Moduser (PROGRESS_MODE, kan settes med miljøvariabelen BYGGMATTE_PROGRESS_MODE):
+- "json": hele databasen skrives til progress.json ved hver lagring (opprinnelig oppførsel).
+- "log":  hver lagring av en elev legges til som én linje i progress.log.jsonl.
+          Loggen foldes jevnlig inn i et kompakt øyeblikksbilde (progress.json),
+          slik at et klikk koster en liten append uansett hvor mange elever skolen har.
+- "sqlite": progress.sqlite3 (WAL) med én rad per elev-tema-nivå og indekser på
+          student_id og class_name. En elevs rerun leser/skriver kun egne rader.
+- "sharded": én fil per klasse i data/progress/ pluss index.json (elev -> klassefil).
+          En klasse leser og skriver kun sin egen fil.
+- "supabase": tabell i Supabase/PostgREST (SUPABASE_URL / SUPABASE_KEY), én klient per prosess.
+
+Alle moduser implementerer ProgressBackend (get / put / put_many / class_records),
+og open_progress_backend() lager riktig backend for modusen. Appen holder én backend
+per server og bruker load_student_record / save_student_record / load_class_records.
+run_maintenance() tar øyeblikksbilder, arkiverer gamle elever og komprimerer lagringen
+(kjøres med `python byggmatte_cli.py maintain`).
+
+I json/log-modus er backenden en ProgressCache: en delt kopi i minnet, slik at reruns
+ikke parser filen på nytt. Med flush_interval > 0 skriver en bakgrunnstråd
+(ProgressWriter) endringene fra alle økter samlet til disk.
+"""
+import atexit
+import copy
+import gzip
+import json
+import os
+import hashlib
+import queue
+import re
+import sqlite3
+import threading
+import struct
+import time
+from array import array
+from pathlib import Path
+
+from curriculum import LEVEL_NUMBERS, TOPIC_KEYS
+
+DATA_DIR = Path(__file__).parent / "data"
+DATA_DIR.mkdir(exist_ok=True)
+PROGRESS_FILE = DATA_DIR / "progress.json"
+PROGRESS_LOG_FILE = DATA_DIR / "progress.log.jsonl"
+PROGRESS_SQLITE_FILE = DATA_DIR / "progress.sqlite3"
+PROGRESS_SHARD_DIR = DATA_DIR / "progress"
+PROGRESS_SHARD_INDEX = PROGRESS_SHARD_DIR / "index.json"
+
+PROGRESS_MODE = os.environ.get("BYGGMATTE_PROGRESS_MODE", "json")  # json / log / sqlite / sharded
+LOG_COMPACT_EVERY = 500  # antall hendelser i loggen før den foldes inn i progress.json
+PROGRESS_FLUSH_INTERVAL = float(os.environ.get("BYGGMATTE_PROGRESS_FLUSH_INTERVAL", "0.5"))  # sek, 0 = skriv med en gang
+
+_log_lock = threading.Lock()
+_log_events = None  # antall linjer i loggen (telles ved første append)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _replay_log(db: dict) -> dict:
+    """Legger hendelsene i loggen oppå øyeblikksbildet (siste hendelse per elev vinner)."""
+    if not PROGRESS_LOG_FILE.exists():
+        return db
+    with PROGRESS_LOG_FILE.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                ev = json.loads(line)
+            except ValueError:
+                continue  # halvskrevet linje etter krasj
+            rec = ev.get("record")
+            if isinstance(rec, dict) and rec.get("student_id"):
+                db[rec["student_id"]] = rec
+    return db
+
+
+def load_progress_db() -> dict:
+    db = {}
+    if PROGRESS_FILE.exists():
+        try:
+            db = json.loads(PROGRESS_FILE.read_text(encoding="utf-8"))
+        except Exception:
+            db = {}
+    try:
+        return _replay_log(db)
+    except Exception:
+        return db
+
+
+def save_progress_db(db: dict) -> None:
+    try:
+        if PROGRESS_MODE == "log":
+            compact_progress_log(db)
+        else:
+            PROGRESS_FILE.write_text(json.dumps(db, ensure_ascii=False, indent=2), encoding="utf-8")
+    except Exception:
+        pass
+
+
+def get_student_record(db: dict, student_id: str) -> dict:
+    return db.get(student_id, {
+        "student_id": student_id,
+        "class_name": "",
+        "global_level": 1,
+        "completed_topics": {},
+        "topics": {},
+        "updated_at": time.time()
+    })
+
+
+def put_student_record(db: dict, record: dict) -> None:
+    record["updated_at"] = time.time()
+    db[record["student_id"]] = record
+
+
+def new_student_record(student_id: str) -> dict:
+    return get_student_record({}, student_id)
+
+
+def ensure_topic_level_state(record: dict, topic_key: str, level: int) -> None:
+    """
+    Lagrer progresjon per tema per globalt nivå:
+    record["topics"][topic_key]["levels"][str(level)] = stats
+    """
+    topics = record.setdefault("topics", {})
+    t = topics.setdefault(topic_key, {"levels": {}})
+    levels = t.setdefault("levels", {})
+    key = str(level)
+    if key not in levels:
+        levels[key] = {
+            "q_index": 0,
+            "correct": 0,
+            "answered": 0,
+            "total_correct": 0,
+            "total_answered": 0,
+            "passed": False,
+        }
+
+
+# ============================================================
+# Lagringsgrensesnitt
+# ============================================================
+class ProgressBackend:
+    """
+    Felles grensesnitt for alle lagringsmoduser. Postene er vanlige dicts med samme
+    form som i progress.json (student_id, class_name, global_level, completed_topics,
+    topics, updated_at).
+    """
+
+    def get(self, student_id: str) -> dict:
+        """Egen kopi av én elev (ny, tom post hvis eleven ikke finnes)."""
+        raise NotImplementedError
+
+    def put(self, record: dict) -> None:
+        raise NotImplementedError
+
+    def put_many(self, records) -> None:
+        for rec in records:
+            self.put(rec)
+
+    def class_records(self, class_name: str = "") -> dict:
+        """student_id -> record for én klasse (tom klasse = alle elever). Kun for lesing."""
+        raise NotImplementedError
+
+    def load_all(self) -> dict:
+        return self.class_records("")
+
+    def get_many(self, student_ids) -> dict:
+        """student_id -> record for mange elever. Elever som ikke finnes, kan mangle i svaret."""
+        return {sid: self.get(sid) for sid in student_ids}
+
+    def iter_records(self, class_name: str = ""):
+        """Gå gjennom postene én og én (for eksport). Backends som kan, henter dem i biter."""
+        yield from self.class_records(class_name).values()
+
+    def changed(self, record: dict) -> bool:
+        """Er tellere, nivå eller klasse endret siden posten sist ble hentet/lagret her?"""
+        fps = getattr(self, "_fingerprints", None) or {}
+        return fps.get(record["student_id"]) != record_fingerprint(record)
+
+    def mark_clean(self, record: dict) -> None:
+        """Husk posten slik den ligger lagret (grunnlaget for changed())."""
+        fps = getattr(self, "_fingerprints", None)
+        if fps is None:
+            fps = self._fingerprints = {}
+        fps[record["student_id"]] = record_fingerprint(record)
+
+    def flush(self) -> None:
+        """Skriv ventende endringer (for backends som samler skrivinger)."""
+
+    def delete_many(self, student_ids) -> None:
+        """Fjern elever permanent (brukes av arkivering i run_maintenance)."""
+        raise NotImplementedError
+
+    def compact(self) -> None:
+        """Frigjør plass på disk (logg, WAL, tomme filer). Standard: ingenting å gjøre."""
+
+
+PROGRESS_BACKENDS = {}
+
+
+def register_progress_backend(name: str, factory) -> None:
+    """Registrer en lagringsmodus. factory(**options) skal returnere en ProgressBackend."""
+    PROGRESS_BACKENDS[name] = factory
+
+
+def open_progress_backend(mode: str | None = None, **options) -> ProgressBackend:
+    mode = mode or PROGRESS_MODE
+    try:
+        factory = PROGRESS_BACKENDS[mode]
+    except KeyError:
+        raise ValueError(f"Ukjent lagringsmodus: {mode!r}") from None
+    return factory(**options)
+
+
+_default_backends = {}
+_default_backends_lock = threading.Lock()
+
+
+def default_backend() -> ProgressBackend:
+    """Én backend per prosess for valgt modus (når kalleren ikke sender inn sin egen)."""
+    with _default_backends_lock:
+        backend = _default_backends.get(PROGRESS_MODE)
+        if backend is None:
+            backend = _default_backends[PROGRESS_MODE] = open_progress_backend()
+        return backend
+
+
+def load_student_record(student_id: str, store: ProgressBackend | None = None) -> dict:
+    store = store or default_backend()
+    try:
+        rec = store.get(student_id)
+    except Exception:
+        return new_student_record(student_id)
+    store.mark_clean(rec)
+    return rec
+
+
+def load_class_records(class_name: str = "", store: ProgressBackend | None = None) -> dict:
+    """student_id -> record for én klasse (tom klasse = alle elever). Kun for lesing."""
+    try:
+        return (store or default_backend()).class_records(class_name)
+    except Exception:
+        return {}
+
+
+def save_student_record(record: dict, store: ProgressBackend | None = None) -> bool:
+    """
+    Lagre én elev hvis tellere, nivå eller klasse er endret siden den ble hentet.
+    Uendrede poster skrives ikke (og får ikke ny updated_at). Returnerer True hvis lagret.
+    """
+    store = store or default_backend()
+    try:
+        if not store.changed(record):
+            return False
+        record["updated_at"] = time.time()
+        store.put(record)
+        store.mark_clean(record)
+        return True
+    except Exception:
+        return False
+
+
+def record_fingerprint(record: dict) -> bytes:
+    """Kort fingeravtrykk av posten uten updated_at."""
+    packed = CompactRecord.from_dict({**record, "updated_at": 0.0}).to_bytes()
+    return hashlib.blake2b(packed, digest_size=16).digest()
+
+
+# ============================================================
+# Kompakt elevpost (fast form)
+# ============================================================
+STAT_FIELDS = ("q_index", "correct", "answered", "total_correct", "total_answered", "passed")
+
+_N_TOPICS = len(TOPIC_KEYS)
+_N_LEVELS = len(LEVEL_NUMBERS)
+_N_STATS = len(STAT_FIELDS)
+_TOPIC_INDEX = {k: i for i, k in enumerate(TOPIC_KEYS)}
+_LEVEL_KEYS = tuple(str(lv) for lv in LEVEL_NUMBERS)
+_LEVEL_INDEX = {k: i for i, k in enumerate(_LEVEL_KEYS)}
+_RECORD_KEYS = {"student_id", "class_name", "global_level", "completed_topics", "topics", "updated_at"}
+_EMPTY_STATS = bytes(2 * _N_TOPICS * _N_LEVELS * _N_STATS)
+_EMPTY_COMPLETED = b"\xff" * (_N_LEVELS * _N_TOPICS)
+_HEADER = struct.Struct("<BdQBHHH")  # type, updated_at, present, completed_present, global_level, len(id), len(klasse)
+
+
+class CompactRecord:
+    """
+    Elevpost med fast form. Tellerne ligger i én array('H') med 8 tema × 7 nivå × 6 felt
+    (STAT_FIELDS) i stedet for 56 små dicts. `present` er en bitmaske over hvilke
+    tema/nivå som finnes, `completed` holder beståtte tema per nivå i rekkefølge
+    (temaindeks, 0xFF = tom) og `completed_present` hvilke nivå som har en liste.
+
+    Poster som ikke passer i den faste formen (ukjente tema, ekstra felt, tall over
+    65535) beholdes uendret i `raw`, så from_dict(rec).to_dict() == rec alltid gjelder.
+    """
+
+    __slots__ = ("student_id", "class_name", "global_level", "updated_at",
+                 "present", "completed_present", "stats", "completed", "raw")
+
+    @classmethod
+    def from_dict(cls, rec: dict) -> "CompactRecord":
+        self = cls.__new__(cls)
+        self.student_id = rec.get("student_id", "")
+        self.class_name = rec.get("class_name", "")
+        self.global_level = rec.get("global_level", 1)
+        self.updated_at = rec.get("updated_at", 0.0)
+        self.raw = None
+        try:
+            self._pack(rec)
+        except (ValueError, TypeError, AttributeError, OverflowError):
+            self.present = self.completed_present = 0
+            self.stats = self.completed = None
+            self.raw = copy.deepcopy(rec)
+        return self
+
+    def _pack(self, rec: dict) -> None:
+        if rec.keys() != _RECORD_KEYS or not isinstance(self.student_id, str) \
+                or not isinstance(self.class_name, str) or type(self.global_level) is not int \
+                or not 0 <= self.global_level <= 0xFFFF or not isinstance(self.updated_at, (int, float)):
+            raise ValueError("utenfor fast form")
+        stats = array("H", _EMPTY_STATS)
+        present = 0
+        for topic, t in rec["topics"].items():
+            ti = _TOPIC_INDEX.get(topic)
+            if ti is None or t.keys() != {"levels"}:
+                raise ValueError(topic)
+            for level, cell in t["levels"].items():
+                li = _LEVEL_INDEX.get(level)
+                if li is None or len(cell) != _N_STATS or type(cell.get("passed")) is not bool:
+                    raise ValueError(level)
+                pos = ti * _N_LEVELS + li
+                base = pos * _N_STATS
+                for j, field in enumerate(STAT_FIELDS):
+                    v = cell[field]
+                    if field != "passed" and type(v) is not int:
+                        raise TypeError(field)
+                    stats[base + j] = v  # OverflowError utenfor 0..65535
+                present |= 1 << pos
+        completed = bytearray(_EMPTY_COMPLETED)
+        completed_present = 0
+        for level, topics in rec["completed_topics"].items():
+            li = _LEVEL_INDEX.get(level)
+            if li is None or not isinstance(topics, list) or len(topics) > _N_TOPICS or len(set(topics)) != len(topics):
+                raise ValueError(level)
+            for j, topic in enumerate(topics):
+                ti = _TOPIC_INDEX.get(topic)
+                if ti is None:
+                    raise ValueError(topic)
+                completed[li * _N_TOPICS + j] = ti
+            completed_present |= 1 << li
+        self.stats = stats
+        self.present = present
+        self.completed = bytes(completed)
+        self.completed_present = completed_present
+
+    def to_dict(self) -> dict:
+        if self.raw is not None:
+            return copy.deepcopy(self.raw)
+        stats = self.stats
+        topics = {}
+        present = self.present
+        for ti, topic in enumerate(TOPIC_KEYS):
+            row = present >> (ti * _N_LEVELS)
+            if not row & 0x7F:
+                continue
+            levels = {}
+            for li, level in enumerate(_LEVEL_KEYS):
+                if row >> li & 1:
+                    b = ((ti * _N_LEVELS) + li) * _N_STATS
+                    levels[level] = {
+                        "q_index": stats[b], "correct": stats[b + 1], "answered": stats[b + 2],
+                        "total_correct": stats[b + 3], "total_answered": stats[b + 4],
+                        "passed": bool(stats[b + 5]),
+                    }
+            topics[topic] = {"levels": levels}
+        completed = {}
+        for li, level in enumerate(_LEVEL_KEYS):
+            if self.completed_present >> li & 1:
+                row = self.completed[li * _N_TOPICS:(li + 1) * _N_TOPICS]
+                completed[level] = [TOPIC_KEYS[i] for i in row if i != 0xFF]
+        return {
+            "student_id": self.student_id,
+            "class_name": self.class_name,
+            "global_level": self.global_level,
+            "completed_topics": completed,
+            "topics": topics,
+            "updated_at": self.updated_at,
+        }
+
+    def to_bytes(self) -> bytes:
+        """Binær form: fast hode + id/klasse + 672 byte tellere + 56 byte beståtte tema."""
+        if self.raw is not None:
+            return b"\x01" + json.dumps(self.raw, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        sid = self.student_id.encode("utf-8")
+        cls = self.class_name.encode("utf-8")
+        return b"".join((
+            _HEADER.pack(0, self.updated_at, self.present, self.completed_present,
+                         self.global_level, len(sid), len(cls)),
+            sid, cls, self.stats.tobytes(), self.completed,
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CompactRecord":
+        if data[:1] == b"\x01":
+            return cls.from_dict(json.loads(data[1:].decode("utf-8")))
+        self = cls.__new__(cls)
+        _, self.updated_at, self.present, self.completed_present, self.global_level, n_sid, n_cls = \
+            _HEADER.unpack_from(data)
+        pos = _HEADER.size
+        self.student_id = data[pos:pos + n_sid].decode("utf-8")
+        pos += n_sid
+        self.class_name = data[pos:pos + n_cls].decode("utf-8")
+        pos += n_cls
+        self.stats = array("H")
+        self.stats.frombytes(data[pos:pos + len(_EMPTY_STATS)])
+        pos += len(_EMPTY_STATS)
+        self.completed = bytes(data[pos:pos + len(_EMPTY_COMPLETED)])
+        self.raw = None
+        return self
+
+    def same_content(self, other: "CompactRecord") -> bool:
+        """Lik bortsett fra updated_at."""
+        if self.raw is not None or other.raw is not None:
+            a, b = self.to_dict(), other.to_dict()
+            a.pop("updated_at", None)
+            b.pop("updated_at", None)
+            return a == b
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__ if f != "updated_at")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactRecord):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"CompactRecord({self.student_id!r}, class_name={self.class_name!r}, global_level={self.global_level!r})"
+
+
+# ============================================================
+# Delt cache (én per serverprosess)
+# ============================================================
+class ProgressCache(ProgressBackend):
+    """
+    Backend for json/log-modus: delt kopi av progress-databasen i minnet.
+
+    Appen holder én instans per server (st.cache_resource). Kopien lastes bare
+    på nytt når progress.json eller loggen er endret utenfra (mtime/størrelse),
+    og `version` øker for hver endring. All tilgang går gjennom en lås.
+
+    Med flush_interval > 0 oppdateres minnet med en gang, mens diskskrivingen
+    gjøres samlet av en ProgressWriter. Elevene holdes som CompactRecord.
+    """
+
+    def __init__(self, flush_interval: float = 0.0, use_log: bool | None = None):
+        self._use_log = (PROGRESS_MODE == "log") if use_log is None else use_log
+        self._lock = threading.RLock()
+        self._db = None
+        self._stamp = None
+        self._dirty = {}  # student_id -> CompactRecord som ikke er skrevet til disk ennå
+        self.version = 0
+        self._writer = ProgressWriter(self, flush_interval) if flush_interval > 0 else None
+
+    @staticmethod
+    def _file_stamp() -> tuple:
+        stamp = []
+        for p in (PROGRESS_FILE, PROGRESS_LOG_FILE):
+            try:
+                s = p.stat()
+                stamp.append((s.st_mtime_ns, s.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _current(self) -> dict:
+        stamp = self._file_stamp()
+        if self._db is None or stamp != self._stamp:
+            self._db = {sid: CompactRecord.from_dict(rec) for sid, rec in load_progress_db().items()}
+            self._db.update(self._dirty)  # ikke mist endringer som venter på skriving
+            self._stamp = stamp
+            self.version += 1
+        return self._db
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._db = None
+
+    def get(self, student_id: str) -> dict:
+        """Egen kopi av eleven, så økten kan endre den uten å påvirke andre."""
+        with self._lock:
+            rec = self._current().get(student_id)
+        return rec.to_dict() if rec is not None else new_student_record(student_id)
+
+    def class_records(self, class_name: str = "") -> dict:
+        with self._lock:
+            db = self._current()
+            return {sid: rec.to_dict() for sid, rec in db.items()
+                    if not class_name or rec.class_name == class_name}
+
+    def get_many(self, student_ids) -> dict:
+        with self._lock:
+            db = self._current()
+            recs = [db.get(sid) for sid in student_ids]
+        return {rec.student_id: rec.to_dict() for rec in recs if rec is not None}
+
+    def iter_records(self, class_name: str = ""):
+        with self._lock:
+            recs = [rec for rec in self._current().values() if not class_name or rec.class_name == class_name]
+        for rec in recs:
+            yield rec.to_dict()
+
+    def changed(self, record: dict) -> bool:
+        """Sammenlign direkte med den lagrede kompakte posten (ingen egne fingeravtrykk)."""
+        sid = record["student_id"]
+        new = CompactRecord.from_dict(record)
+        with self._lock:
+            cur = self._current().get(sid)
+        if cur is None:
+            cur = CompactRecord.from_dict(new_student_record(sid))
+        return not new.same_content(cur)
+
+    def mark_clean(self, record: dict) -> None:
+        pass
+
+    def put(self, record: dict) -> None:
+        self.put_many([record])
+
+    def put_many(self, records) -> None:
+        with self._lock:
+            db = self._current()
+            recs = [CompactRecord.from_dict(r) for r in records]
+            for rec in recs:
+                db[rec.student_id] = rec
+            self.version += 1
+            if self._writer is None:
+                self._write(recs)
+                return
+            for rec in recs:
+                self._dirty[rec.student_id] = rec
+        for rec in recs:
+            self._writer.submit(rec.student_id)
+
+    def flush(self) -> None:
+        """Skriv alle ventende endringer til disk med én skriving."""
+        with self._lock:
+            if not self._dirty:
+                return
+            records = list(self._dirty.values())
+            self._dirty = {}
+            self._write(records)
+
+    def delete_many(self, student_ids) -> None:
+        with self._lock:
+            db = self._current()
+            for sid in student_ids:
+                db.pop(sid, None)
+                self._dirty.pop(sid, None)
+            self.version += 1
+            self._rewrite()
+
+    def compact(self) -> None:
+        self.flush()
+        with self._lock:
+            self._current()
+            self._rewrite()
+
+    def _rewrite(self) -> None:
+        """Nytt kompakt øyeblikksbilde av alt i minnet (tømmer loggen i log-modus)."""
+        db = {sid: rec.to_dict() for sid, rec in self._db.items()}
+        if self._use_log:
+            compact_progress_log(db)
+        else:
+            _write_atomic(PROGRESS_FILE, json.dumps(db, ensure_ascii=False, indent=2))
+        self._stamp = self._file_stamp()
+
+    def _write(self, records: list) -> None:
+        if self._use_log:
+            append_progress_events([rec.to_dict() for rec in records])
+        else:
+            db = {sid: rec.to_dict() for sid, rec in self._db.items()}
+            _write_atomic(PROGRESS_FILE, json.dumps(db, ensure_ascii=False, indent=2))
+        self._stamp = self._file_stamp()
+
+
+class ProgressWriter:
+    """
+    Bakgrunnstråd for gruppe-commit. Lagringer fra alle økter havner i en kø;
+    tråden venter `interval` sekunder slik at flere lagringer samles, og skriver
+    dem så med cache.flush() (én atomisk skriving).
+    """
+
+    def __init__(self, cache: ProgressCache, interval: float):
+        self._cache = cache
+        self._interval = interval
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, student_id: str) -> None:
+        self._queue.put(student_id)
+
+    def flush(self) -> None:
+        try:
+            self._cache.flush()
+        except Exception:
+            pass
+
+    def join(self) -> None:
+        """Vent til alt som er sendt inn er skrevet."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            self._queue.get()
+            time.sleep(self._interval)
+            n = 1
+            while True:
+                try:
+                    self._queue.get_nowait()
+                    n += 1
+                except queue.Empty:
+                    break
+            self.flush()
+            for _ in range(n):
+                self._queue.task_done()
+
+
+# ============================================================
+# Hendelseslogg
+# ============================================================
+def append_progress_event(record: dict) -> None:
+    append_progress_events([record])
+
+
+def append_progress_events(records: list) -> None:
+    """Legg til én linje per elev i loggen med én skriving."""
+    global _log_events
+    now = time.time()
+    lines = "".join(
+        json.dumps({"t": now, "record": rec}, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for rec in records
+    )
+    with _log_lock:
+        if _log_events is None:
+            _log_events = _count_log_lines()
+        with PROGRESS_LOG_FILE.open("a", encoding="utf-8") as f:
+            f.write(lines)
+        _log_events += len(records)
+        if _log_events < LOG_COMPACT_EVERY:
+            return
+        _compact_locked(None)
+
+
+def compact_progress_log(db: dict | None = None) -> None:
+    """Fold loggen inn i progress.json og tøm den. Med db gitt skrives den som nytt øyeblikksbilde."""
+    with _log_lock:
+        _compact_locked(db)
+
+
+def _compact_locked(db: dict | None) -> None:
+    global _log_events
+    snapshot = load_progress_db() if db is None else db
+    _write_atomic(PROGRESS_FILE, json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")))
+    PROGRESS_LOG_FILE.write_text("", encoding="utf-8")
+    _log_events = 0
+
+
+def _count_log_lines() -> int:
+    if not PROGRESS_LOG_FILE.exists():
+        return 0
+    with PROGRESS_LOG_FILE.open("rb") as f:
+        return sum(1 for _ in f)
+
+
+# ============================================================
+# SQLite (WAL)
+# ============================================================
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    student_id       TEXT PRIMARY KEY,
+    class_name       TEXT NOT NULL DEFAULT '',
+    global_level     INTEGER NOT NULL DEFAULT 1,
+    completed_topics TEXT NOT NULL DEFAULT '{}',
+    updated_at       REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_students_class ON students(class_name);
+
+-- Primærnøkkelen starter med student_id og er dermed indeksen for oppslag per elev.
+CREATE TABLE IF NOT EXISTS topic_levels (
+    student_id     TEXT NOT NULL,
+    class_name     TEXT NOT NULL DEFAULT '',
+    topic          TEXT NOT NULL,
+    level          INTEGER NOT NULL,
+    q_index        INTEGER NOT NULL DEFAULT 0,
+    correct        INTEGER NOT NULL DEFAULT 0,
+    answered       INTEGER NOT NULL DEFAULT 0,
+    total_correct  INTEGER NOT NULL DEFAULT 0,
+    total_answered INTEGER NOT NULL DEFAULT 0,
+    passed         INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (student_id, topic, level)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_topic_levels_class ON topic_levels(class_name);
+"""
+
+_STAT_COLUMNS = ("q_index", "correct", "answered", "total_correct", "total_answered", "passed")
+
+_sqlite_local = threading.local()
+_sqlite_init_lock = threading.Lock()
+
+
+def sqlite_connect() -> sqlite3.Connection:
+    """Én tilkobling per tråd (Streamlit kjører hver økt i egen tråd)."""
+    conn = getattr(_sqlite_local, "conn", None)
+    if conn is not None:
+        return conn
+    conn = sqlite3.connect(PROGRESS_SQLITE_FILE, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    with _sqlite_init_lock:
+        conn.executescript(_SQLITE_SCHEMA)
+        if conn.execute("SELECT 1 FROM students LIMIT 1").fetchone() is None and PROGRESS_FILE.exists():
+            # Første oppstart i sqlite-modus: ta med eksisterende progress.json
+            try:
+                db = json.loads(PROGRESS_FILE.read_text(encoding="utf-8"))
+            except Exception:
+                db = {}
+            with conn:
+                for rec in db.values():
+                    _sqlite_write(conn, rec)
+    _sqlite_local.conn = conn
+    return conn
+
+
+def _sqlite_write(conn: sqlite3.Connection, record: dict) -> None:
+    sid = record["student_id"]
+    class_name = record.get("class_name", "") or ""
+    conn.execute(
+        "INSERT OR REPLACE INTO students (student_id, class_name, global_level, completed_topics, updated_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (sid, class_name, int(record.get("global_level", 1)),
+         json.dumps(record.get("completed_topics", {}), ensure_ascii=False),
+         float(record.get("updated_at", time.time()))),
+    )
+    conn.execute("DELETE FROM topic_levels WHERE student_id = ?", (sid,))
+    rows = []
+    for topic, t in (record.get("topics") or {}).items():
+        for level, stats in (t.get("levels") or {}).items():
+            rows.append((sid, class_name, topic, int(level)) + tuple(int(stats.get(c, 0)) for c in _STAT_COLUMNS))
+    conn.executemany(
+        "INSERT INTO topic_levels (student_id, class_name, topic, level, " + ", ".join(_STAT_COLUMNS) + ") "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def _sqlite_records(student_rows, level_rows) -> dict:
+    db = {}
+    for sid, class_name, global_level, completed, updated_at in student_rows:
+        db[sid] = {
+            "student_id": sid,
+            "class_name": class_name,
+            "global_level": global_level,
+            "completed_topics": json.loads(completed or "{}"),
+            "topics": {},
+            "updated_at": updated_at,
+        }
+    for row in level_rows:
+        sid, topic, level = row[0], row[1], row[2]
+        rec = db.get(sid)
+        if rec is None:
+            continue
+        stats = dict(zip(_STAT_COLUMNS, row[3:]))
+        stats["passed"] = bool(stats["passed"])
+        rec["topics"].setdefault(topic, {"levels": {}})["levels"][str(level)] = stats
+    return db
+
+
+SQLITE_CHUNK = 500  # elever per spørring ved bulk-lesing (under SQLites grense for parametre)
+_STUDENT_SELECT = "SELECT student_id, class_name, global_level, completed_topics, updated_at FROM students"
+_LEVEL_SELECT = "SELECT student_id, topic, level, " + ", ".join(_STAT_COLUMNS) + " FROM topic_levels"
+
+
+def sqlite_get_student(student_id: str) -> dict:
+    conn = sqlite_connect()
+    db = _sqlite_records(
+        conn.execute(_STUDENT_SELECT + " WHERE student_id = ?", (student_id,)),
+        conn.execute(_LEVEL_SELECT + " WHERE student_id = ?", (student_id,)),
+    )
+    return db.get(student_id) or new_student_record(student_id)
+
+
+def sqlite_get_many(student_ids) -> dict:
+    conn = sqlite_connect()
+    ids = list(student_ids)
+    db = {}
+    for i in range(0, len(ids), SQLITE_CHUNK):
+        chunk = ids[i:i + SQLITE_CHUNK]
+        marks = ",".join("?" * len(chunk))
+        db.update(_sqlite_records(
+            conn.execute(_STUDENT_SELECT + f" WHERE student_id IN ({marks})", chunk),
+            conn.execute(_LEVEL_SELECT + f" WHERE student_id IN ({marks})", chunk),
+        ))
+    return db
+
+
+def sqlite_iter_records(class_name: str = ""):
+    """Strøm postene i biter på SQLITE_CHUNK elever (konstant minnebruk)."""
+    conn = sqlite_connect()
+    where, args = ("WHERE class_name = ?", [class_name]) if class_name else ("", [])
+    last = ""
+    while True:
+        sep = "AND" if where else "WHERE"
+        ids = [r[0] for r in conn.execute(
+            f"SELECT student_id FROM students {where} {sep} student_id > ? ORDER BY student_id LIMIT ?",
+            args + [last, SQLITE_CHUNK])]
+        if not ids:
+            return
+        db = sqlite_get_many(ids)
+        for sid in ids:
+            yield db[sid]
+        last = ids[-1]
+
+
+def sqlite_put_student(record: dict) -> None:
+    conn = sqlite_connect()
+    with conn:
+        _sqlite_write(conn, record)
+
+
+def sqlite_put_many(records) -> None:
+    conn = sqlite_connect()
+    with conn:
+        for rec in records:
+            _sqlite_write(conn, rec)
+
+
+def sqlite_delete_many(student_ids) -> None:
+    conn = sqlite_connect()
+    rows = [(sid,) for sid in student_ids]
+    with conn:
+        conn.executemany("DELETE FROM topic_levels WHERE student_id = ?", rows)
+        conn.executemany("DELETE FROM students WHERE student_id = ?", rows)
+
+
+def sqlite_compact() -> None:
+    """Skriv WAL inn i hovedfilen og krymp filen."""
+    conn = sqlite_connect()
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.execute("VACUUM")
+
+
+def sqlite_class_records(class_name: str = "") -> dict:
+    conn = sqlite_connect()
+    if not class_name:
+        return _sqlite_records(conn.execute(_STUDENT_SELECT), conn.execute(_LEVEL_SELECT))
+    return _sqlite_records(
+        conn.execute(_STUDENT_SELECT + " WHERE class_name = ?", (class_name,)),
+        conn.execute(_LEVEL_SELECT + " WHERE class_name = ?", (class_name,)),
+    )
+
+
+# ============================================================
+# Fil per klasse (sharded)
+# ============================================================
+NO_CLASS_SHARD = "_uten_klasse"
+
+_shard_locks = {}
+_shard_locks_guard = threading.Lock()
+_index_lock = threading.Lock()
+
+
+def shard_name(class_name: str) -> str:
+    """Filnavn (uten .json) for en klasse. Navn med spesialtegn får en kort hash for å unngå kollisjoner."""
+    if not class_name:
+        return NO_CLASS_SHARD
+    safe = re.sub(r"[^0-9A-Za-z_-]", "_", class_name)
+    if safe != class_name or safe == NO_CLASS_SHARD or safe == "index":
+        safe += "-" + hashlib.sha1(class_name.encode("utf-8")).hexdigest()[:8]
+    return safe
+
+
+def _shard_path(name: str) -> Path:
+    return PROGRESS_SHARD_DIR / f"{name}.json"
+
+
+def _shard_lock(name: str) -> threading.Lock:
+    with _shard_locks_guard:
+        return _shard_locks.setdefault(name, threading.Lock())
+
+
+def _read_json(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def _load_shard_index() -> dict:
+    if not PROGRESS_SHARD_INDEX.exists():
+        _migrate_to_shards()
+    return _read_json(PROGRESS_SHARD_INDEX)
+
+
+def _migrate_to_shards() -> None:
+    """Første oppstart i sharded-modus: del opp eksisterende progress.json per klasse."""
+    PROGRESS_SHARD_DIR.mkdir(exist_ok=True)
+    with _index_lock:
+        if PROGRESS_SHARD_INDEX.exists():
+            return
+        shards, index = {}, {}
+        for sid, rec in load_progress_db().items():
+            name = shard_name(rec.get("class_name", ""))
+            shards.setdefault(name, {})[sid] = rec
+            index[sid] = name
+        for name, db in shards.items():
+            _write_atomic(_shard_path(name), json.dumps(db, ensure_ascii=False, separators=(",", ":")))
+        _write_atomic(PROGRESS_SHARD_INDEX, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+
+
+def shard_get_student(student_id: str) -> dict:
+    name = _load_shard_index().get(student_id)
+    if name is None:
+        return new_student_record(student_id)
+    return _read_json(_shard_path(name)).get(student_id) or new_student_record(student_id)
+
+
+def shard_put_student(record: dict) -> None:
+    shard_put_many([record])
+
+
+def shard_put_many(records) -> None:
+    """Én skriving per berørt klassefil og høyst én av index.json."""
+    records = list(records)
+    index = _load_shard_index()
+    by_shard, moved = {}, {}
+    for rec in records:
+        sid = rec["student_id"]
+        name = shard_name(rec.get("class_name", ""))
+        by_shard.setdefault(name, {})[sid] = rec
+        old = index.get(sid)
+        if old != name:
+            moved[sid] = (old, name)
+
+    for name, recs in by_shard.items():
+        with _shard_lock(name):
+            path = _shard_path(name)
+            db = _read_json(path)
+            db.update(recs)
+            _write_atomic(path, json.dumps(db, ensure_ascii=False, separators=(",", ":")))
+
+    if not moved:
+        return
+    # elever som har byttet klasse: fjern fra gammel fil
+    by_old = {}
+    for sid, (old, _) in moved.items():
+        if old is not None:
+            by_old.setdefault(old, []).append(sid)
+    for old, sids in by_old.items():
+        with _shard_lock(old):
+            old_path = _shard_path(old)
+            db = _read_json(old_path)
+            if any([db.pop(sid, None) is not None for sid in sids]):
+                _write_atomic(old_path, json.dumps(db, ensure_ascii=False, separators=(",", ":")))
+    with _index_lock:
+        index = _read_json(PROGRESS_SHARD_INDEX)
+        index.update((sid, name) for sid, (_, name) in moved.items())
+        _write_atomic(PROGRESS_SHARD_INDEX, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+
+
+def shard_class_records(class_name: str = "") -> dict:
+    """Én klasse leser kun sin egen fil. Tom klasse = alle filer."""
+    _load_shard_index()
+    if class_name:
+        return _read_json(_shard_path(shard_name(class_name)))
+    db = {}
+    for path in sorted(PROGRESS_SHARD_DIR.glob("*.json")):
+        if path != PROGRESS_SHARD_INDEX:
+            db.update(_read_json(path))
+    return db
+
+
+def shard_get_many(student_ids) -> dict:
+    """Leser hver klassefil bare én gang."""
+    index = _load_shard_index()
+    by_shard = {}
+    for sid in student_ids:
+        if sid in index:
+            by_shard.setdefault(index[sid], []).append(sid)
+    found = {}
+    for name, sids in by_shard.items():
+        db = _read_json(_shard_path(name))
+        found.update((sid, db[sid]) for sid in sids if sid in db)
+    return found
+
+
+def shard_iter_records(class_name: str = ""):
+    """Én klassefil i minnet om gangen."""
+    if class_name:
+        yield from shard_class_records(class_name).values()
+        return
+    _load_shard_index()
+    for path in sorted(PROGRESS_SHARD_DIR.glob("*.json")):
+        if path != PROGRESS_SHARD_INDEX:
+            yield from _read_json(path).values()
+
+
+def shard_delete_many(student_ids) -> None:
+    index = _load_shard_index()
+    by_shard = {}
+    for sid in student_ids:
+        if sid in index:
+            by_shard.setdefault(index[sid], []).append(sid)
+    for name, sids in by_shard.items():
+        with _shard_lock(name):
+            path = _shard_path(name)
+            db = _read_json(path)
+            for sid in sids:
+                db.pop(sid, None)
+            _write_atomic(path, json.dumps(db, ensure_ascii=False, separators=(",", ":")))
+    with _index_lock:
+        index = _read_json(PROGRESS_SHARD_INDEX)
+        for sid in student_ids:
+            index.pop(sid, None)
+        _write_atomic(PROGRESS_SHARD_INDEX, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+
+
+def shard_compact() -> None:
+    """Slett klassefiler som ikke har elever igjen."""
+    _load_shard_index()
+    for path in PROGRESS_SHARD_DIR.glob("*.json"):
+        if path == PROGRESS_SHARD_INDEX:
+            continue
+        with _shard_lock(path.stem):
+            if not _read_json(path):
+                path.unlink(missing_ok=True)
+
+
+class SqliteBackend(ProgressBackend):
+    def get(self, student_id: str) -> dict:
+        return sqlite_get_student(student_id)
+
+    def put(self, record: dict) -> None:
+        sqlite_put_student(record)
+
+    def put_many(self, records) -> None:
+        sqlite_put_many(records)
+
+    def get_many(self, student_ids) -> dict:
+        return sqlite_get_many(student_ids)
+
+    def iter_records(self, class_name: str = ""):
+        return sqlite_iter_records(class_name)
+
+    def class_records(self, class_name: str = "") -> dict:
+        return sqlite_class_records(class_name)
+
+    def delete_many(self, student_ids) -> None:
+        sqlite_delete_many(student_ids)
+
+    def compact(self) -> None:
+        sqlite_compact()
+
+
+class ShardedBackend(ProgressBackend):
+    def get(self, student_id: str) -> dict:
+        return shard_get_student(student_id)
+
+    def put(self, record: dict) -> None:
+        shard_put_student(record)
+
+    def put_many(self, records) -> None:
+        shard_put_many(records)
+
+    def class_records(self, class_name: str = "") -> dict:
+        return shard_class_records(class_name)
+
+    def get_many(self, student_ids) -> dict:
+        return shard_get_many(student_ids)
+
+    def iter_records(self, class_name: str = ""):
+        return shard_iter_records(class_name)
+
+    def delete_many(self, student_ids) -> None:
+        shard_delete_many(student_ids)
+
+    def compact(self) -> None:
+        shard_compact()
+
+
+# ============================================================
+# Supabase / PostgREST
+# ============================================================
+try:
+    from supabase import create_client
+except Exception:
+    create_client = None
+
+SUPABASE_URL = os.environ.get("SUPABASE_URL", "")
+SUPABASE_KEY = os.environ.get("SUPABASE_KEY", "")
+SUPABASE_TABLE = os.environ.get("BYGGMATTE_SUPABASE_TABLE", "progress")
+SUPABASE_BATCH = 500  # rader per upsert
+SUPABASE_PAGE = 1000  # rader per side ved lesing (PostgREST max-rows)
+
+# Forventet tabell i Supabase:
+#   create table progress (
+#       student_id text primary key,
+#       class_name text not null default '',
+#       record     jsonb not null,
+#       updated_at double precision not null default 0
+#   );
+#   create index progress_class_name_idx on progress (class_name);
+
+_supabase_clients = {}
+_supabase_clients_lock = threading.Lock()
+
+
+def supabase_client(url: str = "", key: str = ""):
+    """Én klient per prosess (per url/nøkkel), så HTTP-tilkoblingene gjenbrukes mellom økter."""
+    url = url or SUPABASE_URL
+    key = key or SUPABASE_KEY
+    if create_client is None:
+        raise RuntimeError("Pakken 'supabase' er ikke installert.")
+    if not url or not key:
+        raise RuntimeError("SUPABASE_URL og SUPABASE_KEY må være satt.")
+    with _supabase_clients_lock:
+        client = _supabase_clients.get((url, key))
+        if client is None:
+            client = _supabase_clients[(url, key)] = create_client(url, key)
+        return client
+
+
+class SupabaseBackend(ProgressBackend):
+    """Én rad per elev (hele posten som jsonb). Skriving skjer som samlede upserts."""
+
+    def __init__(self, url: str = "", key: str = "", table: str = ""):
+        self._client = supabase_client(url, key)
+        self._table = table or SUPABASE_TABLE
+
+    def _query(self):
+        return self._client.table(self._table)
+
+    def get(self, student_id: str) -> dict:
+        rows = self._query().select("record").eq("student_id", student_id).limit(1).execute().data
+        if rows:
+            return rows[0]["record"]
+        return new_student_record(student_id)
+
+    def put(self, record: dict) -> None:
+        self.put_many([record])
+
+    def put_many(self, records) -> None:
+        batch = []
+        for rec in records:
+            batch.append({
+                "student_id": rec["student_id"],
+                "class_name": rec.get("class_name", "") or "",
+                "record": rec,
+                "updated_at": float(rec.get("updated_at", time.time())),
+            })
+            if len(batch) >= SUPABASE_BATCH:
+                self._upsert(batch)
+                batch = []
+        if batch:
+            self._upsert(batch)
+
+    def _upsert(self, rows: list) -> None:
+        self._query().upsert(rows, on_conflict="student_id", returning="minimal").execute()
+
+    def delete_many(self, student_ids) -> None:
+        ids = list(student_ids)
+        for i in range(0, len(ids), SUPABASE_BATCH):
+            self._query().delete(returning="minimal").in_("student_id", ids[i:i + SUPABASE_BATCH]).execute()
+
+    def get_many(self, student_ids) -> dict:
+        ids = list(student_ids)
+        found = {}
+        for i in range(0, len(ids), SUPABASE_BATCH):
+            rows = self._query().select("student_id,record").in_("student_id", ids[i:i + SUPABASE_BATCH]).execute().data
+            found.update((row["student_id"], row["record"]) for row in rows)
+        return found
+
+    def class_records(self, class_name: str = "") -> dict:
+        return {rec["student_id"]: rec for rec in self.iter_records(class_name)}
+
+    def iter_records(self, class_name: str = ""):
+        """Side for side (SUPABASE_PAGE rader), sortert på student_id."""
+        start = 0
+        while True:
+            q = self._query().select("record")
+            if class_name:
+                q = q.eq("class_name", class_name)
+            rows = q.order("student_id").range(start, start + SUPABASE_PAGE - 1).execute().data
+            for row in rows:
+                yield row["record"]
+            if len(rows) < SUPABASE_PAGE:
+                return
+            start += SUPABASE_PAGE
+
+
+# ============================================================
+# Vedlikehold: øyeblikksbilder, arkivering og komprimering
+# ============================================================
+SNAPSHOT_DIR = DATA_DIR / "snapshots"
+ARCHIVE_DIR = DATA_DIR / "archive"
+RETENTION_DAYS = float(os.environ.get("BYGGMATTE_RETENTION_DAYS", "365"))  # elever uten aktivitet så lenge arkiveres
+SNAPSHOT_KEEP = int(os.environ.get("BYGGMATTE_SNAPSHOT_KEEP", "14"))  # antall øyeblikksbilder som beholdes
+
+
+def write_snapshot(db: dict, keep: int = SNAPSHOT_KEEP) -> Path:
+    """Skriv hele databasen som gzip-komprimert JSON og slett de eldste utover `keep`."""
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    path = SNAPSHOT_DIR / time.strftime("progress-%Y%m%d-%H%M%S.json.gz")
+    tmp = path.with_suffix(".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump(db, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+    for old in sorted(SNAPSHOT_DIR.glob("progress-*.json.gz"))[:-max(keep, 1)]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+def stale_student_ids(db: dict, max_age_days: float, now: float | None = None) -> list:
+    """Elever med updated_at eldre enn max_age_days (poster uten updated_at beholdes)."""
+    cutoff = (now or time.time()) - max_age_days * 86400
+    return [sid for sid, rec in db.items() if 0 < float(rec.get("updated_at") or 0) < cutoff]
+
+
+def archive_records(records: list) -> Path:
+    """Legg postene til i årets arkiv (JSONL, gzip). Nye kjøringer legges til som egne gzip-ledd."""
+    ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+    path = ARCHIVE_DIR / time.strftime("progress-archive-%Y.jsonl.gz")
+    lines = "".join(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n" for rec in records)
+    with gzip.open(path, "at", encoding="utf-8") as f:
+        f.write(lines)
+    return path
+
+
+def run_maintenance(store: ProgressBackend | None = None, max_age_days: float = RETENTION_DAYS,
+                    keep: int = SNAPSHOT_KEEP) -> dict:
+    """
+    Vedlikehold for alle moduser, trygt å kjøre mens appen går:
+    1) øyeblikksbilde av alt (før noe slettes), 2) arkiver og fjern elever uten
+    aktivitet på max_age_days dager, 3) komprimer lagringen.
+    """
+    store = store or default_backend()
+    store.flush()
+    db = store.load_all()
+    snapshot = write_snapshot(db, keep)
+    stale = stale_student_ids(db, max_age_days)
+    if stale:
+        # Arkiver først når slettingen har gått bra: et nytt forsøk etter en feil gir da ikke
+        # doble arkivrader. Feiler arkiveringen, ligger elevene fortsatt i øyeblikksbildet.
+        store.delete_many(stale)
+        archive_records([db[sid] for sid in stale])
+    store.compact()
+    return {"students": len(db) - len(stale), "archived": len(stale), "snapshot": str(snapshot)}
+
+
+register_progress_backend("json", lambda flush_interval=0.0, **_: ProgressCache(flush_interval, use_log=False))
+register_progress_backend("log", lambda flush_interval=0.0, **_: ProgressCache(flush_interval, use_log=True))
+register_progress_backend("sqlite", lambda **_: SqliteBackend())
+register_progress_backend("sharded", lambda **_: ShardedBackend())
+register_progress_backend("supabase", lambda url="", key="", table="", **_: SupabaseBackend(url, key, table))
@@ -0,0 +1,259 @@
+"""
+Hele spørsmålsrommet i Læringsarena: validering og forhåndsberegnet tabell.
+
+Parameterlistene i malene er korte, så alle spørsmål som kan trekkes for (tema, nivå)
+kan listes opp. build_question_table() går gjennom alle i en prosesspool (én jobb per
+tema og nivå) og sjekker hvert spørsmål:
+- svaret fra malen (math, ett og ett) mot en egen fasitformel i REFERENCE_ANSWERS,
+  regnet med NumPy på hele parameterrommet samtidig, innenfor tol. Formlene der er
+  skrevet for seg (etter den opprinnelige if-kjeden i generate_question), ikke hentet
+  fra malene, så en feil formel i en mal ikke kan bekrefte seg selv. En mal uten
+  fasitformel regnes som feil,
+- at svaret er et endelig tall, og et helt tall der malen sier integer,
+- at fasiten slik den vises (fmt + enhet) blir godtatt av check_answer,
+- at enheten finnes i units.UNITS.
+
+Tabellen er to .npy-filer (faste kolonner og prompt-tekst som UTF-8-bytes) og en liten
+meta.json. load_question_table() åpner dem med np.load(mmap_mode="r"): alle prosesser
+deler sidene fra disk, og ingenting leses før det brukes. meta.json har et fingeravtrykk
+av malene, så en tabell fra en eldre versjon av malene ikke blir brukt.
+"""
+import hashlib
+import json
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from answers import check_answer
+from arena_questions import QUESTION_TEMPLATES, templates_for
+from curriculum import LEVEL_NUMBERS, TOPIC_KEYS
+from progress_store import DATA_DIR
+from units import UNITS, fmt
+
+QUESTION_TABLE_DIR = DATA_DIR / "question_table"
+
+ROW_DTYPE = np.dtype([
+    ("topic", "u1"), ("level", "u1"), ("template", "u2"), ("index", "u4"),
+    ("answer", "f8"), ("tol", "f8"), ("unit", "u1"), ("integer", "?"),
+    ("prompt_start", "u8"), ("prompt_len", "u4"),
+])
+TABLE_UNITS = ("",) + tuple(UNITS)  # kolonnen unit er en indeks i denne
+
+
+def registry_fingerprint() -> str:
+    """SHA-256 av alt i malene som påvirker spørsmålene (prompt, parametre, enhet, toleranse, svarformel)."""
+    h = hashlib.sha256()
+    for templates in QUESTION_TEMPLATES.values():
+        for t in templates:
+            h.update(repr((t.topic, t.levels, t.prompt, t.unit, t.tol, t.params, t.integer)).encode("utf-8"))
+            for fn in (t.answer, t.derive):
+                if fn is not None:  # bytekoden, så en rettet formel gir ny tabell
+                    h.update(fn.__code__.co_code + repr(fn.__code__.co_consts).encode("utf-8"))
+    return h.hexdigest()
+
+
+# ============================================================
+# Fasitformler (uavhengige av malene)
+# ============================================================
+_DOOR = 0.9 * 2.1
+
+# (tema, prompt) -> formel på NumPy-kolonner med malens parametre
+REFERENCE_ANSWERS = {
+    ("areal", "Finn arealet av et rektangel: L={L} m og B={B} m. (m²)"):
+        lambda v: v["L"] * v["B"],
+    ("areal", "Et rom er {L} m langt og {B} m bredt. Finn gulvarealet (m²)."):
+        lambda v: v["L"] * v["B"],
+    ("areal", "En vegg er {L} m lang og {H} m høy. Finn arealet (m²)."):
+        lambda v: v["L"] * v["H"],
+    ("areal", "En vegg er {L} m lang og {H} m høy. Trekk fra én dør (0,9×2,1 m). Finn nettoareal (m²)."):
+        lambda v: np.clip(v["L"] * v["H"] - _DOOR, 0.0, None),
+    ("omkrets", "Finn omkretsen av et rektangel: L={L} m og B={B} m. (m)"):
+        lambda v: 2 * v["L"] + 2 * v["B"],
+    ("omkrets", "Du skal sette gulvlister rundt et rom {L} m × {B} m. Finn omkrets (m)."):
+        lambda v: 2 * v["L"] + 2 * v["B"],
+    ("omkrets", "Du skal ha lister rundt et rom {L} m × {B} m. Finn løpemeter (m)."):
+        lambda v: 2 * v["L"] + 2 * v["B"],
+    ("omkrets", "Du skal ha lister rundt et rom {L} m × {B} m. Legg til {waste}% svinn. Hvor mange meter bestiller du?"):
+        lambda v: (2 * v["L"] + 2 * v["B"]) * (100 + v["waste"]) / 100,
+    ("enheter", "Gjør om {val} mm til cm."): lambda v: v["val"] * 0.1,
+    ("enheter", "Gjør om {val} cm til meter (m)."): lambda v: v["val"] * 0.01,
+    ("enheter", "Gjør om {val} mm til m."): lambda v: v["val"] * 0.001,
+    ("enheter", "Gjør om {val} m til mm."): lambda v: v["val"] * 1000,
+    ("enheter", "Gjør om {val} cm til mm."): lambda v: v["val"] * 10,
+    ("vinkler", "Rettvinklet trekant: A={A} og B={B}. Finn vinkelen θ (grader)."):
+        lambda v: np.rad2deg(np.arctan2(v["B"], v["A"])),
+    ("vinkler", "Du skal lage skråavstivning. A={A} m og θ={theta}°. Finn B (m)."):
+        lambda v: v["A"] * np.tan(v["theta"] * np.pi / 180),
+    ("vinkler", "Tak: horisontal lengde (A)={run} m og høyde (B)={rise} m. Finn takvinkel θ (grader)."):
+        lambda v: np.rad2deg(np.arctan2(v["rise"], v["run"])),
+    ("diagonal", "Finn diagonal C når A={a} og B={b}. (C = √(A²+B²))"):
+        lambda v: np.sqrt(v["a"] ** 2 + v["b"] ** 2),
+    ("diagonal", "Ramme: A={a} m og B={b} m. Finn diagonal C (m) for å sjekke vinkel."):
+        lambda v: np.sqrt(v["a"] ** 2 + v["b"] ** 2),
+    # skalert 3-4-5-trekant: A = 3k, B = 4k, C = 5k
+    ("diagonal", "Kontrollmål: A={a} m og B={b} m. Hva skal C være (m) for rett vinkel?"): lambda v: 5 * v["k"],
+    ("diagonal", "Kontrollmål: C={c} m og B={b} m. Hva skal A være (m)?"): lambda v: 3 * v["k"],
+    ("diagonal", "Kontrollmål: C={c} m og A={a} m. Hva skal B være (m)?"): lambda v: 4 * v["k"],
+    ("volum", "Finn volum: L={L}, B={B}, H={H}. (V=L×B×H)"): lambda v: v["L"] * v["B"] * v["H"],
+    ("volum", "Betongplate: {L} m × {B} m × {t} m. Finn volum (m³)."): lambda v: v["L"] * v["B"] * v["t"],
+    ("volum", "Plate: {L} m × {B} m × {tmm} mm. Finn volum (m³)."): lambda v: v["L"] * v["B"] * v["tmm"] / 1000,
+    ("fall", "Fall er {fall_cm} cm over {lengde_m} m. Finn fall i %."):
+        lambda v: v["fall_cm"] / v["lengde_m"],  # (cm/100) / m × 100
+    ("fall", "Du har fall {per_m} mm per meter over {lengde_m} m. Hvor mange mm fall totalt?"):
+        lambda v: v["per_m"] * v["lengde_m"],
+    ("fall", "Prosjekt: Fall {pct}% over {lengde_m} m. Hvor mange mm fall blir det?"):
+        lambda v: v["pct"] * v["lengde_m"] * 10,  # pct/100 × m × 1000
+    ("prosent", "Hva er {p}% av {base}?"): lambda v: v["p"] * v["base"] / 100,
+    ("prosent", "Du trenger {qty} stk. Legg til {waste}% svinn. Hvor mange bestiller du? (avrund opp)"):
+        lambda v: -(-(v["qty"] * (100 + v["waste"])) // 100),  # heltallsdivisjon rundet opp
+    ("prosent", "En vare koster {old} kr. Prisøkning {change}%. Hva er ny pris?"):
+        lambda v: v["old"] * (100 + v["change"]) / 100,
+    ("prosent", "En vare koster {old} kr. Rabatt {change}%. Hva er ny pris?"):
+        lambda v: v["old"] * (100 - v["change"]) / 100,
+}
+
+
+# ============================================================
+# Opplisting og validering (kjører i arbeiderprosessene)
+# ============================================================
+def _reference_answers(t, combos: list) -> np.ndarray | None:
+    """Fasit fra REFERENCE_ANSWERS for alle kombinasjonene samtidig, eller None uten formel."""
+    formula = REFERENCE_ANSWERS.get((t.topic, t.prompt))
+    if formula is None:
+        return None
+    cols = {name: np.array([c[name] for c in combos]) for name, _ in t.params}
+    return np.broadcast_to(np.asarray(formula(cols), dtype=float), (len(combos),))
+
+
+def _question_problem(q: dict, reference: float | None) -> str | None:
+    answer = q["answer"]
+    if not isinstance(answer, (int, float)) or not math.isfinite(answer):
+        return f"svaret er ikke et endelig tall: {answer!r}"
+    if reference is None:
+        return "malen har ingen fasitformel i REFERENCE_ANSWERS"
+    if abs(answer - reference) > q["tol"] + 1e-9:
+        return f"svar {answer!r} avviker fra fasitformelen {reference!r}"
+    if q.get("integer") and answer != int(answer):
+        return f"svar {answer!r} skal være et helt tall"
+    if q["unit"] and q["unit"] not in UNITS:
+        return f"ukjent enhet {q['unit']!r}"
+    shown = f"{fmt(answer)} {q['unit']}".strip()
+    if not check_answer(shown, q)[0]:
+        return f"fasiten slik den vises ({shown!r}) blir ikke godtatt"
+    return None
+
+
+def enumerate_questions(topic_key: str, level: int) -> tuple:
+    """
+    Alle spørsmål for (tema, nivå): (rader som ROW_DTYPE uten prompt_start, prompt-bytes,
+    feil). Radene står i malrekkefølge, og index er nummeret i QuestionTemplate.values_at().
+    """
+    rows, prompts, problems = [], [], []
+    for ti, t in enumerate(templates_for(topic_key, level)):
+        combos = list(t.iter_space())
+        reference = _reference_answers(t, combos)
+        reference = [None] * len(combos) if reference is None else reference.tolist()
+        for index, (values, ref) in enumerate(zip(combos, reference)):
+            q = t.render(values)
+            problem = _question_problem(q, ref)
+            if problem is not None:
+                problems.append({"topic": topic_key, "level": level, "prompt": q["prompt"], "problem": problem})
+            prompt = q["prompt"].encode("utf-8")
+            prompts.append(prompt)
+            rows.append((TOPIC_KEYS.index(topic_key), level, ti, index, float(q["answer"]), q["tol"],
+                         TABLE_UNITS.index(q["unit"]) if q["unit"] in TABLE_UNITS else 0,
+                         bool(q.get("integer")), 0, len(prompt)))
+    return np.array(rows, dtype=ROW_DTYPE), b"".join(prompts), problems
+
+
+def _enumerate_job(job: tuple) -> tuple:
+    return job, enumerate_questions(*job)
+
+
+# ============================================================
+# Bygging
+# ============================================================
+def build_question_table(out_dir: Path | None = None, workers: int | None = None, write: bool = True) -> dict:
+    """
+    Valider hele spørsmålsrommet og (med write, og bare uten feil) skriv tabellen.
+    Returnerer {"questions", "problems", "counts", "path"}.
+    """
+    out_dir = Path(out_dir or QUESTION_TABLE_DIR)
+    jobs = [(topic, level) for topic in TOPIC_KEYS for level in LEVEL_NUMBERS]
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        results = dict(pool.map(_enumerate_job, jobs))
+
+    parts, blobs, problems, ranges = [], [], [], {}
+    start = offset = 0
+    for job in jobs:  # fast rekkefølge uansett hvilken arbeider som ble ferdig først
+        rows, blob, job_problems = results[job]
+        rows["prompt_start"] = offset + np.concatenate(([0], np.cumsum(rows["prompt_len"])[:-1])).astype("u8")
+        parts.append(rows)
+        blobs.append(blob)
+        problems.extend(job_problems)
+        ranges[f"{job[0]}:{job[1]}"] = [start, start + len(rows)]
+        start += len(rows)
+        offset += len(blob)
+
+    summary = {"questions": start, "problems": problems,
+               "counts": {key: b - a for key, (a, b) in ranges.items()}, "path": None}
+    if write and not problems:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        np.save(out_dir / "questions.npy", np.concatenate(parts))
+        np.save(out_dir / "prompts.npy", np.frombuffer(b"".join(blobs), dtype="u1"))
+        meta = {"fingerprint": registry_fingerprint(), "topics": list(TOPIC_KEYS), "units": list(TABLE_UNITS),
+                "ranges": ranges}
+        (out_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        summary["path"] = str(out_dir)
+    return summary
+
+
+# ============================================================
+# Lesing (appen)
+# ============================================================
+class QuestionTable:
+    """Skrivebeskyttet, minnekartlagt spørsmålstabell."""
+
+    def __init__(self, path: Path):
+        self.meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        self.rows = np.load(path / "questions.npy", mmap_mode="r")
+        self.prompts = np.load(path / "prompts.npy", mmap_mode="r")
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def counts(self) -> dict:
+        """(tema, nivå) -> antall ulike spørsmål."""
+        out = {}
+        for key, (a, b) in self.meta["ranges"].items():
+            topic, level = key.split(":")
+            out[(topic, int(level))] = b - a
+        return out
+
+    def question(self, i: int) -> dict:
+        row = self.rows[i]
+        start, n = int(row["prompt_start"]), int(row["prompt_len"])
+        q = {"prompt": bytes(self.prompts[start:start + n]).decode("utf-8"), "answer": float(row["answer"]),
+             "unit": self.meta["units"][row["unit"]], "tol": float(row["tol"])}
+        if row["integer"]:
+            q["integer"] = True
+        return q
+
+    def questions(self, topic_key: str, level: int):
+        a, b = self.meta["ranges"].get(f"{topic_key}:{level}", (0, 0))
+        for i in range(a, b):
+            yield self.question(i)
+
+
+def load_question_table(path: Path | None = None) -> QuestionTable | None:
+    """Tabellen hvis den finnes og er laget fra dagens maler, ellers None."""
+    path = Path(path or QUESTION_TABLE_DIR)
+    try:
+        table = QuestionTable(path)
+    except (OSError, ValueError):
+        return None
+    return table if table.meta.get("fingerprint") == registry_fingerprint() else None
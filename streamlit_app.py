@@ -1,12 +1,44 @@
 
+import io
 import math
 from pathlib import Path
-import random
 import time
-import json
 import os
 import streamlit as st
-from PIL import Image
+
+from answers import check_answer
+from arena_questions import generate_question, solution_text
+from curriculum import LEVELS, PASS_CORRECT, QUESTIONS_PER_TOPIC, REQUIRED_TOPICS_PER_LEVEL, TOPICS
+from images import ASSET_DIR, image_bytes
+from progress_io import detect_format, export_bytes, import_records, read_records
+from progress_store import (
+    PROGRESS_FLUSH_INTERVAL,
+    ProgressBackend,
+    ensure_topic_level_state,
+    open_progress_backend,
+    load_class_records,
+    load_student_record,
+    save_student_record,
+)
+from question_bank import QuestionTable, load_question_table
+from vty_tasks import VTY_CASES, VtyCase, VtyTask, vty_tasks
+from units import (
+    AREA_UNITS,
+    LENGTH_UNITS,
+    MASS_UNITS,
+    area_from_m2,
+    area_from_m2_unit,
+    area_to_m2,
+    fmt,
+    from_m,
+    mass_from_kg,
+    mass_to_kg,
+    mm_to_all,
+    to_m,
+    to_mm,
+    volume_from_m3,
+)
+from worksheets import WorksheetJob
 
 try:
     import pandas as pd
@@ -20,14 +52,6 @@ PRO_PRICE_MONTH = 29  # kr per måned (pilot)
 PRO_PRICE_YEAR = 299  # kr per år (pilot)
 TEACHER_CODE = "2150"
 
-# ==========================
-# Lokal lagring (progresjon)
-# ==========================
-DATA_DIR = Path(__file__).parent / "data"
-DATA_DIR.mkdir(exist_ok=True)
-PROGRESS_FILE = DATA_DIR / "progress.json"
-
-
 # ============================================================
 # Streamlit side-oppsett
 # ============================================================
@@ -91,6 +115,9 @@ if "arena_score" not in st.session_state:
 if "arena_taskset" not in st.session_state:
     st.session_state.arena_taskset = {}  # level -> list[task]
 
+# Satt av callbacks i fragmenter (se request_page_rerun). En full kjøring tegner alt på nytt uansett.
+st.session_state.pop("rerun_page", None)
+
 
 def lang() -> str:
     return st.session_state.get("language", "NO")
@@ -100,6 +127,26 @@ def tt(no: str, en: str) -> str:
     return en if lang() == "EN" else no
 
 
+# Knappene endrer tilstand i on_click/on_change-callbacks. Callbacken kjører før neste
+# kjøring av skriptet (eller fragmentet), så ett klikk gir én kjøring, ikke to med st.rerun().
+def go_to(view: str):
+    """on_click for navigasjonsknapper."""
+    st.session_state.view = view
+
+
+def request_page_rerun():
+    """
+    For callbacks i et fragment som endrer noe utenfor fragmentet. Callbacks kan ikke kalle
+    st.rerun(), så fragmentet gjør det selv med rerun_page_if_requested().
+    """
+    st.session_state.rerun_page = True
+
+
+def rerun_page_if_requested():
+    if st.session_state.pop("rerun_page", False):
+        st.rerun()
+
+
 # ============================================================
 # Logo + header
 # ============================================================
@@ -108,13 +155,14 @@ if not LOGO_PATH.exists():
     alt1 = Path(__file__).parent / "logo.png"
     alt2 = Path(__file__).parent / "byggmatte.png"
     LOGO_PATH = alt1 if alt1.exists() else (alt2 if alt2.exists() else LOGO_PATH)
+LOGO_WIDTH = 260
 
 header_left, header_right = st.columns([1.1, 5], gap="small")
 with header_left:
-    try:
-        img = Image.open(LOGO_PATH)
-        st.image(img, width=260)
-    except Exception:
+    logo = image_bytes(LOGO_PATH, LOGO_WIDTH)  # skalert og cachet én gang per prosess (images.py)
+    if logo is not None:
+        st.image(logo, width=LOGO_WIDTH, output_format="PNG")
+    else:
         st.write("")
 
 with header_right:
@@ -141,24 +189,20 @@ st.markdown("<div style='margin-top:-10px;'></div>", unsafe_allow_html=True)
 b1, b2, b3, b4, b5 = st.columns([1.2, 1.7, 1.6, 1.6, 2.2])
 
 with b1:
-    if st.button("🏠 " + tt("Forside", "Front page"), use_container_width=True, key="nav_home"):
-        st.session_state.view = "Forside"
-        st.rerun()
+    st.button("🏠 " + tt("Forside", "Front page"), use_container_width=True, key="nav_home",
+              on_click=go_to, args=("Forside",))
 
 with b2:
-    if st.button("📚 " + tt("Læringsarena", "Learning arena"), use_container_width=True, key="top_nav_arena"):
-        st.session_state.view = "Læringsarena"
-        st.rerun()
+    st.button("📚 " + tt("Læringsarena", "Learning arena"), use_container_width=True, key="top_nav_arena",
+              on_click=go_to, args=("Læringsarena",))
 
 with b3:
-    if st.button("🧾 " + tt("Beregning", "Working"), use_container_width=True, key="nav_working"):
-        st.session_state.view = "Beregning"
-        st.rerun()
+    st.button("🧾 " + tt("Beregning", "Working"), use_container_width=True, key="nav_working",
+              on_click=go_to, args=("Beregning",))
 
 with b4:
-    if st.button("🧮 " + tt("Kalkulatorer", "Calculators"), use_container_width=True, key="top_nav_calcs"):
-        st.session_state.view = "Kalkulatorer"
-        st.rerun()
+    st.button("🧮 " + tt("Kalkulatorer", "Calculators"), use_container_width=True, key="top_nav_calcs",
+              on_click=go_to, args=("Kalkulatorer",))
 
 with b5:
     with st.popover("⚙️ " + tt("Innstillinger", "Settings"), use_container_width=True):
@@ -187,9 +231,8 @@ with b5:
         st.markdown("**" + tt("Oppgradering", "Upgrade") + "**")
         st.caption(tt("Veien til yrkeslivet gir ekstra øving, dokumentasjon og vurderingsstøtte.",
                       "Pro adds extra practice, documentation and assessment support."))
-        if st.button("📜" + tt("Veien til yrkeslivet (BETA)", "The path to professional life (BETA)"), use_container_width=True):
-            st.session_state.view = "VeienTilYrkeslivet_Innhold"
-            st.rerun()
+        st.button("📜" + tt("Veien til yrkeslivet (BETA)", "The path to professional life (BETA)"), use_container_width=True,
+                  on_click=go_to, args=("VeienTilYrkeslivet_Innhold",))
 
 st.divider()
 
@@ -218,156 +261,30 @@ with st.sidebar:
     label_to_view = {label: key for key, label in nav_options}
     chosen_view = label_to_view.get(nav_label, "Forside")
 
+    # Ruteren står lenger ned, så valgt side tegnes allerede i denne kjøringen
     if chosen_view != st.session_state.view:
         st.session_state.view = chosen_view
-        st.rerun()
 
 # ============================================================
-# Hjelpefunksjoner (enheter)
+# Hjelpefunksjoner (enheter ligger i units.py)
 # ============================================================
-LENGTH_UNITS = ["mm", "cm", "m"]
-MASS_UNITS = ["g", "kg", "tonn"]
-AREA_UNITS = ["mm²", "cm²", "m²"]
-
-def to_m(value: float, unit: str) -> float:
-    if unit == "mm":
-        return value / 1000.0
-    if unit == "cm":
-        return value / 100.0
-    return value
-
-def from_m(value_m: float, unit: str) -> float:
-    if unit == "mm":
-        return value_m * 1000.0
-    if unit == "cm":
-        return value_m * 100.0
-    return value_m
-
-
-def to_mm(value: float, unit: str) -> float:
-    """Konverter lengde til millimeter."""
-    return to_m(value, unit) * 1000.0
-
-
-def mm_to_all(mm: float) -> dict:
-    """Hjelpevisning: mm -> mm/cm/m."""
-    return {"mm": mm, "cm": mm / 10.0, "m": mm / 1000.0}
-
-
-def area_from_m2(value_m2: float, unit: str) -> float:
-    if unit == "mm":
-        return value_m2 * (1000.0 ** 2)
-    if unit == "cm":
-        return value_m2 * (100.0 ** 2)
-    return value_m2
-
-def volume_from_m3(value_m3: float, unit: str) -> float:
-    if unit == "mm":
-        return value_m3 * (1000.0 ** 3)
-    if unit == "cm":
-        return value_m3 * (100.0 ** 3)
-    return value_m3
-
-
-
-def mass_to_kg(value: float, unit: str) -> float:
-    """Konverter masse til kilogram."""
-    if unit == "g":
-        return value / 1000.0
-    if unit == "tonn":
-        return value * 1000.0
-    return value
-
-def mass_from_kg(value_kg: float, unit: str) -> float:
-    """Konverter kilogram til ønsket enhet."""
-    if unit == "g":
-        return value_kg * 1000.0
-    if unit == "tonn":
-        return value_kg / 1000.0
-    return value_kg
-
-def area_to_m2(value: float, unit: str) -> float:
-    """Konverter areal til m²."""
-    if unit == "mm²":
-        return value / (1000.0 ** 2)
-    if unit == "cm²":
-        return value / (100.0 ** 2)
-    return value  # m²
-
-def area_from_m2_unit(value_m2: float, unit: str) -> float:
-    """Konverter m² til ønsket arealenhet (mm²/cm²/m²)."""
-    if unit == "mm²":
-        return value_m2 * (1000.0 ** 2)
-    if unit == "cm²":
-        return value_m2 * (100.0 ** 2)
-    return value_m2
-
-
 def render_asset_image(filename: str):
-    assets_dir = Path(__file__).parent / "assets"
-    p = assets_dir / filename
-    if p.exists() and p.is_file() and p.stat().st_size > 0:
-        st.image(str(p), use_container_width=True)
-
-def fmt(x: float) -> str:
-    if abs(x) >= 1000:
-        return f"{x:,.2f}".replace(",", " ")
-    return f"{x:.4g}"
-
+    data = image_bytes(ASSET_DIR / filename)
+    if data is not None:
+        st.image(data, use_container_width=True, output_format="PNG")
 
 # ============================================================
-# Progresjon: lagre/hente per elev-ID (lokal JSON-fil)
+# Progresjon (lagring i progress_store.py)
 # ============================================================
-def load_progress_db() -> dict:
-    if PROGRESS_FILE.exists():
-        try:
-            return json.loads(PROGRESS_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
-
-def save_progress_db(db: dict) -> None:
-    try:
-        PROGRESS_FILE.write_text(json.dumps(db, ensure_ascii=False, indent=2), encoding="utf-8")
-    except Exception:
-        pass
-
-def get_student_record(db: dict, student_id: str) -> dict:
-    return db.get(student_id, {
-        "student_id": student_id,
-        "class_name": "",
-        "global_level": 1,
-        "completed_topics": {},
-        "topics": {},
-        "updated_at": time.time()
-    })
-
-def put_student_record(db: dict, record: dict) -> None:
-    record["updated_at"] = time.time()
-    db[record["student_id"]] = record
-
-LEVELS = [
-    (1, "7. trinn", "Grade 7"),
-    (2, "8. trinn", "Grade 8"),
-    (3, "9. trinn", "Grade 9"),
-    (4, "10. trinn", "Grade 10"),
-    (5, "VG1 (grunnnivå)", "VG1 (foundation)"),
-    (6, "VG2 (videre)", "VG2 (intermediate)"),
-    (7, "VG3 (lærling-nivå)", "VG3 (apprentice level)"),
-]
-
-REQUIRED_TOPICS_PER_LEVEL = 3  # må bestå 3 tema i nivået for å låse opp neste
-
-TOPICS = [
-    ("areal", "Areal", "Area"),
-    ("omkrets", "Omkrets", "Perimeter"),
-    ("vinkler", "Vinkler", "Angles"),
-    ("enheter", "Enhetsomregning", "Unit conversion"),
-    ("volum", "Volum", "Volume"),
-    ("diagonal", "Diagonal", "Diagonal"),
-    ("fall", "Fall", "Slope"),
-    ("prosent", "Prosent", "Percent"),
-]
+@st.cache_resource
+def progress_store() -> ProgressBackend:
+    """Én lagringsbackend per serverprosess (delt cache, samlet skriving, Supabase-klient)."""
+    return open_progress_backend(flush_interval=PROGRESS_FLUSH_INTERVAL)
+
+@st.cache_resource
+def question_table() -> QuestionTable | None:
+    """Forhåndsberegnet spørsmålstabell (byggmatte_cli.py questions), minnekartlagt ved oppstart."""
+    return load_question_table()
 
 def topic_label(topic_key: str) -> str:
     for k, no, en in TOPICS:
@@ -381,246 +298,6 @@ def level_label(level: int) -> str:
             return tt(no, en)
     return str(level)
 
-def ensure_topic_level_state(record: dict, topic_key: str, level: int) -> None:
-    """
-    Lagrer progresjon per tema per globalt nivå:
-    record["topics"][topic_key]["levels"][str(level)] = stats
-    """
-    topics = record.setdefault("topics", {})
-    t = topics.setdefault(topic_key, {"levels": {}})
-    levels = t.setdefault("levels", {})
-    key = str(level)
-    if key not in levels:
-        levels[key] = {
-            "q_index": 0,
-            "correct": 0,
-            "answered": 0,
-            "total_correct": 0,
-            "total_answered": 0,
-            "passed": False,
-        }
-
-def deterministic_rng(student_id: str, topic_key: str, level: int):
-    seed = abs(hash(f"{student_id}:{topic_key}:{level}")) % (2**32)
-    return random.Random(seed)
-
-def generate_question(student_id: str, topic_key: str, level: int, qn: int) -> dict:
-    """
-    10 spørsmål per tema per nivå (qn=0..9).
-    Vokser fra 7. trinn -> VG3 lærling.
-    """
-    rnd = deterministic_rng(student_id, topic_key, level)
-    # deterministisk "shuffle" frem til index
-    for _ in range(qn + 5):
-        rnd.random()
-
-    # Hjelpere for nivåtilpassede tall
-    def pick_len_small():  # barneskole
-        return rnd.choice([2, 3, 4, 5, 6, 7, 8])
-
-    def pick_len_med():  # ungdomsskole
-        return rnd.choice([2.4, 3.0, 3.6, 4.2, 4.8, 5.4, 6.0])
-
-    def pick_len_large():  # vgs/lærling
-        return rnd.choice([6.0, 7.2, 8.4, 9.6, 10.8, 12.0])
-
-    def with_opening(area, level):
-        # VG1+ trekker fra åpning 0.9x2.1
-        if level >= 5 and rnd.random() < 0.5:
-            return max(0.0, area - (0.9 * 2.1)), True
-        return area, False
-
-    if topic_key == "areal":
-        if level <= 2:
-            L = pick_len_small()
-            B = rnd.choice([1, 2, 3, 4, 5])
-            return {"prompt": f"Finn arealet av et rektangel: L={L} m og B={B} m. (m²)",
-                    "answer": L * B, "unit": "m²", "tol": 0.01}
-        if level <= 4:
-            L = pick_len_med()
-            B = rnd.choice([2.0, 2.5, 3.0, 3.5, 4.0])
-            return {"prompt": f"Et rom er {L} m langt og {B} m bredt. Finn gulvarealet (m²).",
-                    "answer": L * B, "unit": "m²", "tol": 0.02}
-        # VG1-VG3: vegg/gulv med åpning og svinn
-        H = rnd.choice([2.4, 2.7, 3.0])
-        L = pick_len_large()
-        area = H * L
-        area2, opening = with_opening(area, level)
-        if opening:
-            return {"prompt": f"En vegg er {L} m lang og {H} m høy. Trekk fra én dør (0,9×2,1 m). Finn nettoareal (m²).",
-                    "answer": area2, "unit": "m²", "tol": 0.05}
-        return {"prompt": f"En vegg er {L} m lang og {H} m høy. Finn arealet (m²).",
-                "answer": area2, "unit": "m²", "tol": 0.05}
-
-    if topic_key == "omkrets":
-        if level <= 2:
-            L = pick_len_small()
-            B = rnd.choice([1, 2, 3, 4, 5])
-            return {"prompt": f"Finn omkretsen av et rektangel: L={L} m og B={B} m. (m)",
-                    "answer": 2 * (L + B), "unit": "m", "tol": 0.01}
-        if level <= 4:
-            L = pick_len_med()
-            B = rnd.choice([2.0, 2.5, 3.0, 3.5])
-            return {"prompt": f"Du skal sette gulvlister rundt et rom {L} m × {B} m. Finn omkrets (m).",
-                    "answer": 2 * (L + B), "unit": "m", "tol": 0.02}
-        # VG1+: løpemeter + svinn
-        L = pick_len_large()
-        B = rnd.choice([3.6, 4.2, 4.8, 5.4])
-        base = 2 * (L + B)
-        if level >= 6:
-            waste = rnd.choice([5, 8, 10])
-            return {"prompt": f"Du skal ha lister rundt et rom {L} m × {B} m. Legg til {waste}% svinn. Hvor mange meter bestiller du?",
-                    "answer": base * (1 + waste/100), "unit": "m", "tol": 0.2}
-        return {"prompt": f"Du skal ha lister rundt et rom {L} m × {B} m. Finn løpemeter (m).",
-                "answer": base, "unit": "m", "tol": 0.05}
-
-    if topic_key == "enheter":
-        # nivåøkning: mer realistiske byggmål og flere steg
-        if level <= 2:
-            val = rnd.choice([10, 25, 50, 120, 250, 500, 1000])
-            return {"prompt": f"Gjør om {val} mm til cm.", "answer": val/10, "unit": "cm", "tol": 0.001}
-        if level <= 4:
-            val = rnd.choice([30, 45, 60, 90, 120, 150, 240])
-            return {"prompt": f"Gjør om {val} cm til meter (m).", "answer": val/100, "unit": "m", "tol": 0.0005}
-        # VG1+: blandede enheter slik elevene møter i verksted
-        choice = rnd.choice([
-            ("mm", "m", rnd.choice([18, 22, 48, 70, 98, 148])),
-            ("m", "mm", rnd.choice([0.6, 1.2, 2.4, 3.6])),
-            ("cm", "mm", rnd.choice([7.3, 9.8, 14.8])),
-            ("mm", "cm", rnd.choice([600, 1200, 2400, 3600])),
-        ])
-        frm, to, val = choice
-        if frm == "mm" and to == "m":
-            ans = val/1000
-        elif frm == "m" and to == "mm":
-            ans = val*1000
-        elif frm == "cm" and to == "mm":
-            ans = val*10
-        else:
-            ans = val/10
-        return {"prompt": f"Gjør om {val} {frm} til {to}.", "answer": ans, "unit": to, "tol": 0.01 if to=="mm" else 0.001}
-
-    if topic_key == "vinkler":
-        # rettvinklet trekant med A (hosliggende) og B (motstående): A, B = C og vinkler
-        if level <= 3:
-            A = rnd.choice([2,3,4,5,6])
-            B = rnd.choice([1,2,3,4])
-            theta = math.degrees(math.atan(B/A))
-            return {"prompt": f"Rettvinklet trekant: A={A} og B={B}. Finn vinkelen θ (grader).",
-                    "answer": theta, "unit": "°", "tol": 0.6}
-        if level <= 5:
-            A = rnd.choice([2.4, 3.0, 3.6, 4.2])
-            theta = rnd.choice([15, 20, 25, 30, 35, 40, 45])
-            B = A * math.tan(math.radians(theta))
-            return {"prompt": f"Du skal lage skråavstivning. A={A} m og θ={theta}°. Finn B (m).",
-                    "answer": B, "unit": "m", "tol": 0.05}
-        # VG2/VG3: takvinkel/utstikk (mer realistiske tall)
-        run = rnd.choice([3.6, 4.2, 4.8, 5.4])
-        rise = rnd.choice([1.2, 1.5, 1.8, 2.1])
-        theta = math.degrees(math.atan(rise/run))
-        return {"prompt": f"Tak: horisontal lengde (A)={run} m og høyde (B)={rise} m. Finn takvinkel θ (grader).",
-                "answer": theta, "unit": "°", "tol": 0.6}
-
-    if topic_key == "diagonal":
-        if level <= 3:
-            a = rnd.choice([3,4,5,6])
-            b = rnd.choice([4,5,6,7,8])
-            return {"prompt": f"Finn diagonal C når A={a} og B={b}. (C = √(A²+B²))",
-                    "answer": math.sqrt(a*a+b*b), "unit": "", "tol": 0.1}
-        if level <= 5:
-            a = rnd.choice([1.2, 2.4, 3.6, 4.8])
-            b = rnd.choice([1.6, 2.0, 3.2, 4.0])
-            return {"prompt": f"Ramme: A={a} m og B={b} m. Finn diagonal C (m) for å sjekke vinkel.",
-                    "answer": math.sqrt(a*a+b*b), "unit": "m", "tol": 0.03}
-        # VG2/VG3: 3-4-5 skalert
-        k = rnd.choice([1.0, 1.5, 2.0, 2.5])
-        a = 3*k; b = 4*k; c = 5*k
-        ask = rnd.choice(["c", "a", "b"])
-        if ask == "c":
-            return {"prompt": f"Kontrollmål: A={a} m og B={b} m. Hva skal C være (m) for rett vinkel?",
-                    "answer": c, "unit": "m", "tol": 0.05}
-        if ask == "a":
-            return {"prompt": f"Kontrollmål: C={c} m og B={b} m. Hva skal A være (m)?",
-                    "answer": a, "unit": "m", "tol": 0.05}
-        return {"prompt": f"Kontrollmål: C={c} m og A={a} m. Hva skal B være (m)?",
-                "answer": b, "unit": "m", "tol": 0.05}
-
-    if topic_key == "volum":
-        if level <= 3:
-            L = rnd.choice([2,3,4,5])
-            B = rnd.choice([1,2,3])
-            H = rnd.choice([1,2,3])
-            return {"prompt": f"Finn volum: L={L}, B={B}, H={H}. (V=L×B×H)",
-                    "answer": L*B*H, "unit": "", "tol": 0.01}
-        if level <= 5:
-            L = rnd.choice([2.4, 3.6, 4.8, 6.0])
-            B = rnd.choice([1.2, 2.4, 3.0])
-            t = rnd.choice([0.05, 0.08, 0.10])
-            return {"prompt": f"Betongplate: {L} m × {B} m × {t} m. Finn volum (m³).",
-                    "answer": L*B*t, "unit": "m³", "tol": 0.01}
-        # VG2/VG3: tykkelse i mm
-        L = rnd.choice([6.0, 7.2, 8.4])
-        B = rnd.choice([2.4, 3.0, 3.6])
-        tmm = rnd.choice([80, 100, 120, 150])
-        return {"prompt": f"Plate: {L} m × {B} m × {tmm} mm. Finn volum (m³).",
-                "answer": L*B*(tmm/1000), "unit": "m³", "tol": 0.02}
-
-    if topic_key == "fall":
-        if level <= 3:
-            fall_cm = rnd.choice([2,3,4,5,6])
-            lengde_m = rnd.choice([2,3,4,5])
-            fall_m = fall_cm/100
-            return {"prompt": f"Fall er {fall_cm} cm over {lengde_m} m. Finn fall i %.",
-                    "answer": (fall_m/lengde_m)*100, "unit": "%", "tol": 0.2}
-        if level <= 5:
-            fall_mm_per_m = rnd.choice([10, 15, 20, 25])
-            lengde_m = rnd.choice([2.0, 3.0, 4.0, 5.0])
-            fall_mm = fall_mm_per_m*lengde_m
-            return {"prompt": f"Du har fall {fall_mm_per_m} mm per meter over {lengde_m} m. Hvor mange mm fall totalt?",
-                    "answer": fall_mm, "unit": "mm", "tol": 1.0}
-        # VG2/VG3: fall i % -> mm
-        pct = rnd.choice([1.0, 1.5, 2.0, 2.5])
-        lengde_m = rnd.choice([3.0, 4.0, 5.0, 6.0])
-        fall_mm = (pct/100)*lengde_m*1000
-        return {"prompt": f"Prosjekt: Fall {pct}% over {lengde_m} m. Hvor mange mm fall blir det?",
-                "answer": fall_mm, "unit": "mm", "tol": 2.0}
-
-    if topic_key == "prosent":
-        if level <= 3:
-            base = rnd.choice([50, 80, 100, 120, 200])
-            p = rnd.choice([10, 20, 25, 50])
-            return {"prompt": f"Hva er {p}% av {base}?",
-                    "answer": (p/100)*base, "unit": "", "tol": 0.2}
-        if level <= 5:
-            qty = rnd.choice([20, 25, 30, 40, 50])
-            waste = rnd.choice([5, 10, 12, 15])
-            return {"prompt": f"Du trenger {qty} stk. Legg til {waste}% svinn. Hvor mange bestiller du? (avrund opp)",
-                    "answer": math.ceil(qty*(1+waste/100)), "unit": "stk", "tol": 0.0, "integer": True}
-        # VG2/VG3: prisendring
-        old = rnd.choice([1200, 1500, 2000, 2500, 3200])
-        change = rnd.choice([8, 10, 12, 15, 20])
-        direction = rnd.choice(["opp", "ned"])
-        if direction == "opp":
-            return {"prompt": f"En vare koster {old} kr. Prisøkning {change}%. Hva er ny pris?",
-                    "answer": old*(1+change/100), "unit": "kr", "tol": 1.0}
-        return {"prompt": f"En vare koster {old} kr. Rabatt {change}%. Hva er ny pris?",
-                "answer": old*(1-change/100), "unit": "kr", "tol": 1.0}
-
-    return {"prompt": "(mangler)", "answer": 0.0, "unit": "", "tol": 0.0}
-
-def check_answer(user_text: str, q: dict):
-    try:
-        s = (user_text or "").strip().replace(",", ".")
-        if s == "":
-            return False, None
-        if q.get("integer"):
-            v = int(float(s))
-        else:
-            v = float(s)
-        ok = abs(v - float(q["answer"])) <= float(q.get("tol", 0.0))
-        return ok, v
-    except Exception:
-        return False, None
 
 # ============================================================
 # FORSIDE
@@ -689,13 +366,11 @@ You use math to:
             st.write(tt("Velg hva du vil gjøre nå:", "Choose what you want to do now:"))
             c1, c2 = st.columns(2)
             with c1:
-                if st.button("📚 " + tt("Læringsarena", "Learning arena"), use_container_width=True, key="front_nav_arena"):
-                    st.session_state.view = "Læringsarena"
-                    st.rerun()
+                st.button("📚 " + tt("Læringsarena", "Learning arena"), use_container_width=True, key="front_nav_arena",
+                          on_click=go_to, args=("Læringsarena",))
             with c2:
-                if st.button("🧮 " + tt("Kalkulatorer", "Calculators"), use_container_width=True, key="front_nav_calcs"):
-                    st.session_state.view = "Kalkulatorer"
-                    st.rerun()
+                st.button("🧮 " + tt("Kalkulatorer", "Calculators"), use_container_width=True, key="front_nav_calcs",
+                          on_click=go_to, args=("Kalkulatorer",))
 
             st.divider()
             st.markdown("**" + tt("Huskeliste før du regner", "Checklist before you calculate") + "**")
@@ -720,20 +395,19 @@ def formula_block(title: str, formulas: list[str], notes: list[str] | None = Non
             for n in notes:
                 st.markdown(f"- {n}")
 
+@st.fragment
 def verification_calculator(kind: str, key_prefix: str | None = None):
     """Enkle kontrollkalkulatorer knyttet til tema.
 
     Viktig: Streamlit krever unike widget-keys når samme type widget kan dukke opp flere steder
-    (forside + faner + læringsarena). Derfor bruker vi key_prefix.
+    (forside + faner + læringsarena). Derfor bruker vi key_prefix, én per sted kalkulatoren står.
+    Kalkulatoren er et fragment: "Beregn" kjører bare kalkulatoren på nytt, så nøklene må være
+    de samme fra kjøring til kjøring.
     """
     if not st.session_state.show_calculators:
         st.info(tt("Ønsker du kontrollkalkulator her? Slå på i ⚙️ Innstillinger.", "Enable verification calculators in ⚙️ Settings."))
         return
-    # Make widget keys unique per render instance (prevents StreamlitDuplicateElementKey in tabs)
-    _uid = st.session_state.get('_vc_uid', 0)
-    st.session_state['_vc_uid'] = _uid + 1
-    _base = key_prefix or f"vc_{kind}"
-    kp = f"{_base}_{_uid}"
+    kp = key_prefix or f"vc_{kind}"
     st.markdown("#### " + tt("Kontrollkalkulator", "Verification calculator"))
 
     if kind == "unit":
@@ -1007,88 +681,32 @@ def cladding_calculator():
 
 
 # ============================================================
-# ØVINGSOPPGAVER (nivåbasert)
+# ØVINGSOPPGAVER (nivåbasert, make_tasks ligger i arena_questions.py)
 # ============================================================
-def make_tasks(level: int):
-    rnd = random.Random(1000 + level)  # stabilt sett per nivå
-
-    tasks = []
-    # nivå 1: enkle rektangel (areal/omkrets)
-    if level == 1:
-        for _ in range(5):
-            L = rnd.choice([2, 3, 4, 5, 6, 7])
-            B = rnd.choice([1, 1.5, 2, 2.5, 3])
-            task_type = rnd.choice(["area", "perimeter"])
-            if task_type == "area":
-                tasks.append({
-                    "topic": "Areal",
-                    "prompt": f"Et gulv er {L} m langt og {B} m bredt. Finn arealet i m².",
-                    "answer": L * B,
-                    "unit": "m²",
-                    "tolerance": 0.01,
-                })
-            else:
-                tasks.append({
-                    "topic": "Omkrets",
-                    "prompt": f"En ramme er {L} m × {B} m. Finn omkretsen i meter.",
-                    "answer": 2 * (L + B),
-                    "unit": "m",
-                    "tolerance": 0.01,
-                })
-
-    # nivå 2: volum + prosent (svinn)
-    elif level == 2:
-        for _ in range(5):
-            t = rnd.choice(["volume", "waste"])
-            if t == "volume":
-                L = rnd.choice([2, 3, 4, 5])
-                B = rnd.choice([1.5, 2, 2.5, 3])
-                H = rnd.choice([0.05, 0.08, 0.1, 0.12, 0.15])
-                tasks.append({
-                    "topic": "Volum",
-                    "prompt": f"En plate/flate er {L} m × {B} m med tykkelse {H} m. Finn volumet i m³.",
-                    "answer": L * B * H,
-                    "unit": "m³",
-                    "tolerance": 0.001,
-                })
-            else:
-                qty = rnd.choice([20, 25, 30, 40, 50])
-                waste = rnd.choice([10, 12, 15])
-                tasks.append({
-                    "topic": "Prosent",
-                    "prompt": f"Du trenger {qty} stk. Legg til {waste}% svinn. Hvor mange bør du bestille? (avrund opp til helt tall)",
-                    "answer": math.ceil(qty * (1 + waste/100)),
-                    "unit": "stk",
-                    "tolerance": 0.0,
-                    "integer": True
-                })
-
-    # nivå 3: diagonal + fall
-    else:
-        for _ in range(5):
-            t = rnd.choice(["diag", "slope"])
-            if t == "diag":
-                a = rnd.choice([1.2, 1.5, 2.0, 2.5, 3.0])
-                b = rnd.choice([1.6, 2.0, 2.4, 3.2, 4.0])
-                tasks.append({
-                    "topic": "Diagonal",
-                    "prompt": f"En rektangulær ramme har sider a={a} m og b={b} m. Finn diagonal c i meter (2 desimaler).",
-                    "answer": math.sqrt(a*a + b*b),
-                    "unit": "m",
-                    "tolerance": 0.02,
-                })
-            else:
-                fall_m = rnd.choice([0.04, 0.06, 0.08, 0.1])
-                lengde_m = rnd.choice([2.0, 3.0, 4.0, 5.0])
-                tasks.append({
-                    "topic": "Fall",
-                    "prompt": f"Det er fall {fall_m} m over lengde {lengde_m} m. Finn fall i % (2 desimaler).",
-                    "answer": (fall_m/lengde_m)*100,
-                    "unit": "%",
-                    "tolerance": 0.05,
-                })
+def worksheet_job_status():
+    """Status for arbeidsark-eksporten. Oppdaterer seg selv hvert sekund mens den kjører."""
+    job = st.session_state.get("arena_ws_job")
+    if job is None:
+        return
+
+    polling = job.running  # run_every bestemmes bare når hele siden kjøres
+
+    @st.fragment(run_every=1.0 if polling else None)
+    def status():
+        if polling and not job.running:
+            st.rerun()  # hele siden, én gang: slår av run_every og viser nedlastingen
+        if job.running:
+            st.progress(job.done / max(1, job.total), text=tt(f"Lager arbeidsark … {job.done}/{job.total}",
+                                                               f"Creating worksheets … {job.done}/{job.total}"))
+        elif job.error is not None:
+            st.error(tt(f"Eksporten feilet: {job.error}", f"Export failed: {job.error}"))
+        elif job.result is not None:
+            st.download_button(tt(f"Last ned arbeidsark og fasit ({job.total} elever, zip)",
+                                  f"Download worksheets and answer key ({job.total} students, zip)"),
+                               data=job.result.read_bytes, file_name=job.result.name, mime="application/zip",
+                               key="arena_ws_download")
 
-    return tasks
+    status()
 
 
 def arena_tasks_ui():
@@ -1098,7 +716,7 @@ def arena_tasks_ui():
         "Choose which formulas/topics to practice. When you pass enough topics in a level, you unlock the next level."
     ))
 
-    db = load_progress_db()
+    store = progress_store()
 
     with st.container(border=True):
         c1, c2, c3 = st.columns([1.2, 1.4, 1.4])
@@ -1121,9 +739,8 @@ def arena_tasks_ui():
         st.success(tt("Lærermodus aktiv.", "Teacher mode enabled."))
         st.markdown("#### " + tt("Læreroversikt (progresjon)", "Teacher overview (progress)"))
         records = []
-        for sid, rec in db.items():
-            if class_name and rec.get("class_name","") != class_name:
-                continue
+        class_records = load_class_records(class_name, store)
+        for sid, rec in class_records.items():
             glv = int(rec.get("global_level", 1))
             comp = rec.get("completed_topics", {}).get(str(glv), [])
             row = {
@@ -1145,6 +762,82 @@ def arena_tasks_ui():
                 st.write(r)
         else:
             st.info(tt("Ingen elever lagret ennå for valgt klasse.", "No saved students yet for selected class."))
+
+        with st.expander(tt("Import / eksport (CSV eller JSON Lines)", "Import / export (CSV or JSON Lines)")):
+            st.caption(tt(
+                "Elevliste: CSV med kolonnene Elev-ID og Klasse (evt. Nivå). Eksisterende progresjon beholdes.",
+                "Roster: CSV with columns Elev-ID and Klasse (optionally Nivå). Existing progress is kept."
+            ))
+            upload = st.file_uploader(tt("Fil å importere", "File to import"), type=["csv", "jsonl", "ndjson", "txt"],
+                                      key="arena_import_file")
+            if upload is not None and st.button(tt("Importer", "Import"), key="arena_import_btn"):
+                errors = []
+                try:
+                    lines = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+                    n = import_records(read_records(lines, detect_format(upload.name), errors), store)
+                    st.success(tt(f"Importerte {n} elever.", f"Imported {n} students."))
+                except Exception as e:
+                    st.error(tt(f"Kunne ikke importere: {e}", f"Could not import: {e}"))
+                if errors:
+                    st.warning(tt(f"Hoppet over {len(errors)} ugyldige celler/linjer:",
+                                  f"Skipped {len(errors)} invalid cells/lines:")
+                               + "\n\n" + "\n".join(f"- {e}" for e in errors[:20])
+                               + ("\n- …" if len(errors) > 20 else ""))
+            if not class_name:
+                st.caption(tt(
+                    "Velg en klasse for å laste ned progresjonen. Hele skolen eksporteres med "
+                    "`python byggmatte_cli.py export skole.jsonl`.",
+                    "Choose a class to download progress. Export the whole school with "
+                    "`python byggmatte_cli.py export school.jsonl`."
+                ))
+            else:
+                e1, e2 = st.columns(2)
+                with e1:
+                    st.download_button(
+                        tt(f"Last ned CSV ({class_name})", f"Download CSV ({class_name})"),
+                        data=lambda: export_bytes("csv", store, class_name),
+                        file_name=f"progresjon-{class_name}.csv", mime="text/csv",
+                        key="arena_export_csv",
+                    )
+                with e2:
+                    st.download_button(
+                        tt(f"Last ned JSON Lines ({class_name})", f"Download JSON Lines ({class_name})"),
+                        data=lambda: export_bytes("jsonl", store, class_name),
+                        file_name=f"progresjon-{class_name}.jsonl", mime="application/x-ndjson",
+                        key="arena_export_jsonl",
+                    )
+
+        with st.expander(tt("Arbeidsark og fasit (utskrift)", "Worksheets and answer key (print)")):
+            w1, w2 = st.columns([1.2, 1.0])
+            with w1:
+                ws_level = st.selectbox(tt("Nivå", "Level"), [lv for lv, _, _ in LEVELS], format_func=level_label,
+                                        key="arena_ws_level")
+            with w2:
+                ws_legacy = st.checkbox(tt("Ta med fast øvingssett", "Include fixed practice set"), value=True,
+                                        key="arena_ws_legacy")
+            job = st.session_state.get("arena_ws_job")
+            busy = job is not None and job.running
+            if st.button(tt(f"Lag arbeidsark for {len(class_records)} elever", f"Create worksheets for {len(class_records)} students"),
+                         key="arena_ws_start", disabled=busy or not class_records):
+                students = [(sid, rec.get("class_name", "")) for sid, rec in class_records.items()]
+                st.session_state.arena_ws_job = WorksheetJob(students, ws_level, include_legacy=ws_legacy).start()
+            worksheet_job_status()
+
+        with st.expander(tt("Spørsmålsbank", "Question bank")):
+            table = question_table()
+            if table is None:
+                st.info(tt("Ingen validert spørsmålstabell. Kjør `python byggmatte_cli.py questions` og start appen på nytt.",
+                           "No validated question table. Run `python byggmatte_cli.py questions` and restart the app."))
+            else:
+                counts = table.counts()
+                st.caption(tt(f"{len(table)} ulike spørsmål, alle kontrollert mot fasit.",
+                              f"{len(table)} distinct questions, all checked against the answer key."))
+                bank = [{tt("Tema", "Topic"): topic_label(k),
+                         **{str(lv): counts.get((k, lv), 0) for lv, _, _ in LEVELS}} for k, _, _ in TOPICS]
+                if pd is not None:
+                    st.dataframe(pd.DataFrame(bank), use_container_width=True, hide_index=True)
+                else:
+                    st.write(bank)
         st.divider()
 
     if not student_id:
@@ -1152,12 +845,12 @@ def arena_tasks_ui():
         return
 
     # Hent elev
-    rec = get_student_record(db, student_id)
+    rec = load_student_record(student_id, store)
     if class_name:
         rec["class_name"] = class_name
     rec.setdefault("global_level", 1)
     rec.setdefault("completed_topics", {})
-    put_student_record(db, rec); save_progress_db(db)
+    save_student_record(rec, store)  # skrives bare hvis klassen faktisk ble endret
 
     global_level = int(rec.get("global_level", 1))
     global_level = max(1, min(7, global_level))
@@ -1177,12 +870,71 @@ def arena_tasks_ui():
     st.divider()
     st.markdown("#### " + tt("Velg hva du vil øve på", "Choose what to practice"))
 
-    # --- Tema som faner (eleven velger selv) ---
+    # --- Temavalg (eleven velger selv). Bare valgt tema lages og tegnes; med st.tabs
+    # ville alle 8 temaene fått spørsmål, knapper og lagring ved hver rerun. ---
     topic_keys = [k for k,_,_ in TOPICS]
-    topic_titles = [topic_label(k) for k in topic_keys]
-    tabs = st.tabs(topic_titles)
-
+    if hasattr(st, "segmented_control"):
+        topic_key = st.segmented_control(tt("Tema", "Topic"), topic_keys, format_func=topic_label,
+                                         default=topic_keys[0], key="arena_topic", label_visibility="collapsed")
+    else:
+        topic_key = st.radio(tt("Tema", "Topic"), topic_keys, format_func=topic_label, horizontal=True,
+                             key="arena_topic", label_visibility="collapsed")
+    topic_key = topic_key or topic_keys[0]  # segmented_control kan velges bort (None)
+
+    # Callbacks for knappene i temaet. Hele siden kjøres på nytt bare når noe utenfor temaet
+    # endres (beståtte tema i nivået, nytt nivå); ellers bare fragmentet.
+    def record_pass(topic_key: str):
+        rec["topics"][topic_key]["levels"][str(global_level)]["passed"] = True
+        comp = rec.setdefault("completed_topics", {}).setdefault(str(global_level), [])
+        if topic_key not in comp:
+            comp.append(topic_key)
+        save_student_record(rec, store)
+
+    def answer_task(topic_key: str, q_index: int, q: dict | None):
+        """Sjekk (med q) eller Pass (q=None): registrer svaret og gå til neste oppgave."""
+        t = rec["topics"][topic_key]["levels"][str(global_level)]
+        ok = q is not None and check_answer(st.session_state.get(f"arena_answer_{topic_key}", ""), q)[0]
+        t["answered"] = int(t.get("answered", 0)) + 1
+        t["total_answered"] = int(t.get("total_answered", 0)) + 1
+        if ok:
+            t["correct"] = int(t.get("correct", 0)) + 1
+            t["total_correct"] = int(t.get("total_correct", 0)) + 1
+        if q is not None:
+            st.toast(tt("Riktig ✔️", "Correct ✔️") if ok else
+                     tt("Ikke helt. Du kan prøve igjen senere i neste runde.", "Not quite. You can try again later."))
+        t["q_index"] = min(9, q_index + 1)
+        save_student_record(rec, store)
+        st.session_state[f"arena_last_{topic_key}"] = {"key": (student_id, global_level), "qn": q_index, "ok": ok}
+        if t["answered"] >= QUESTIONS_PER_TOPIC:
+            if int(t.get("correct", 0)) >= PASS_CORRECT:
+                record_pass(topic_key)  # før nivåoversikten tegnes
+            request_page_rerun()
+
+    def restart_topic(topic_key: str):
+        t = rec["topics"][topic_key]["levels"][str(global_level)]
+        rec["topics"][topic_key]["levels"][str(global_level)] = {
+            "q_index": 0, "correct": 0, "answered": 0,
+            "total_correct": int(t.get("total_correct",0)),
+            "total_answered": int(t.get("total_answered",0)),
+            "passed": False,
+        }
+        comp = rec.get("completed_topics", {}).get(str(global_level), [])
+        if topic_key in comp:
+            comp.remove(topic_key)
+            rec["completed_topics"][str(global_level)] = comp
+            request_page_rerun()
+        save_student_record(rec, store)
+        st.session_state.pop(f"arena_last_{topic_key}", None)
+
+    def advance_level():
+        rec["global_level"] = global_level + 1
+        save_student_record(rec, store)
+        request_page_rerun()
+
+    # Temaet er et fragment: Sjekk/Pass kjører bare temaet på nytt.
+    @st.fragment
     def render_topic(topic_key: str, pick_label: str):
+        rerun_page_if_requested()
         ensure_topic_level_state(rec, topic_key, global_level)
         t = rec["topics"][topic_key]["levels"][str(global_level)]
 
@@ -1190,68 +942,50 @@ def arena_tasks_ui():
         q_index = max(0, min(9, q_index))
         q = generate_question(student_id, topic_key, global_level, q_index)
 
+        # Mellomregning for forrige oppgave hvis den var feil eller ble hoppet over
+        last = st.session_state.get(f"arena_last_{topic_key}")
+        if last and last["key"] == (student_id, global_level) and not last["ok"]:
+            with st.expander(tt(f"Løsning på oppgave {last['qn'] + 1}", f"Solution to task {last['qn'] + 1}")):
+                st.code(solution_text(student_id, topic_key, global_level, last["qn"]), language="text")
+
         with st.container(border=True):
             st.markdown(f"### {tt('Oppgave', 'Task')} {q_index+1}/10 · {pick_label}")
             st.write(q["prompt"])
-            ans = st.text_input(tt("Ditt svar", "Your answer"), key=f"arena_answer_{topic_key}", placeholder=q.get("unit",""))
+            st.text_input(tt("Ditt svar", "Your answer"), key=f"arena_answer_{topic_key}", placeholder=q.get("unit",""),
+                                help=tt("Tall eller regnestykke, gjerne med enhet, f.eks. 3,6*4,2, sqrt(3^2+4^2) eller 130 mm.",
+                                        "A number or a calculation, optionally with a unit, e.g. 3,6*4,2, sqrt(3^2+4^2) or 130 mm."))
 
             cA, cB, cC = st.columns([1.0, 1.0, 2.0])
             with cA:
-                if st.button(tt("Sjekk", "Check"), key=f"arena_check_{topic_key}_{global_level}_{q_index}", use_container_width=True):
-                    ok, _ = check_answer(ans, q)
-                    t["answered"] = int(t.get("answered", 0)) + 1
-                    t["total_answered"] = int(t.get("total_answered", 0)) + 1
-                    if ok:
-                        t["correct"] = int(t.get("correct", 0)) + 1
-                        t["total_correct"] = int(t.get("total_correct", 0)) + 1
-                        st.success(tt("Riktig ✔️", "Correct ✔️"))
-                    else:
-                        st.error(tt("Ikke helt. Du kan prøve igjen senere i neste runde.", "Not quite. You can try again later."))
-
-                    t["q_index"] = min(9, q_index + 1)
-                    rec["topics"][topic_key]["levels"][str(global_level)] = t
-                    put_student_record(db, rec); save_progress_db(db)
-                    st.rerun()
+                st.button(tt("Sjekk", "Check"), key=f"arena_check_{topic_key}_{global_level}_{q_index}", use_container_width=True,
+                          on_click=answer_task, args=(topic_key, q_index, q))
 
             with cB:
-                if st.button(tt("Pass", "Pass"), key=f"arena_pass_{topic_key}_{global_level}_{q_index}", use_container_width=True):
-                    t["answered"] = int(t.get("answered", 0)) + 1
-                    t["total_answered"] = int(t.get("total_answered", 0)) + 1
-                    t["q_index"] = min(9, q_index + 1)
-                    rec["topics"][topic_key]["levels"][str(global_level)] = t
-                    put_student_record(db, rec); save_progress_db(db)
-                    st.rerun()
+                st.button(tt("Pass", "Pass"), key=f"arena_pass_{topic_key}_{global_level}_{q_index}", use_container_width=True,
+                          on_click=answer_task, args=(topic_key, q_index, None))
 
             with cC:
                 # Fasit kun for lærer (kode tastes inn ved behov)
                 if teacher_mode:
                     if st.toggle(tt("Vis fasit", "Show answer"), key=f"arena_show_{topic_key}_{global_level}_{q_index}"):
                         st.info(f"{tt('Fasit', 'Answer')}: {fmt(q['answer'])} {q.get('unit','')}".strip())
+                        st.code(solution_text(student_id, topic_key, global_level, q_index), language="text")
 
         st.metric(tt("Riktige", "Correct"), f"{t.get('correct',0)} / 10")
         st.metric(tt("Besvart", "Answered"), f"{t.get('answered',0)} / 10")
 
-        finished = int(t.get("answered", 0)) >= 10
+        finished = int(t.get("answered", 0)) >= QUESTIONS_PER_TOPIC
         if finished:
-            if int(t.get("correct", 0)) >= 8:
+            if int(t.get("correct", 0)) >= PASS_CORRECT:
                 st.success(tt("Tema bestått på dette nivået!", "Topic passed on this level!"))
-                t["passed"] = True
-                comp = rec.setdefault("completed_topics", {}).setdefault(str(global_level), [])
-                if topic_key not in comp:
-                    comp.append(topic_key)
-                rec["completed_topics"][str(global_level)] = comp
-                rec["topics"][topic_key]["levels"][str(global_level)] = t
-                put_student_record(db, rec); save_progress_db(db)
+                record_pass(topic_key)
 
                 comp = rec.get("completed_topics", {}).get(str(global_level), [])
                 if len(comp) >= REQUIRED_TOPICS_PER_LEVEL:
                     st.success(tt("Du har bestått nok tema til å gå videre!", "You passed enough topics to advance!"))
                     if global_level < 7:
-                        if st.button(tt("➡️ Gå til neste nivå", "➡️ Go to next level"),
-                                     key=f"arena_advance_{global_level}", use_container_width=True):
-                            rec["global_level"] = global_level + 1
-                            put_student_record(db, rec); save_progress_db(db)
-                            st.rerun()
+                        st.button(tt("➡️ Gå til neste nivå", "➡️ Go to next level"),
+                                  key=f"arena_advance_{global_level}", use_container_width=True, on_click=advance_level)
                     else:
                         st.balloons()
                         st.success(tt("Du er på VG3/lærling-nivå. Sterkt jobba!", "You are at VG3/apprentice level. Great work!"))
@@ -1259,25 +993,11 @@ def arena_tasks_ui():
                 st.warning(tt("Du fikk ikke nok riktige for å bestå temaet. Start temaet på nytt.",
                               "Not enough correct to pass the topic. Restart the topic."))
 
-        if st.button(tt("🔁 Start tema på nytt (dette nivået)", "🔁 Restart topic (this level)"),
-                     key=f"arena_restart_{topic_key}_{global_level}", use_container_width=True):
-            rec["topics"].setdefault(topic_key, {"levels": {}})
-            rec["topics"][topic_key]["levels"][str(global_level)] = {
-                "q_index": 0, "correct": 0, "answered": 0,
-                "total_correct": int(t.get("total_correct",0)),
-                "total_answered": int(t.get("total_answered",0)),
-                "passed": False,
-            }
-            comp = rec.get("completed_topics", {}).get(str(global_level), [])
-            if topic_key in comp:
-                comp.remove(topic_key)
-                rec["completed_topics"][str(global_level)] = comp
-            put_student_record(db, rec); save_progress_db(db)
-            st.rerun()
+        st.button(tt("🔁 Start tema på nytt (dette nivået)", "🔁 Restart topic (this level)"),
+                  key=f"arena_restart_{topic_key}_{global_level}", use_container_width=True,
+                  on_click=restart_topic, args=(topic_key,))
 
-    for i, (topic_key, tab) in enumerate(zip(topic_keys, tabs)):
-        with tab:
-            render_topic(topic_key, topic_titles[i])
+    render_topic(topic_key, topic_label(topic_key))
 
 
 def formula_bank_ui():
@@ -1388,7 +1108,7 @@ def formula_bank_ui():
             ],
         )
         render_asset_image("vinkler.png")
-        verification_calculator("diagonal", key_prefix="arena_diagonal")
+        verification_calculator("diagonal", key_prefix="arena_trig_diagonal")
         angle_calculator()
 
     with st.expander("📐 " + tt("Målestokk", "Scale"), expanded=False):
@@ -1490,93 +1210,96 @@ def guess_formula_ui():
     if "gf_deadline" not in st.session_state:
         st.session_state.gf_deadline = None
 
+    # Callbacks. Start og Nullstill slår nedtellingen (run_every) av og på, og det krever at
+    # hele siden kjøres; resten kjører bare spillet på nytt.
     def reset_game():
         st.session_state.gf_stage = "setup"
         st.session_state.gf_index = 0
         st.session_state.gf_score = {"p1": 0, "p2": 0}
         st.session_state.gf_deadline = None
+        request_page_rerun()
 
-    with st.container(border=True):
-        c1, c2, c3 = st.columns([1.3, 1.3, 1.4])
-        with c1:
-            if st.button("▶️ " + tt("Start", "Start"), use_container_width=True, key="gf_start"):
-                st.session_state.gf_stage = "p1"
-                st.session_state.gf_index = 0
-                st.session_state.gf_deadline = time.time() + 20
-                st.rerun()
-        with c2:
-            if st.button("🔁 " + tt("Nullstill", "Reset"), use_container_width=True, key="gf_reset"):
-                reset_game()
-                st.rerun()
-        with c3:
-            st.markdown(f"**{tt('Poeng', 'Score')}:** {st.session_state.gf_score['p1']} - {st.session_state.gf_score['p2']}")
-
-    stage = st.session_state.gf_stage
-    if stage == "setup":
-        st.info(tt("Trykk Start. Spiller 1 får 15 kort først, deretter spiller 2.",
-                   "Press Start. Player 1 gets 15 cards first, then Player 2."))
-        return
+    def start_player(stage: str):
+        st.session_state.gf_stage = stage
+        st.session_state.gf_index = 0
+        st.session_state.gf_deadline = time.time() + 20
+        if stage == "p1":
+            request_page_rerun()
+
+    def next_card(point: bool):
+        stage = st.session_state.gf_stage
+        if point:
+            st.session_state.gf_score[stage] += 1
+        st.session_state.gf_index += 1
+        st.session_state.gf_deadline = time.time() + 20
+        if stage == "p2" and st.session_state.gf_index >= 15:
+            st.session_state.gf_stage = "done"
+            request_page_rerun()
+
+    # Spillet er et fragment: Riktig/Pass kjører bare spillet på nytt, og mens et kort vises
+    # tikker nedtellingen hvert sekund uten at resten av siden kjøres.
+    @st.fragment(run_every=1.0 if st.session_state.gf_stage in ("p1", "p2") else None)
+    def game():
+        rerun_page_if_requested()
+        with st.container(border=True):
+            c1, c2, c3 = st.columns([1.3, 1.3, 1.4])
+            with c1:
+                st.button("▶️ " + tt("Start", "Start"), use_container_width=True, key="gf_start",
+                          on_click=start_player, args=("p1",))
+            with c2:
+                st.button("🔁 " + tt("Nullstill", "Reset"), use_container_width=True, key="gf_reset", on_click=reset_game)
+            with c3:
+                st.markdown(f"**{tt('Poeng', 'Score')}:** {st.session_state.gf_score['p1']} - {st.session_state.gf_score['p2']}")
+
+        stage = st.session_state.gf_stage
+        if stage == "setup":
+            st.info(tt("Trykk Start. Spiller 1 får 15 kort først, deretter spiller 2.",
+                       "Press Start. Player 1 gets 15 cards first, then Player 2."))
+            return
+        if stage == "done":
+            st.markdown("### " + tt("Resultat", "Result"))
+            st.success(f"{tt('Spiller 1', 'Player 1')}: {st.session_state.gf_score['p1']}  ·  {tt('Spiller 2', 'Player 2')}: {st.session_state.gf_score['p2']}")
+            return
 
-    deck = cards if stage == "p1" else opponent
-    player_label = tt("Spiller 1", "Player 1") if stage == "p1" else tt("Spiller 2", "Player 2")
-    idx = int(st.session_state.gf_index)
+        deck = cards if stage == "p1" else opponent
+        player_label = tt("Spiller 1", "Player 1") if stage == "p1" else tt("Spiller 2", "Player 2")
+        idx = int(st.session_state.gf_index)
 
-    if idx >= 15:
-        if stage == "p1":
+        if idx >= 15:  # spiller 2 går rett til "done" i next_card
             st.success(tt("Spiller 1 ferdig! Nå er det Spiller 2.", "Player 1 done! Now Player 2."))
-            if st.button("➡️ " + tt("Start spiller 2", "Start player 2"), use_container_width=True, key="gf_to_p2"):
-                st.session_state.gf_stage = "p2"
-                st.session_state.gf_index = 0
-                st.session_state.gf_deadline = time.time() + 20
-                st.rerun()
+            st.button("➡️ " + tt("Start spiller 2", "Start player 2"), use_container_width=True, key="gf_to_p2",
+                      on_click=start_player, args=("p2",))
             return
-        st.session_state.gf_stage = "done"
-        st.rerun()
-
-    remaining = 0
-    if st.session_state.gf_deadline is not None:
-        remaining = int(max(0, st.session_state.gf_deadline - time.time()))
 
-    if hasattr(st, "autorefresh"):
-        st.autorefresh(interval=1000, key=f"gf_refresh_{stage}_{idx}")
+        remaining = 0
+        if st.session_state.gf_deadline is not None:
+            remaining = int(max(0, st.session_state.gf_deadline - time.time()))
 
-    st.markdown(f"#### {player_label} – {tt('Kort', 'Card')} {idx+1}/15")
-    st.progress(remaining / 20 if remaining > 0 else 0.0)
-    st.write(tt("Tid igjen:", "Time left:"), f"**{remaining}s**")
+        st.markdown(f"#### {player_label} – {tt('Kort', 'Card')} {idx+1}/15")
+        st.progress(remaining / 20 if remaining > 0 else 0.0)
+        st.write(tt("Tid igjen:", "Time left:"), f"**{remaining}s**")
 
-    st.markdown(f"**{deck[idx]['q']}**")
+        st.markdown(f"**{deck[idx]['q']}**")
 
-    cA, cB, cC = st.columns([1.0, 1.0, 2.0])
-    with cA:
-        if st.button("✅ " + tt("Riktig", "Correct"), use_container_width=True, key=f"gf_correct_{stage}_{idx}"):
-            if stage == "p1":
-                st.session_state.gf_score["p1"] += 1
-            else:
-                st.session_state.gf_score["p2"] += 1
-            st.session_state.gf_index += 1
-            st.session_state.gf_deadline = time.time() + 20
-            st.rerun()
+        cA, cB, cC = st.columns([1.0, 1.0, 2.0])
+        with cA:
+            st.button("✅ " + tt("Riktig", "Correct"), use_container_width=True, key=f"gf_correct_{stage}_{idx}",
+                      on_click=next_card, args=(True,))
 
-    with cB:
-        if st.button("⏭️ " + tt("Pass", "Pass"), use_container_width=True, key=f"gf_pass_{stage}_{idx}"):
-            st.session_state.gf_index += 1
-            st.session_state.gf_deadline = time.time() + 20
-            st.rerun()
+        with cB:
+            st.button("⏭️ " + tt("Pass", "Pass"), use_container_width=True, key=f"gf_pass_{stage}_{idx}",
+                      on_click=next_card, args=(False,))
 
-    with cC:
-        with st.expander(tt("Vis fasit (for lærer)", "Show answer (for teacher)")):
-            st.write("**" + tt("Fasit:", "Answer:") + "**", deck[idx]["a"])
+        with cC:
+            with st.expander(tt("Vis fasit (for lærer)", "Show answer (for teacher)")):
+                st.write("**" + tt("Fasit:", "Answer:") + "**", deck[idx]["a"])
 
-    if remaining <= 0:
-        st.warning(tt("Tiden er ute – registrert som pass.", "Time is up — counted as pass."))
-        if st.button("➡️ " + tt("Neste kort", "Next card"), use_container_width=True, key=f"gf_next_{stage}_{idx}"):
-            st.session_state.gf_index += 1
-            st.session_state.gf_deadline = time.time() + 20
-            st.rerun()
+        if remaining <= 0:
+            st.warning(tt("Tiden er ute – registrert som pass.", "Time is up — counted as pass."))
+            st.button("➡️ " + tt("Neste kort", "Next card"), use_container_width=True, key=f"gf_next_{stage}_{idx}",
+                      on_click=next_card, args=(False,))
 
-    if st.session_state.gf_stage == "done":
-        st.markdown("### " + tt("Resultat", "Result"))
-        st.success(f"{tt('Spiller 1', 'Player 1')}: {st.session_state.gf_score['p1']}  ·  {tt('Spiller 2', 'Player 2')}: {st.session_state.gf_score['p2']}")
+    game()
 
 
 def show_learning_arena():
@@ -1844,9 +1567,8 @@ In the Pro version you get extended content:
     st.divider()
 
     can_open = bool(st.session_state.get("is_pro_user", False))
-    if st.button("📦 " + tt("Gå til Pro-innhold", "Go to Pro content"), use_container_width=True, disabled=not can_open):
-        st.session_state.view = "ProInnhold"
-        st.rerun()
+    st.button("📦 " + tt("Gå til Pro-innhold", "Go to Pro content"), use_container_width=True, disabled=not can_open,
+              on_click=go_to, args=("ProInnhold",))
 
     st.caption(tt(
         "Elever trenger ikke Pro for å bestå: gratisdelen er laget som et komplett undervisningsopplegg.",
@@ -1863,14 +1585,17 @@ def show_pro_content():
     with st.container(border=True):
         st.markdown("**" + tt("Lærertilgang (pilot)", "Teacher access (pilot)") + "**")
         teacher_code = st.text_input(tt("Lærerkode", "Teacher code"), type="password", key="teacher_code_pro_content")
+
+        def unlock():
+            if st.session_state.teacher_code_pro_content == TEACHER_CODE:
+                st.session_state.is_pro_user = True
+                st.session_state.pro_teacher_mode = True
+
         cta1, cta2 = st.columns([1.2, 2.8])
         with cta1:
-            if st.button("🔑 " + tt("Lås opp", "Unlock"), use_container_width=True):
+            if st.button("🔑 " + tt("Lås opp", "Unlock"), use_container_width=True, on_click=unlock):
                 if teacher_code == TEACHER_CODE:
-                    st.session_state.is_pro_user = True
-                    st.session_state.pro_teacher_mode = True
                     st.success(tt("Lærertilgang aktiv.", "Teacher access enabled."))
-                    st.rerun()
                 else:
                     st.error(tt("Feil kode.", "Wrong code."))
         with cta2:
@@ -2001,9 +1726,12 @@ def show_vty_gate():
 
     c1, c2, c3 = st.columns([1.3, 1.5, 2.2], gap="medium")
     with c1:
-        if st.button("💳 " + tt("Jeg har betalt (demo)", "I have paid (demo)"), use_container_width=True, key="vty_paid_btn"):
+        def paid():
             st.session_state.vty_access = True
             st.session_state.vty_teacher_mode = False
+
+        if st.button("💳 " + tt("Jeg har betalt (demo)", "I have paid (demo)"), use_container_width=True, key="vty_paid_btn",
+                     on_click=paid):
             st.success(tt("Tilgang aktivert (demo).", "Access enabled (demo)."))
 
     with c2:
@@ -2021,33 +1749,33 @@ def show_vty_gate():
 
     st.divider()
 
-    if st.button("➡️ " + tt("Gå til oppgaver", "Go to tasks"), use_container_width=True, disabled=not st.session_state.vty_access):
-        st.session_state.view = "VeienTilYrkeslivet_Innhold"
-        st.rerun()
+    st.button("➡️ " + tt("Gå til oppgaver", "Go to tasks"), use_container_width=True, disabled=not st.session_state.vty_access,
+              on_click=go_to, args=("VeienTilYrkeslivet_Innhold",))
 
-def _task_check_ui(task, key_prefix: str):
+@st.fragment
+def _task_check_ui(task: VtyTask, key_prefix: str):
     """
     Standard UI for en realistisk oppgave med svar-sjekk.
-    task: dict med fields:
-      title, scenario, question, formula_hint, answer, unit, tol, rounding (optional), integer(optional), lk20
+    task: VtyTask fra vty_tasks_data().
     """
     with st.container(border=True):
-        st.markdown(f"#### {task['title']}")
-        st.write(task["scenario"])
+        st.markdown(f"#### {task.title}")
+        st.write(task.scenario)
         st.markdown("**" + tt("Oppgave", "Task") + "**")
-        st.write(task["question"])
+        st.write(task.question)
         st.markdown("**" + tt("Formel-hint", "Formula hint") + "**")
-        st.code(task["formula_hint"], language="text")
+        st.code(task.formula_hint, language="text")
 
         st.markdown("**" + tt("LK20-kobling (eksempel)", "LK20 linkage (example)") + "**")
-        st.write(task["lk20"])
+        st.write(task.lk20)
 
         st.divider()
-        ans = st.text_input(tt("Ditt svar", "Your answer"), key=f"{key_prefix}_ans", placeholder=task.get("unit",""))
+        ans = st.text_input(tt("Ditt svar", "Your answer"), key=f"{key_prefix}_ans", placeholder=task.unit)
         c1, c2 = st.columns([1.1, 2.9])
         with c1:
             if st.button(tt("Sjekk svar", "Check answer"), use_container_width=True, key=f"{key_prefix}_chk"):
-                ok, v = check_answer(ans, {"answer": task["answer"], "tol": task.get("tol", 0.0), "integer": task.get("integer", False)})
+                ok, v = check_answer(ans, {"answer": task.answer, "tol": task.tol,
+                                           "integer": task.integer, "unit": task.unit})
                 if ok:
                     st.success(tt("Riktig ✔️", "Correct ✔️"))
                 else:
@@ -2057,764 +1785,17 @@ def _task_check_ui(task, key_prefix: str):
             if st.session_state.get("vty_teacher_mode", False):
                 if st.toggle(tt("Vis fasit (lærer)", "Show answer (teacher)"), key=f"{key_prefix}_show"):
                     # avrunding
-                    val = float(task["answer"])
-                    if task.get("integer"):
+                    val = float(task.answer)
+                    if task.integer:
                         out = str(int(round(val)))
                     else:
-                        r = task.get("rounding", None)
+                        r = task.rounding
                         out = f"{val:.{r}f}" if isinstance(r, int) else fmt(val)
-                    st.info(f"{tt('Fasit', 'Answer')}: {out} {task.get('unit','')}".strip())
+                    st.info(f"{tt('Fasit', 'Answer')}: {out} {task.unit}".strip())
 
 def vty_tasks_data():
-    """
-    Returnerer oppgaver per yrke. 10 oppgaver per yrke.
-    Tallene er bevisst realistiske og enhetsnære.
-    """
-    LK20 = tt(
-        "Knyttes typisk til programfag i BA (f.eks. Praktisk yrkesutøvelse): måle og beregne, planlegge og gjennomføre arbeidsoppdrag, velge materialer, dokumentere og gjøre egenkontroll.",
-        "Typically linked to VET outcomes (e.g., Practical trade practice): measure and calculate, plan and carry out tasks, choose materials, document work, and perform self-checks."
-    )
-
-    return {
-        tt("Tømrer", "Carpenter"): [
-            {
-                "title": tt("1) Stendere i vegg", "1) Wall studs"),
-                "scenario": tt("Du skal bygge en bindingsverksvegg på byggeplass.", "You are framing a stud wall on site."),
-                "question": tt("Vegg: 4,8 m lang. Senteravstand 0,6 m. Hvor mange stendere trenger du hvis du alltid har en stender i hver ende?", 
-                               "Wall: 4.8 m long. Stud spacing 0.6 m. How many studs do you need if you always have one at each end?"),
-                "formula_hint": "antall = (lengde / c/c) + 1  (avrund opp)",
-                "answer": math.floor(4.8/0.6) + 1,
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("2) Gips på vegg med åpning", "2) Drywall with opening"),
-                "scenario": tt("Du skal bestille gipsplater til en vegg.", "You need drywall sheets for a wall."),
-                "question": tt("Vegg: 6,0 m × 2,4 m. Trekk fra én dør: 0,9 × 2,1 m. Hvor mange m² gips trenger du?",
-                               "Wall: 6.0 m × 2.4 m. Subtract one door: 0.9 × 2.1 m. How many m² of drywall do you need?"),
-                "formula_hint": "A_netto = (L×H) − (dør_b×dør_h)",
-                "answer": (6.0*2.4) - (0.9*2.1),
-                "unit": "m²",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("3) Diagonal for å sjekke vinkel", "3) Diagonal to check square"),
-                "scenario": tt("Du setter opp en rektangulær ramme og må kontrollere om den er i vinkel.", 
-                               "You build a rectangular frame and must verify it's square."),
-                "question": tt("Ramme: 3,0 m × 4,0 m. Hva skal diagonalen være (m) for at rammen er i vinkel?",
-                               "Frame: 3.0 m × 4.0 m. What should the diagonal be (m) if the frame is square?"),
-                "formula_hint": "c = √(a² + b²)",
-                "answer": math.sqrt(3.0**2 + 4.0**2),
-                "unit": "m",
-                "tol": 0.02,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("4) Takvinkel", "4) Roof angle"),
-                "scenario": tt("Du skal lage takstoler og må finne takvinkel.", "You are building roof trusses and need the roof angle."),
-                "question": tt("Horisontal (A)=4,8 m og høyde (B)=1,6 m. Finn takvinkel θ i grader.",
-                               "Run (A)=4.8 m and rise (B)=1.6 m. Find roof angle θ in degrees."),
-                "formula_hint": "θ = arctan(B/A)",
-                "answer": math.degrees(math.atan(1.6/4.8)),
-                "unit": "°",
-                "tol": 0.6,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("5) Gulvareal og svinn", "5) Floor area and waste"),
-                "scenario": tt("Du skal bestille gulv (parkett/laminat).", "You are ordering flooring (parquet/laminate)."),
-                "question": tt("Rom: 5,4 m × 3,6 m. Legg til 8% svinn. Hvor mange m² bestiller du?",
-                               "Room: 5.4 m × 3.6 m. Add 8% waste. How many m² do you order?"),
-                "formula_hint": "A = L×B;  A_bestill = A × (1 + svinn/100)",
-                "answer": (5.4*3.6) * 1.08,
-                "unit": "m²",
-                "tol": 0.1,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("6) Listverk (løpemeter)", "6) Trim (running meters)"),
-                "scenario": tt("Du skal bestille gulvlister.", "You need baseboards."),
-                "question": tt("Rom: 4,2 m × 3,0 m. Du skal IKKE ha list foran døråpning 0,9 m. Hvor mange meter list trenger du?",
-                               "Room: 4.2 m × 3.0 m. Do NOT place trim across a 0.9 m doorway. How many meters of trim do you need?"),
-                "formula_hint": "O = 2(L+B) − dørbredde",
-                "answer": (2*(4.2+3.0)) - 0.9,
-                "unit": "m",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("7) Materiallengde – kapp/svinn", "7) Length + cutting waste"),
-                "scenario": tt("Du skal kle en vegg med horisontale lekter.", "You are installing horizontal battens."),
-                "question": tt("Du trenger 18 stk lekter à 2,4 m. Legg til 10% svinn. Hvor mange løpemeter bestiller du?",
-                               "You need 18 battens of 2.4 m. Add 10% waste. How many running meters do you order?"),
-                "formula_hint": "LM = antall×lengde;  LM_bestill = LM×(1+svinn/100)",
-                "answer": (18*2.4)*1.10,
-                "unit": "m",
-                "tol": 0.2,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("8) Trapp – stigning", "8) Stairs – rise per step"),
-                "scenario": tt("Du skal beregne jevn stigning i en trapp.", "You need even risers in a stair."),
-                "question": tt("Etasjehøyde: 2,70 m. Du planlegger 15 opptrinn. Hvor høy blir hvert opptrinn (cm)?",
-                               "Floor-to-floor height: 2.70 m. You plan 15 risers. What is the rise per step (cm)?"),
-                "formula_hint": "opptrinn = total høyde / antall;  (m→cm: ×100)",
-                "answer": (2.70/15)*100,
-                "unit": "cm",
-                "tol": 0.2,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("9) Bjelkelag – c/c og antall bjelker", "9) Joists – spacing and count"),
-                "scenario": tt("Du legger bjelkelag i et gulv.", "You are laying floor joists."),
-                "question": tt("Spennvidde: 3,6 m. Bjelker c/c 0,6 m. Hvor mange bjelker trengs dersom du har bjelke i hver kant?",
-                               "Span: 3.6 m. Joist spacing 0.6 m. How many joists if you have one at each edge?"),
-                "formula_hint": "antall = (lengde / c/c) + 1",
-                "answer": math.floor(3.6/0.6)+1,
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("10) Areal av trekantet gavl", "10) Area of triangular gable"),
-                "scenario": tt("Du skal beregne kledning på en trekantet gavl.", "You need cladding area for a triangular gable."),
-                "question": tt("Gavl: grunnlinje 6,0 m og høyde 2,4 m. Finn arealet (m²).",
-                               "Gable: base 6.0 m and height 2.4 m. Find area (m²)."),
-                "formula_hint": "A_trekant = (grunnlinje × høyde) / 2",
-                "answer": (6.0*2.4)/2,
-                "unit": "m²",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-        ],
-
-        tt("Rørlegger", "Plumber"): [
-            {
-                "title": tt("1) Fall på avløpsrør", "1) Drain pipe slope"),
-                "scenario": tt("Avløpsrør skal ha fall for å sikre god avrenning.", "Drain pipes need slope for proper flow."),
-                "question": tt("Krav: 20 mm fall per meter. Rørlengde: 3,5 m. Hvor mange mm fall totalt?",
-                               "Requirement: 20 mm drop per meter. Pipe length: 3.5 m. How many mm total drop?"),
-                "formula_hint": "fall_tot = (mm per m) × lengde",
-                "answer": 20*3.5,
-                "unit": "mm",
-                "tol": 1.0,
-                "rounding": 0,
-                "lk20": LK20
-            },
-            {
-                "title": tt("2) Vanntrykk – enkel prosentvis reduksjon", "2) Pressure – percent reduction"),
-                "scenario": tt("Du må ta høyde for trykktap i en installasjon (forenklet).", "You account for pressure loss (simplified)."),
-                "question": tt("Starttrykk: 4,0 bar. Trykktap 12%. Hva blir trykket etter tapet?",
-                               "Start: 4.0 bar. Loss 12%. What is the resulting pressure?"),
-                "formula_hint": "ny = gammel × (1 − p/100)",
-                "answer": 4.0*(1-0.12),
-                "unit": "bar",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("3) Rørmengde – kapp", "3) Pipe length + cutting"),
-                "scenario": tt("Du skal bestille rør til en føringsvei.", "You order pipe for a run."),
-                "question": tt("Du trenger 9 lengder à 3,0 m. Legg til 8% kapp. Hvor mange meter bestiller du?",
-                               "You need 9 lengths of 3.0 m. Add 8% cutting waste. How many meters to order?"),
-                "formula_hint": "LM = antall×lengde;  LM_bestill = LM×(1+svinn/100)",
-                "answer": (9*3.0)*1.08,
-                "unit": "m",
-                "tol": 0.2,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("4) Sylinder – volum i rør", "4) Cylinder – water volume in pipe"),
-                "scenario": tt("Du vil vite omtrent hvor mye vann som står i et rør (forenklet).", "Estimate water volume in a pipe."),
-                "question": tt("Rør: innvendig diameter 25 mm, lengde 12 m. Finn volum (liter). (1 m³ = 1000 liter)",
-                               "Pipe: inner diameter 25 mm, length 12 m. Find volume (liters)."),
-                "formula_hint": "V = π·r²·L  (r = d/2). Husk mm→m. liter = m³×1000",
-                "answer": (math.pi*((0.025/2)**2)*12)*1000,
-                "unit": "liter",
-                "tol": 0.2,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("5) Blandingsforhold – prosent", "5) Mixing ratio – percent"),
-                "scenario": tt("Du blander frostvæske i et anlegg (forenklet).", "You mix antifreeze (simplified)."),
-                "question": tt("Du har 40 liter væske. 30% skal være frostvæske. Hvor mange liter frostvæske?",
-                               "You have 40 liters total. 30% should be antifreeze. How many liters antifreeze?"),
-                "formula_hint": "del = (p/100) × hel",
-                "answer": 0.30*40,
-                "unit": "liter",
-                "tol": 0.2,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("6) Areal for gulvvarme", "6) Area for floor heating"),
-                "scenario": tt("Du planlegger gulvvarmesløyfer i et rom.", "You plan underfloor heating loops."),
-                "question": tt("Rom: 4,8 m × 3,6 m. Trekk fra fast innredning 1,2 m². Finn areal som skal varmes (m²).",
-                               "Room: 4.8 m × 3.6 m. Subtract fixed fixtures 1.2 m². Find heated area."),
-                "formula_hint": "A = L×B − A_fast",
-                "answer": (4.8*3.6) - 1.2,
-                "unit": "m²",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("7) Rørisolasjon – omkrets", "7) Pipe insulation – circumference"),
-                "scenario": tt("Du skal beregne omkretsen for å anslå isolasjonsbehov.", "You estimate insulation needs from circumference."),
-                "question": tt("Ytre diameter på rør: 42 mm. Finn omkrets (mm).",
-                               "Outer diameter: 42 mm. Find circumference (mm)."),
-                "formula_hint": "O = π × d",
-                "answer": math.pi*42,
-                "unit": "mm",
-                "tol": 2.0,
-                "rounding": 0,
-                "lk20": LK20
-            },
-            {
-                "title": tt("8) Tappevann – volum i tank", "8) Hot water tank volume"),
-                "scenario": tt("Du sjekker kapasitet på varmtvannstank (forenklet boks).", "Estimate hot water tank capacity (box approximation)."),
-                "question": tt("Tank (forenklet): 0,5 m × 0,5 m × 1,2 m. Finn volum (liter).",
-                               "Tank: 0.5 m × 0.5 m × 1.2 m. Find volume (liters)."),
-                "formula_hint": "V = L×B×H; liter = m³×1000",
-                "answer": (0.5*0.5*1.2)*1000,
-                "unit": "liter",
-                "tol": 2.0,
-                "rounding": 0,
-                "lk20": LK20
-            },
-            {
-                "title": tt("9) Avstand mellom rørklammer", "9) Clamp spacing"),
-                "scenario": tt("Du skal sette rørklammer jevnt.", "You place pipe clamps evenly."),
-                "question": tt("Rørstrekk: 4,2 m. Klammer hver 0,6 m + én i hver ende. Hvor mange klammer?",
-                               "Run: 4.2 m. Clamps every 0.6 m + one at each end. How many clamps?"),
-                "formula_hint": "antall = (lengde / avstand) + 1",
-                "answer": math.floor(4.2/0.6)+1,
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("10) Temperaturfall – differanse", "10) Temperature drop"),
-                "scenario": tt("Du dokumenterer enkelt temperaturfall i et system (forenklet).", "Document a simple temperature drop."),
-                "question": tt("Turtemperatur: 42°C. Retur: 34°C. Hva er temperaturfallet (°C)?",
-                               "Supply: 42°C. Return: 34°C. What is the temperature drop?"),
-                "formula_hint": "ΔT = T_tur − T_retur",
-                "answer": 42-34,
-                "unit": "°C",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-        ],
-
-        tt("Blikkenslager", "Sheet metal worker"): [
-            {
-                "title": tt("1) Renne – total lengde", "1) Gutter length"),
-                "scenario": tt("Du skal bestille takrenner.", "You are ordering gutters."),
-                "question": tt("Bygg: 10,8 m × 7,2 m. Renner på to langsider (10,8 m). Legg til 5% kapp. Hvor mange meter bestilles?",
-                               "Building: 10.8 m × 7.2 m. Gutters on two long sides (10.8 m). Add 5% waste. How many meters?"),
-                "formula_hint": "LM = 2×lengde;  LM_bestill = LM×(1+svinn/100)",
-                "answer": (2*10.8)*1.05,
-                "unit": "m",
-                "tol": 0.2,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("2) Nedløp – antall rørstykker", "2) Downpipe count"),
-                "scenario": tt("Nedløp leveres i 3,0 m lengder.", "Downpipes come in 3.0 m lengths."),
-                "question": tt("Bygget har 2 etasjer, total høyde 5,4 m. Ett nedløp per hjørne (4 stk). Hvor mange 3,0 m rørstykker trengs totalt? (avrund opp per nedløp)",
-                               "Total height 5.4 m. One downpipe per corner (4). How many 3.0 m pieces total?"),
-                "formula_hint": "stykker per nedløp = ceil(høyde/3,0); total = per×4",
-                "answer": math.ceil(5.4/3.0)*4,
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("3) Luftkanal – tverrsnittsareal", "3) Vent duct cross-section area"),
-                "scenario": tt("Du dimensjonerer en rektangulær kanal (forenklet).", "You size a rectangular duct (simplified)."),
-                "question": tt("Kanal: 200 mm × 150 mm. Finn tverrsnittsareal i cm².",
-                               "Duct: 200 mm × 150 mm. Find cross-sectional area in cm²."),
-                "formula_hint": "A = L×B; mm→cm: ÷10",
-                "answer": (20*15),  # cm x cm
-                "unit": "cm²",
-                "tol": 1.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("4) Platekledning – areal med svinn", "4) Sheet area with waste"),
-                "scenario": tt("Du skal bestille plate/metall til en kasseinnkledning.", "You order sheet metal for a casing."),
-                "question": tt("Areal: 12,0 m². Legg til 12% svinn. Hvor mange m² bestiller du?",
-                               "Area: 12.0 m². Add 12% waste. How many m² to order?"),
-                "formula_hint": "A_bestill = A × (1 + svinn/100)",
-                "answer": 12.0*1.12,
-                "unit": "m²",
-                "tol": 0.1,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("5) Pipegjennomføring – omkrets", "5) Pipe penetration – circumference"),
-                "scenario": tt("Du lager en mansjett rundt et rundt rør.", "You make a collar around a round pipe."),
-                "question": tt("Diameter på rør: 110 mm. Hvor lang stripe trengs rundt (mm) uten overlapp?",
-                               "Pipe diameter: 110 mm. What strip length is needed around it (mm), no overlap?"),
-                "formula_hint": "O = π × d",
-                "answer": math.pi*110,
-                "unit": "mm",
-                "tol": 3.0,
-                "rounding": 0,
-                "lk20": LK20
-            },
-            {
-                "title": tt("6) Koning – enkel prosentvis avkorting", "6) Tapering – percent reduction"),
-                "scenario": tt("Du lager en kon (forenklet) og må redusere omkrets 8%.", "You taper a piece and reduce circumference by 8%."),
-                "question": tt("Opprinnelig omkrets: 520 mm. Reduser 8%. Hva blir ny omkrets?",
-                               "Original circumference: 520 mm. Reduce by 8%. New circumference?"),
-                "formula_hint": "ny = gammel × (1 − p/100)",
-                "answer": 520*(1-0.08),
-                "unit": "mm",
-                "tol": 2.0,
-                "rounding": 0,
-                "lk20": LK20
-            },
-            {
-                "title": tt("7) Beslag – lengde + overlapp", "7) Flashing – length + overlap"),
-                "scenario": tt("Du legger beslag med overlapp.", "You install flashing with overlap."),
-                "question": tt("Du har 14,4 m lengde. Overlapp 100 mm per skjøt. Du bruker 6 lengder (skjøter=5). Hvor mange meter beslag går med totalt?",
-                               "Run is 14.4 m. Overlap 100 mm per joint. You use 6 lengths (5 joints). Total length used?"),
-                "formula_hint": "total = lengde + (antall_skjøter × overlapp). 100 mm = 0,1 m",
-                "answer": 14.4 + (5*0.1),
-                "unit": "m",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("8) Takrennefall", "8) Gutter slope"),
-                "scenario": tt("Takrenne skal ha lite fall mot nedløp.", "Gutters need a slight fall to the downpipe."),
-                "question": tt("Krav: 3 mm fall per meter. Lengde: 8,0 m. Hvor mange mm fall totalt?",
-                               "Requirement: 3 mm per meter. Length: 8.0 m. Total drop (mm)?"),
-                "formula_hint": "fall_tot = mm per m × lengde",
-                "answer": 3*8.0,
-                "unit": "mm",
-                "tol": 1.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("9) Kanal – overflateareal (for isolasjon)", "9) Duct surface area (insulation)"),
-                "scenario": tt("Du skal anslå isolasjonsbehov rundt en rektangulær kanal.", "You estimate insulation for a rectangular duct."),
-                "question": tt("Kanal: 0,30 m × 0,20 m, lengde 6,0 m. Finn overflateareal av sideflatene (m²) (ikke endeflater).",
-                               "Duct: 0.30 m × 0.20 m, length 6.0 m. Find side surface area (m²), ignore ends."),
-                "formula_hint": "A_side = omkrets_tverrsnitt × lengde = 2(a+b)×L",
-                "answer": (2*(0.30+0.20))*6.0,
-                "unit": "m²",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("10) Platekutting – utnyttelse", "10) Sheet cutting utilization"),
-                "scenario": tt("Du vil se hvor stor andel av platen som faktisk brukes.", "You check how much of a sheet is used."),
-                "question": tt("Plate: 1,0 m². Du bruker 0,78 m². Hvor stor utnyttelse i %?",
-                               "Sheet: 1.0 m². You use 0.78 m². Utilization in %?"),
-                "formula_hint": "prosent = (del / hel) × 100",
-                "answer": (0.78/1.0)*100,
-                "unit": "%",
-                "tol": 0.5,
-                "rounding": 1,
-                "lk20": LK20
-            },
-        ],
-
-        tt("Mur og betong", "Masonry & concrete"): [
-            {
-                "title": tt("1) Betongplate – volum", "1) Slab concrete volume"),
-                "scenario": tt("Du skal bestille betong til en plate.", "You order concrete for a slab."),
-                "question": tt("Plate: 7,2 m × 3,6 m × 100 mm. Finn volum (m³).",
-                               "Slab: 7.2 m × 3.6 m × 100 mm. Find volume (m³)."),
-                "formula_hint": "V = L×B×t;  100 mm = 0,10 m",
-                "answer": 7.2*3.6*0.10,
-                "unit": "m³",
-                "tol": 0.02,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("2) Betong med svinn", "2) Concrete with waste"),
-                "scenario": tt("Du legger til svinn for søl og ujevnheter.", "Add waste for spillage and irregularities."),
-                "question": tt("Du har beregnet 2,59 m³ betong. Legg til 8% svinn. Hvor mye bestiller du (m³)?",
-                               "You calculated 2.59 m³. Add 8% waste. How much do you order?"),
-                "formula_hint": "V_bestill = V × (1 + svinn/100)",
-                "answer": 2.59*1.08,
-                "unit": "m³",
-                "tol": 0.03,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("3) Armering – antall jern", "3) Rebar count"),
-                "scenario": tt("Du legger armeringsjern med c/c-avstand.", "You place rebar at a given spacing."),
-                "question": tt("Platebredde: 3,6 m. Jern c/c 0,20 m. Hvor mange jern trengs hvis du har jern i hver kant?",
-                               "Width: 3.6 m. Spacing 0.20 m. How many bars if one at each edge?"),
-                "formula_hint": "antall = (bredde / c/c) + 1",
-                "answer": math.floor(3.6/0.20)+1,
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("4) Murstein – areal og antall", "4) Bricks – area and count"),
-                "scenario": tt("Du beregner antall murstein basert på areal og forbruk.", "Estimate bricks from wall area and rate."),
-                "question": tt("Vegg: 4,8 m × 2,4 m. Forbruk: 60 stein per m². Hvor mange stein (avrund opp)?",
-                               "Wall: 4.8 m × 2.4 m. Rate: 60 bricks per m². How many (round up)?"),
-                "formula_hint": "antall = areal × forbruk; avrund opp",
-                "answer": math.ceil((4.8*2.4)*60),
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("5) Puss – blanding (prosent)", "5) Plaster mix (percent)"),
-                "scenario": tt("Du blander mørtel (forenklet prosentandel).", "Mix mortar (simplified percent)."),
-                "question": tt("Du trenger 25 kg blanding. 12% skal være sement. Hvor mange kg sement?",
-                               "Need 25 kg total. 12% is cement. How many kg cement?"),
-                "formula_hint": "del = (p/100) × hel",
-                "answer": 0.12*25,
-                "unit": "kg",
-                "tol": 0.1,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("6) Fundament – volum", "6) Footing volume"),
-                "scenario": tt("Du støper fundamentstripe.", "You pour a strip footing."),
-                "question": tt("Stripe: 12,0 m lang × 0,4 m bred × 0,3 m høy. Finn volum (m³).",
-                               "Footing: 12.0 m × 0.4 m × 0.3 m. Volume (m³)?"),
-                "formula_hint": "V = L×B×H",
-                "answer": 12.0*0.4*0.3,
-                "unit": "m³",
-                "tol": 0.02,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("7) Forskaling – areal", "7) Formwork area"),
-                "scenario": tt("Du skal anslå forskalingsareal på sider av en bjelke (forenklet).", "Estimate formwork area on beam sides."),
-                "question": tt("Bjelke: lengde 6,0 m, høyde 0,5 m. To sider. Finn areal (m²).",
-                               "Beam: length 6.0 m, height 0.5 m. Two sides. Area (m²)?"),
-                "formula_hint": "A = 2 × (L × H)",
-                "answer": 2*(6.0*0.5),
-                "unit": "m²",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("8) Fall på betonggulv mot sluk", "8) Concrete floor slope to drain"),
-                "scenario": tt("Gulvet skal ha fall mot sluk.", "Floor needs slope to drain."),
-                "question": tt("Fallkrav: 1,5% over 3,0 m. Hvor mange mm fall?",
-                               "Slope: 1.5% over 3.0 m. How many mm drop?"),
-                "formula_hint": "fall(mm) = (pct/100) × lengde(m) × 1000",
-                "answer": (1.5/100)*3.0*1000,
-                "unit": "mm",
-                "tol": 2.0,
-                "rounding": 0,
-                "lk20": LK20
-            },
-            {
-                "title": tt("9) Blandingsvann – liter", "9) Mixing water liters"),
-                "scenario": tt("Sekketøy krever vann pr. sekk (forenklet).", "Bagged mix needs water per bag."),
-                "question": tt("Du bruker 12 sekker. 2,8 liter vann per sekk. Hvor mange liter vann totalt?",
-                               "You use 12 bags. 2.8 L per bag. Total liters?"),
-                "formula_hint": "liter = antall × liter_per_sekk",
-                "answer": 12*2.8,
-                "unit": "liter",
-                "tol": 0.2,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("10) Armeringsnett – antall nett", "10) Mesh sheets count"),
-                "scenario": tt("Armeringsnett leveres i plater.", "Rebar mesh comes in sheets."),
-                "question": tt("Plateareal: 25 m². Ett nett dekker 2,15 m × 5,0 m. Hvor mange nett trengs (avrund opp)?",
-                               "Slab area: 25 m². One mesh covers 2.15 m × 5.0 m. How many sheets (round up)?"),
-                "formula_hint": "antall = total_areal / nett_areal; avrund opp",
-                "answer": math.ceil(25 / (2.15*5.0)),
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-        ],
-
-        tt("Flislegger", "Tiler"): [
-            {
-                "title": tt("1) Antall fliser på gulv", "1) Number of tiles on floor"),
-                "scenario": tt("Du skal bestille fliser til et gulv.", "You are ordering tiles for a floor."),
-                "question": tt("Rom: 3,6 m × 2,4 m. Flis: 30 cm × 30 cm. Legg til 10% svinn. Hvor mange fliser bestiller du? (avrund opp)",
-                               "Room: 3.6 m × 2.4 m. Tile: 30 cm × 30 cm. Add 10% waste. How many tiles?"),
-                "formula_hint": "A_rom = L×B. A_flis = 0,30×0,30. antall = (A_rom/A_flis)×(1+svinn) avrund opp",
-                "answer": math.ceil(((3.6*2.4)/(0.30*0.30))*1.10),
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("2) Flis på vegg med dør", "2) Wall tiling with door"),
-                "scenario": tt("Du skal flislegge en vegg, men trekker fra dør.", "You tile a wall and subtract a door opening."),
-                "question": tt("Vegg: 4,8 m × 2,4 m. Dør: 0,9 × 2,1 m. Finn netto flisareal (m²).",
-                               "Wall: 4.8 m × 2.4 m. Door: 0.9 × 2.1 m. Net tiling area (m²)?"),
-                "formula_hint": "A_netto = (L×H) − (dør_b×dør_h)",
-                "answer": (4.8*2.4)-(0.9*2.1),
-                "unit": "m²",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("3) Limforbruk", "3) Adhesive consumption"),
-                "scenario": tt("Lim har forbruk per m².", "Adhesive has a consumption per m²."),
-                "question": tt("Du skal dekke 18 m². Forbruk 3,5 kg/m². Hvor mange kg lim trengs?",
-                               "Cover 18 m². Rate 3.5 kg/m². How many kg adhesive?"),
-                "formula_hint": "kg = areal × kg_per_m²",
-                "answer": 18*3.5,
-                "unit": "kg",
-                "tol": 0.5,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("4) Fugemasse", "4) Grout"),
-                "scenario": tt("Du legger til svinn på fugemasse.", "Add waste for grout."),
-                "question": tt("Beregnet behov: 12,0 kg. Legg til 8% svinn. Hvor mange kg bestiller du?",
-                               "Calculated: 12.0 kg. Add 8% waste. How many kg to order?"),
-                "formula_hint": "bestill = behov × (1 + svinn/100)",
-                "answer": 12.0*1.08,
-                "unit": "kg",
-                "tol": 0.2,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("5) Fall mot sluk", "5) Slope to drain"),
-                "scenario": tt("Baderomsgulv skal ha fall mot sluk.", "Bathroom floor needs slope to drain."),
-                "question": tt("Fall: 2,0% over 1,8 m. Hvor mange mm fall?",
-                               "Slope: 2.0% over 1.8 m. How many mm drop?"),
-                "formula_hint": "fall(mm) = (pct/100) × lengde(m) × 1000",
-                "answer": (2.0/100)*1.8*1000,
-                "unit": "mm",
-                "tol": 2.0,
-                "rounding": 0,
-                "lk20": LK20
-            },
-            {
-                "title": tt("6) Sokkel/flislist (løpemeter)", "6) Tile trim (running meters)"),
-                "scenario": tt("Du skal legge flislist langs vegg.", "You install tile trim along walls."),
-                "question": tt("Rom: 2,4 m × 2,0 m. Du har døråpning 0,8 m uten list. Hvor mange meter list?",
-                               "Room: 2.4 m × 2.0 m. Door opening 0.8 m without trim. How many meters?"),
-                "formula_hint": "O = 2(L+B) − dørbredde",
-                "answer": (2*(2.4+2.0)) - 0.8,
-                "unit": "m",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("7) Fliser per rad", "7) Tiles per row"),
-                "scenario": tt("Du planlegger flislegging uten kapp (forenklet).", "Plan tiling without cuts (simplified)."),
-                "question": tt("Vegglengde: 3,0 m. Flis: 25 cm bred. Hvor mange fliser går det per rad? (avrund opp)",
-                               "Wall length: 3.0 m. Tile width: 25 cm. Tiles per row (round up)?"),
-                "formula_hint": "antall = lengde / flisbredde. 25 cm = 0,25 m",
-                "answer": math.ceil(3.0/0.25),
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("8) Pris – rabatt", "8) Price – discount"),
-                "scenario": tt("Du får rabatt hos leverandør.", "You get a supplier discount."),
-                "question": tt("Fliser koster 19 800 kr. Rabatt 10%. Hva betaler du?",
-                               "Tiles cost 19,800 NOK. 10% discount. What do you pay?"),
-                "formula_hint": "ny pris = gammel × (1 − p/100)",
-                "answer": 19800*(1-0.10),
-                "unit": "kr",
-                "tol": 5.0,
-                "rounding": 0,
-                "lk20": LK20
-            },
-            {
-                "title": tt("9) Membran – areal", "9) Waterproofing membrane area"),
-                "scenario": tt("Du beregner membran på gulv.", "You calculate membrane on floor."),
-                "question": tt("Gulv: 2,6 m × 1,9 m. Legg til 5% svinn. Hvor mange m² membran?",
-                               "Floor: 2.6 m × 1.9 m. Add 5% waste. How many m² membrane?"),
-                "formula_hint": "A_bestill = (L×B) × (1+svinn/100)",
-                "answer": (2.6*1.9)*1.05,
-                "unit": "m²",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("10) Flis – areal per pakke", "10) Tiles – area per box"),
-                "scenario": tt("Fliser selges i pakker med oppgitt m².", "Tiles are sold by box with m² coverage."),
-                "question": tt("Du trenger 14,6 m². Én pakke dekker 1,44 m². Hvor mange pakker trenger du? (avrund opp)",
-                               "Need 14.6 m². One box covers 1.44 m². How many boxes?"),
-                "formula_hint": "pakker = total / per_pakke; avrund opp",
-                "answer": math.ceil(14.6/1.44),
-                "unit": "pakker",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-        ],
-
-        tt("Anleggsarbeider", "Construction worker (civil works)"): [
-            {
-                "title": tt("1) Masseutskifting – volum", "1) Earthworks – volume"),
-                "scenario": tt("Du skal grave ut og fylle på pukk.", "You excavate and refill with aggregate."),
-                "question": tt("Grøft: 12 m lang, 0,6 m bred, 0,4 m dyp. Finn volum (m³).",
-                               "Trench: 12 m long, 0.6 m wide, 0.4 m deep. Volume (m³)?"),
-                "formula_hint": "V = L×B×D",
-                "answer": 12*0.6*0.4,
-                "unit": "m³",
-                "tol": 0.02,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("2) Komprimering – ekstra masse", "2) Compaction – extra material"),
-                "scenario": tt("Du legger til 15% for komprimering og svinn.", "Add 15% for compaction/waste."),
-                "question": tt("Du har beregnet 2,88 m³ pukk. Legg til 15%. Hvor mye bestiller du (m³)?",
-                               "You calculated 2.88 m³. Add 15%. How much to order?"),
-                "formula_hint": "V_bestill = V × (1 + p/100)",
-                "answer": 2.88*1.15,
-                "unit": "m³",
-                "tol": 0.03,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("3) Areal for geotekstil", "3) Geotextile area"),
-                "scenario": tt("Du legger geotekstil i bunnen.", "You lay geotextile."),
-                "question": tt("Areal: 18 m × 3,0 m. Legg til 10% overlapp. Hvor mange m² trengs?",
-                               "Area: 18 m × 3.0 m. Add 10% overlap. How many m² needed?"),
-                "formula_hint": "A = L×B;  A_total = A×(1+overlapp/100)",
-                "answer": (18*3.0)*1.10,
-                "unit": "m²",
-                "tol": 0.2,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("4) Stigning på rampe", "4) Ramp gradient"),
-                "scenario": tt("Du skal sjekke stigning på en rampe.", "You check ramp gradient."),
-                "question": tt("Høydeforskjell 0,24 m over lengde 6,0 m. Finn stigning i %.",
-                               "Rise 0.24 m over 6.0 m. Find gradient in %."),
-                "formula_hint": "stigning(%) = (høyde / lengde) × 100",
-                "answer": (0.24/6.0)*100,
-                "unit": "%",
-                "tol": 0.2,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("5) Målestokk – virkelighet fra tegning", "5) Scale – real size from drawing"),
-                "scenario": tt("Du leser arbeidstegning.", "You read a construction drawing."),
-                "question": tt("På tegning (1:50) måler du 72 mm. Hvor mange meter er dette i virkeligheten?",
-                               "On a 1:50 drawing you measure 72 mm. How many meters in reality?"),
-                "formula_hint": "virkelighet = tegning × 50. 72 mm × 50 = 3600 mm = 3,6 m",
-                "answer": 3.6,
-                "unit": "m",
-                "tol": 0.02,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("6) Kantstein – antall", "6) Curb stones – count"),
-                "scenario": tt("Kantstein leveres i 1,0 m lengder.", "Curbstones come in 1.0 m lengths."),
-                "question": tt("Strekning: 34 m. Legg til 5% svinn/kapp. Hvor mange stein (avrund opp)?",
-                               "Length: 34 m. Add 5% waste. How many stones (round up)?"),
-                "formula_hint": "antall = lengde×(1+svinn) / 1,0; avrund opp",
-                "answer": math.ceil(34*1.05),
-                "unit": "stk",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-            {
-                "title": tt("7) Asfalt – volum", "7) Asphalt volume"),
-                "scenario": tt("Du skal legge asfalt på et område.", "You pave an area with asphalt."),
-                "question": tt("Areal: 120 m². Tykkelse: 45 mm. Finn volum (m³).",
-                               "Area: 120 m². Thickness: 45 mm. Volume (m³)?"),
-                "formula_hint": "V = areal × tykkelse. 45 mm = 0,045 m",
-                "answer": 120*0.045,
-                "unit": "m³",
-                "tol": 0.05,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("8) Rør i grøft – fall", "8) Pipe in trench – slope"),
-                "scenario": tt("Du legger overvannsrør med fall.", "You lay stormwater pipe with slope."),
-                "question": tt("Fallkrav: 1,0% over 18 m. Hvor mange cm fall?",
-                               "Slope: 1.0% over 18 m. How many cm drop?"),
-                "formula_hint": "fall(m) = (pct/100)×lengde; cm = m×100",
-                "answer": ((1.0/100)*18)*100,
-                "unit": "cm",
-                "tol": 0.5,
-                "rounding": 1,
-                "lk20": LK20
-            },
-            {
-                "title": tt("9) Grusdekke – areal og tonn (forenklet)", "9) Gravel – area and tonnes (simplified)"),
-                "scenario": tt("Du bestiller grus. (Forenklet regning med fast vekt).", "You order gravel (simplified with fixed density)."),
-                "question": tt("Areal 60 m², tykkelse 0,05 m. Tetthet (forenklet): 1,6 tonn per m³. Hvor mange tonn?",
-                               "Area 60 m², thickness 0.05 m. Density: 1.6 tonnes per m³. How many tonnes?"),
-                "formula_hint": "V = A×t; tonn = V × 1,6",
-                "answer": (60*0.05)*1.6,
-                "unit": "tonn",
-                "tol": 0.2,
-                "rounding": 2,
-                "lk20": LK20
-            },
-            {
-                "title": tt("10) Dreneringsrør – antall kveil", "10) Drain pipe – coil count"),
-                "scenario": tt("Dreneringsrør leveres i kveil på 25 m.", "Drain pipes come in 25 m coils."),
-                "question": tt("Du trenger 78 m drensrør. Hvor mange kveiler må du kjøpe? (avrund opp)",
-                               "You need 78 m. How many 25 m coils?"),
-                "formula_hint": "kveiler = ceil(total / 25)",
-                "answer": math.ceil(78/25),
-                "unit": "kveiler",
-                "tol": 0.0,
-                "integer": True,
-                "lk20": LK20
-            },
-        ],
-    }
+    """Oppgaver per yrke på valgt språk: {yrke: (VtyTask, ...)}. Bygges én gang per språk (vty_tasks.py)."""
+    return vty_tasks(lang())
 
 def show_vty_content():
     st.markdown("## 🧰 " + tt("Veien til yrkeslivet", "Path to professional life"))
@@ -2866,513 +1847,18 @@ This mainly supports VET subjects where students **measure, calculate, plan, exe
     ))
 
     # =========================
-    # Oppgaver (10 per yrke)
+    # Oppgaver (10 per yrke, VTY_CASES i vty_tasks.py)
     # =========================
-    tasks = {
-        "Tømrer": [
-            {
-                "title": "Stenderverk – antall stendere",
-                "scenario": "Du skal bygge en vegg på 4,80 m. Stenderavstand c/c 600 mm. Husk stender i hver ende.",
-                "ask": "Hvor mange stendere trenger du?",
-                "hint": "Antall felt = lengde / c/c. Antall stendere = antall felt + 1.",
-                "solution": "4,80 m / 0,60 m = 8 felt → 9 stendere (inkludert endestendere).",
-                "lk20": "Måle/beregne materialforbruk og planlegge arbeid."
-            },
-            {
-                "title": "Gulv – areal og materialforbruk",
-                "scenario": "Et rom er 3,6 m × 4,2 m. Du skal legge gulvspon. Husk 10 % svinn.",
-                "ask": "Hvor stort areal er gulvet, og hvor mye areal må du bestille med svinn?",
-                "hint": "A = l × b. Bestilling = A × 1,10.",
-                "solution": "A = 3,6 × 4,2 = 15,12 m². Med svinn: 15,12 × 1,10 = 16,63 m² (avrund opp).",
-                "lk20": "Beregne areal, svinn og planlegge materialer."
-            },
-            {
-                "title": "Tak – fall og høydeforskjell",
-                "scenario": "Et tak har fall 1:40. Horisontal lengde fra møne til raft er 5,2 m.",
-                "ask": "Hva er høydeforskjellen mellom møne og raft?",
-                "hint": "Fall 1:40 betyr 1 enhet opp per 40 enheter bort. H = L/40.",
-                "solution": "H = 5,2/40 = 0,13 m = 130 mm.",
-                "lk20": "Bruke mål og beregne høyder/fall i konstruksjoner."
-            },
-            {
-                "title": "Kledning – antall bord",
-                "scenario": "En fasade er 6,0 m bred og 2,4 m høy. Du bruker stående kledning 148 mm med 5 mm spalte (effektiv bredde 143 mm).",
-                "ask": "Hvor mange bord trenger du i bredden?",
-                "hint": "Antall = bredde / effektiv bredde.",
-                "solution": "6,0 m / 0,143 m ≈ 41,96 → 42 bord.",
-                "lk20": "Beregne materialbehov og tilpasse til utførelse."
-            },
-            {
-                "title": "Betongforskaling – mengde forskalingsplater",
-                "scenario": "Du forskaler en stripefundament-side: 12 m lengde og 0,5 m høyde. Plateformat 1,2 × 2,4 m.",
-                "ask": "Hvor mange plater trengs (kun én side), uten svinn?",
-                "hint": "Flate = L × H. Plateareal = 1,2 × 2,4.",
-                "solution": "Flate = 12 × 0,5 = 6,0 m². Plateareal = 2,88 m². 6,0/2,88 = 2,08 → 3 plater.",
-                "lk20": "Beregne areal og materialbehov til forskaling."
-            },
-            {
-                "title": "Trapp – stigningsforhold",
-                "scenario": "Etasjeskille: 2,64 m. Du planlegger 15 opptrinn.",
-                "ask": "Hva blir opptrinnshøyden i mm?",
-                "hint": "Opptrinn = total høyde / antall opptrinn.",
-                "solution": "2,64 m / 15 = 0,176 m = 176 mm.",
-                "lk20": "Beregne dimensjoner og tilpasse ergonomi/utførelse."
-            },
-            {
-                "title": "Bjelkelag – volum trevirke",
-                "scenario": "Du skal bestille 48×198 mm bjelker. Det går 14 bjelker á 4,8 m.",
-                "ask": "Hva er totalt volum trevirke i m³?",
-                "hint": "Volum = b×h×L. Husk å omregne mm→m.",
-                "solution": "Én bjelke: 0,048×0,198×4,8=0,0456 m³. Totalt: 14×0,0456=0,638 m³.",
-                "lk20": "Beregne volum og materialmengder."
-            },
-            {
-                "title": "Isolasjon – m² og pakkebehov",
-                "scenario": "Vegger: 2 rom, hver med veggareal 22 m². Isolasjonspakke dekker 5,4 m². 10 % svinn.",
-                "ask": "Hvor mange pakker trenger du?",
-                "hint": "Total A × 1,10 / dekningsgrad.",
-                "solution": "Total A=44 m². Med svinn: 48,4 m². 48,4/5,4=8,96 → 9 pakker.",
-                "lk20": "Beregne materialforbruk og bestilling."
-            },
-            {
-                "title": "Målestokk – lese arbeidstegning",
-                "scenario": "På en tegning i målestokk 1:50 måler du en vegg til 84 mm på papiret.",
-                "ask": "Hva er virkelig lengde i meter?",
-                "hint": "1:50 → multipliser med 50. 84 mm×50 = mm i virkelighet.",
-                "solution": "84×50=4200 mm=4,2 m.",
-                "lk20": "Tolke tegninger og bruke målestokk."
-            },
-            {
-                "title": "Kapp – optimal kutting",
-                "scenario": "Du har 4,8 m lengder. Du trenger 12 stk á 1,55 m. Du kan ikke skjøte.",
-                "ask": "Hvor mange 4,8 m lengder må du kjøpe, og hvor mye svinn får du (i meter)?",
-                "hint": "Fra 4,8 m får du maks ⌊4,8/1,55⌋ biter. Svinn per lengde = 4,8 − (antall biter × 1,55).",
-                "solution": "⌊4,8/1,55⌋=3 biter per lengde. Trenger 12 biter → 4 lengder. Svinn per lengde: 4,8−4,65=0,15 m. Totalt svinn: 0,60 m.",
-                "lk20": "Planlegge materialbruk og redusere svinn."
-            },
-        ],
-        "Rørlegger": [
-            {
-                "title": "Fall på avløp",
-                "scenario": "Avløpsrør skal ha fall 1:50. Strekket er 7,5 m.",
-                "ask": "Hvor mange mm fall skal du ha totalt?",
-                "hint": "H = L/50.",
-                "solution": "7,5/50=0,15 m=150 mm.",
-                "lk20": "Beregne fall og sikre funksjon/utførelse."
-            },
-            {
-                "title": "Rørvolum – hvor mye vann står i røret?",
-                "scenario": "Et PEX-rør har innvendig diameter 16 mm og lengde 12 m.",
-                "ask": "Hvor mange liter vann rommer røret (omtrent)?",
-                "hint": "Volum sylinder: V = π·r²·L. 1 liter = 0,001 m³.",
-                "solution": "r=0,008 m. V=π·(0,008²)·12≈0,00241 m³≈2,41 liter.",
-                "lk20": "Bruke volumformel og enhetsomregning."
-            },
-            {
-                "title": "Blandingsforhold",
-                "scenario": "Glykolblanding: 35 % glykol. Du har 18 liter ferdig blanding.",
-                "ask": "Hvor mange liter glykol trenger du?",
-                "hint": "Mengde = total × prosent.",
-                "solution": "18×0,35=6,3 liter glykol.",
-                "lk20": "Prosentregning i praktisk arbeid."
-            },
-            {
-                "title": "Trykktap (forenklet)",
-                "scenario": "Du bruker en tommelfingerregel: 0,25 bar trykktap per 10 m i et strekk. Strekket er 26 m.",
-                "ask": "Hva blir trykktapet i bar?",
-                "hint": "Proporsjonal skalering.",
-                "solution": "26/10×0,25=0,65 bar.",
-                "lk20": "Forstå proporsjoner og beregne konsekvenser."
-            },
-            {
-                "title": "Rørkapping – vinkel og lengde",
-                "scenario": "Du skal lage en 45°-bend ved å kutte to rørstykker som møtes. Du trenger 300 mm fra bend til bend langs senterlinje.",
-                "ask": "Hva blir lengden på hvert stykke hvis du deler likt (forenklet) og ignorerer fittings-lengde?",
-                "hint": "Del total lengde på 2.",
-                "solution": "300/2 = 150 mm per stykke.",
-                "lk20": "Beregne lengder og planlegge montasje."
-            },
-            {
-                "title": "Varmekabel – effekt",
-                "scenario": "Bad: 6,2 m². Du skal ha 100 W/m². Nettspenning 230 V.",
-                "ask": "Hva blir total effekt (W) og strøm (A) omtrent?",
-                "hint": "P = A×W/m². I = P/V.",
-                "solution": "P=6,2×100=620 W. I=620/230≈2,70 A.",
-                "lk20": "Beregne effekt/strøm i praktiske installasjoner (tverrfaglig)."
-            },
-            {
-                "title": "Tappevann – tid til fylling",
-                "scenario": "En kran fyller 9 liter per minutt. Du skal fylle en bøtte på 25 liter.",
-                "ask": "Hvor lang tid tar det (minutter og sekunder)?",
-                "hint": "Tid = volum / flow.",
-                "solution": "25/9=2,78 min ≈ 2 min 47 sek.",
-                "lk20": "Beregne tid/kapasitet."
-            },
-            {
-                "title": "Isolasjon på rør – omkrets",
-                "scenario": "Et rør har utvendig diameter 28 mm. Du skal beregne omkrets for å velge isolasjon.",
-                "ask": "Hva er omkretsen i mm (omtrent)?",
-                "hint": "O = π·d.",
-                "solution": "O ≈ 3,14×28 ≈ 88 mm.",
-                "lk20": "Bruke omkretsformel og avrunding."
-            },
-            {
-                "title": "Materialbestilling – klammer",
-                "scenario": "Du skal klamre et 10 m rørstrekk. Klammeravstand 0,8 m. Klammer i hver ende.",
-                "ask": "Hvor mange klammer trenger du?",
-                "hint": "Antall felt = L/avstand. Antall klammer = felt + 1.",
-                "solution": "10/0,8=12,5 → 13 felt → 14 klammer.",
-                "lk20": "Beregne festepunkter og planlegge montering."
-            },
-            {
-                "title": "Målestokk – rørstrekk på tegning",
-                "scenario": "Tegning 1:100. Du måler rørstrekk til 62 mm på tegningen.",
-                "ask": "Hva er virkelig lengde i meter?",
-                "hint": "62 mm×100=6200 mm=6,2 m.",
-                "solution": "6,2 m.",
-                "lk20": "Tolke tegninger og bruke målestokk."
-            },
-        ],
-        "Blikkenslager": [
-            {
-                "title": "Takrenne – lengde og skjøter",
-                "scenario": "En langside er 12,6 m. Renner leveres i 3,0 m lengder. Du trenger 10 cm overlapp per skjøt.",
-                "ask": "Hvor mange lengder må du ha, og hvor mange skjøter blir det?",
-                "hint": "Antall lengder = taklengde / 3,0 (avrund opp). Skjøter = lengder − 1.",
-                "solution": "12,6/3,0=4,2 → 5 lengder. Skjøter: 4. (Overlapp håndteres i tilpasning).",
-                "lk20": "Planlegge materialer og tilpasning."
-            },
-            {
-                "title": "Nedløp – kapasitet (forenklet)",
-                "scenario": "Tommelfingerregel: 1 nedløp per 60 m² takflate. Takflate er 138 m².",
-                "ask": "Hvor mange nedløp trengs?",
-                "hint": "Antall = takflate / 60 (avrund opp).",
-                "solution": "138/60=2,3 → 3 nedløp.",
-                "lk20": "Beregne kapasitet og dimensjonering (forenklet)."
-            },
-            {
-                "title": "Beslag – areal og materialforbruk",
-                "scenario": "Du lager et beslag 0,25 m bredt og 8,0 m langt i 0,6 mm plate.",
-                "ask": "Hva er arealet av platen (m²)?",
-                "hint": "A = b×L.",
-                "solution": "0,25×8,0=2,0 m².",
-                "lk20": "Beregne flater og materialforbruk."
-            },
-            {
-                "title": "Knekking – utvikling (forenklet)",
-                "scenario": "Du skal knekkesette et U-profil: bunn 120 mm, sider 2×40 mm, pluss 2×10 mm fals.",
-                "ask": "Hva blir utviklet bredde (mm) før knekking, uten å ta hensyn til knekktillegg?",
-                "hint": "Summer alle delbredder.",
-                "solution": "120 + 40 + 40 + 10 + 10 = 220 mm.",
-                "lk20": "Forstå utvikling og beregne materialbredde."
-            },
-            {
-                "title": "Taktekking – svinn",
-                "scenario": "Du tekker 72 m² med plater. Du legger til 8 % svinn.",
-                "ask": "Hvor mye areal må bestilles?",
-                "hint": "Bestilling = A×1,08.",
-                "solution": "72×1,08=77,76 m².",
-                "lk20": "Prosent og bestilling."
-            },
-            {
-                "title": "Vinkel – grad og stigning",
-                "scenario": "Et tak har 1:3 stigning (1 opp per 3 bort).",
-                "ask": "Hva er vinkelen i grader (omtrent)?",
-                "hint": "tan(v) = 1/3 → v = arctan(1/3).",
-                "solution": "v ≈ 18,4°.",
-                "lk20": "Bruke trigonometri/forhold ved takarbeid (nivåtilpasset)."
-            },
-            {
-                "title": "Sirkulær kanal – omkrets",
-                "scenario": "Ventilasjonskanal Ø160 mm.",
-                "ask": "Hva er omkretsen (mm) omtrent?",
-                "hint": "O = π·d.",
-                "solution": "≈ 3,14×160 = 502 mm.",
-                "lk20": "Omkrets og dimensjonering."
-            },
-            {
-                "title": "Kanal – areal av rektangel",
-                "scenario": "Rektangulær kanal 200×100 mm (innvendig).",
-                "ask": "Hva er tverrsnittsarealet i cm²?",
-                "hint": "A = b×h. 1 cm² = 100 mm².",
-                "solution": "200×100=20000 mm² = 200 cm².",
-                "lk20": "Areal, enhetsomregning."
-            },
-            {
-                "title": "Nedløpsrør – kapp",
-                "scenario": "Du har 3,0 m rør. Du trenger 5 stk á 1,15 m.",
-                "ask": "Hvor mange 3,0 m rør trenger du, og svinn?",
-                "hint": "⌊3,0/1,15⌋ = 2 biter per rør.",
-                "solution": "2 biter per rør → 3 rør gir 6 biter. Svinn per rør: 3,0−2,30=0,70 m. Totalt svinn: 2,10 m (minus tilpasning).",
-                "lk20": "Planlegge kapping og redusere svinn."
-            },
-            {
-                "title": "Målestokk – pipebeslag",
-                "scenario": "Tegning 1:20. Du måler pipebredde til 38 mm på tegningen.",
-                "ask": "Virkelig bredde i mm og cm?",
-                "hint": "38×20=760 mm = 76 cm.",
-                "solution": "760 mm (76 cm).",
-                "lk20": "Tolke tegninger og omregne."
-            },
-        ],
-        "Mur og betong": [
-            {
-                "title": "Betong – volum i fundament",
-                "scenario": "Fundament: 8,0 m × 0,4 m × 0,25 m.",
-                "ask": "Hvor mange m³ betong trenger du?",
-                "hint": "V = l×b×h.",
-                "solution": "8,0×0,4×0,25=0,80 m³.",
-                "lk20": "Volum og materialforbruk."
-            },
-            {
-                "title": "Mørtel – blandingsforhold",
-                "scenario": "Du blander mørtel: 1 del sement til 4 deler sand. Total blanding 50 liter (volum).",
-                "ask": "Hvor mange liter sement og sand trenger du?",
-                "hint": "Total deler = 5. Sement = 1/5, sand = 4/5.",
-                "solution": "Sement: 10 L. Sand: 40 L.",
-                "lk20": "Forhold og blanding i praksis."
-            },
-            {
-                "title": "Armering – kapp og overlapp",
-                "scenario": "Du skal armerere en stripe på 11,2 m med 12 m jern, men krever 0,6 m overlapp ved skjøt.",
-                "ask": "Holder ett 12 m jern, eller må du skjøte? Hvis skjøt: hvor mye effektiv lengde får du ved 2 jern?",
-                "hint": "Ved skjøt mister du overlappen i effektiv lengde.",
-                "solution": "11,2 m < 12 m → ett jern holder (med tilpasning). Ved 2 jern: effektiv lengde = 12 + 12 − 0,6 = 23,4 m.",
-                "lk20": "Planlegge armering og forstå overlapp."
-            },
-            {
-                "title": "Puss – areal og mengde",
-                "scenario": "Du pusser en vegg 3,2×2,5 m. Forbruk 14 kg/m².",
-                "ask": "Hvor mange kg puss trenger du?",
-                "hint": "Mengde = A×forbruk.",
-                "solution": "A=8,0 m². Mengde=8,0×14=112 kg.",
-                "lk20": "Beregne mengde og bestilling."
-            },
-            {
-                "title": "Murstein – antall stein",
-                "scenario": "Veggareal 9,6 m². Tommelfingerregel 60 stein per m².",
-                "ask": "Hvor mange murstein trenger du?",
-                "hint": "Antall = A×60.",
-                "solution": "9,6×60=576 stein.",
-                "lk20": "Beregne materialforbruk."
-            },
-            {
-                "title": "Blanding – prosent vann",
-                "scenario": "Betongtilsetning: vannmengde er 8 % av tørrstoffmengde. Tørrstoff er 420 kg.",
-                "ask": "Hvor mange kg vann?",
-                "hint": "Prosent av mengde.",
-                "solution": "420×0,08=33,6 kg vann (≈33,6 liter).",
-                "lk20": "Prosent og enhetsforståelse."
-            },
-            {
-                "title": "Helning – rampe",
-                "scenario": "En rampe skal ha maks 1:15. Du har 0,72 m høydeforskjell.",
-                "ask": "Hvor lang må rampen være minst?",
-                "hint": "L = H×15.",
-                "solution": "0,72×15=10,8 m.",
-                "lk20": "Beregne helning og universell utforming (tverrfaglig)."
-            },
-            {
-                "title": "Forskaling – omkrets",
-                "scenario": "Du forskaler en søyle med tverrsnitt 0,35×0,35 m.",
-                "ask": "Hva er omkretsen rundt (m)?",
-                "hint": "O = 4×side.",
-                "solution": "O=4×0,35=1,40 m.",
-                "lk20": "Omkrets og materialbehov."
-            },
-            {
-                "title": "Betongplate – armeringsnett",
-                "scenario": "Plate: 5,0×3,0 m. Nett leveres i 2,4×5,0 m. Overlapp 0,2 m i én retning.",
-                "ask": "Hvor mange nett trengs (grovt)?",
-                "hint": "Se på dekning per nett og overlapp. Grov planlegging.",
-                "solution": "Én nett dekker 2,4×5,0. For 3,0 m bredde trengs 2 nett i bredden med overlapp. Totalt 2 nett.",
-                "lk20": "Planlegge materialer og forstå overlapp."
-            },
-            {
-                "title": "Målestokk – forskalingshøyde",
-                "scenario": "Tegning 1:25. Du måler en høyde til 36 mm.",
-                "ask": "Virkelig høyde i mm og meter?",
-                "hint": "36×25=900 mm=0,9 m.",
-                "solution": "900 mm (0,90 m).",
-                "lk20": "Tolke tegninger og omregne."
-            },
-        ],
-        "Flislegger": [
-            {
-                "title": "Baderomsgulv – antall fliser",
-                "scenario": "Gulv: 2,4×3,1 m. Fliser 30×60 cm. 12 % svinn.",
-                "ask": "Hvor mange fliser trenger du (avrundet opp)?",
-                "hint": "A gulv / A flis × (1+svinn).",
-                "solution": "A=7,44 m². A flis=0,18 m². Antall uten svinn=41,33. Med svinn: 46,29 → 47 fliser.",
-                "lk20": "Areal, enhetsomregning og svinn."
-            },
-            {
-                "title": "Fall til sluk",
-                "scenario": "Avstand til sluk 1,6 m. Du skal ha 1:60 fall.",
-                "ask": "Hvor mange mm høydeforskjell trengs?",
-                "hint": "H = L/60.",
-                "solution": "1,6/60=0,0267 m=26,7 mm.",
-                "lk20": "Beregne fall i våtrom."
-            },
-            {
-                "title": "Sokkel – omkrets og lengde",
-                "scenario": "Rom: 3,2×4,6 m. Sokkel skal legges rundt hele rommet.",
-                "ask": "Hvor mange meter sokkel trenger du?",
-                "hint": "O=2(l+b).",
-                "solution": "O=2(3,2+4,6)=15,6 m.",
-                "lk20": "Omkrets og planlegging."
-            },
-            {
-                "title": "Flislim – forbruk",
-                "scenario": "Veggflate 18 m². Flislim forbruk 3,5 kg/m².",
-                "ask": "Hvor mange kg lim?",
-                "hint": "Mengde=A×forbruk.",
-                "solution": "18×3,5=63 kg.",
-                "lk20": "Beregne mengde og bestilling."
-            },
-            {
-                "title": "Fugemasse – volum",
-                "scenario": "Du fuger 10 m² med 5 mm fugebredde og 8 mm dybde. Forenklet: 1 m² gir 0,04 liter fugemasse.",
-                "ask": "Hvor mange liter fugemasse trengs?",
-                "hint": "Liter = areal × 0,04.",
-                "solution": "10×0,04=0,40 liter.",
-                "lk20": "Bruke forbrukstall og beregne mengde."
-            },
-            {
-                "title": "Mønster – diagonallinje",
-                "scenario": "Du skal legge fliser diagonalt i et kvadratisk felt 1,2×1,2 m.",
-                "ask": "Hva er diagonalen (m)?",
-                "hint": "Pythagoras: d = √(1,2²+1,2²).",
-                "solution": "d=√(1,44+1,44)=√2,88=1,70 m.",
-                "lk20": "Pythagoras i praktiske mål."
-            },
-            {
-                "title": "Kapp – antall kutt",
-                "scenario": "En vegg er 2,1 m høy. Fliser er 0,6 m høye. Du starter med hel flis nede.",
-                "ask": "Hvor mange hele rader får du, og hvor høy blir siste kapp (cm)?",
-                "hint": "Antall hele = ⌊2,1/0,6⌋. Rest = 2,1 − antall×0,6.",
-                "solution": "⌊2,1/0,6⌋=3 hele rader. Rest=2,1−1,8=0,3 m=30 cm.",
-                "lk20": "Planlegge kapping og tilpasning."
-            },
-            {
-                "title": "Målestokk – nisje",
-                "scenario": "Tegning 1:10. Nisjebredde måles til 52 mm.",
-                "ask": "Virkelig bredde i cm?",
-                "hint": "52×10=520 mm=52 cm.",
-                "solution": "52 cm.",
-                "lk20": "Tolke tegninger og omregne."
-            },
-            {
-                "title": "Pris – kalkyle",
-                "scenario": "Fliser koster 349 kr/m². Du skal legge 7,8 m². Legg til 12 % svinn i innkjøp.",
-                "ask": "Hva blir ca. materialkostnad (kr) for fliser?",
-                "hint": "Kost = A×1,12×pris.",
-                "solution": "7,8×1,12=8,736 m². 8,736×349 ≈ 3049 kr.",
-                "lk20": "Beregne kostnader og svinn."
-            },
-            {
-                "title": "Fallsoner – deling av gulv",
-                "scenario": "Gulv 2,0×2,0 m med sluk i midten. Du deler i 4 trekanter for fall.",
-                "ask": "Hva er arealet av én trekant (m²)?",
-                "hint": "Total A / 4.",
-                "solution": "Total A=4,0 m². Én trekant=1,0 m².",
-                "lk20": "Areal og oppdeling for planlegging."
-            },
-        ],
-        "Anleggsarbeider": [
-            {
-                "title": "Masseberegning – grus",
-                "scenario": "Du skal legge 12 cm bærelag på et område 6,0×9,5 m.",
-                "ask": "Hvor mange m³ grus trenger du?",
-                "hint": "V = areal × tykkelse.",
-                "solution": "A=57,0 m². Tykkelse=0,12 m. V=6,84 m³.",
-                "lk20": "Volum og masseberegning."
-            },
-            {
-                "title": "Fall – avrenning på vei",
-                "scenario": "En vei skal ha tverrfall 2 %. Veibredde er 4,5 m.",
-                "ask": "Hvor mange cm høydeforskjell fra midt til kant (halv bredde)?",
-                "hint": "2 % = 0,02. Halv bredde=2,25 m. H=0,02×2,25.",
-                "solution": "H=0,045 m=4,5 cm.",
-                "lk20": "Prosent og fall i anlegg."
-            },
-            {
-                "title": "Utskråning – vinkel",
-                "scenario": "Skråning 1:1,5 (1 opp per 1,5 bort).",
-                "ask": "Hva er vinkelen i grader (omtrent)?",
-                "hint": "tan(v) = 1/1,5.",
-                "solution": "v ≈ arctan(0,6667) ≈ 33,7°.",
-                "lk20": "Forhold og vinkler i terreng."
-            },
-            {
-                "title": "Rørgrøft – volum",
-                "scenario": "Grøft: 18 m lang, 0,6 m bred og 0,9 m dyp.",
-                "ask": "Hvor stort volum masse skal graves ut (m³)?",
-                "hint": "V = l×b×h.",
-                "solution": "18×0,6×0,9=9,72 m³.",
-                "lk20": "Volum og planlegging."
-            },
-            {
-                "title": "Kantstein – antall",
-                "scenario": "Du skal legge kantstein langs 24 m. Hver kantstein er 0,5 m.",
-                "ask": "Hvor mange kantstein trenger du?",
-                "hint": "Antall = lengde / 0,5.",
-                "solution": "24/0,5=48 stk.",
-                "lk20": "Lengde og materialbehov."
-            },
-            {
-                "title": "Komprimering – lagtykkelse",
-                "scenario": "Du fyller opp 0,36 m. Du legger maks 12 cm per lag.",
-                "ask": "Hvor mange lag må du komprimere?",
-                "hint": "Antall = total/lagtykkelse.",
-                "solution": "0,36/0,12=3 lag.",
-                "lk20": "Planlegge utførelse og kvalitet."
-            },
-            {
-                "title": "Maskintid – produksjon",
-                "scenario": "Gravemaskin graver 18 m³ per time. Du har 52 m³ masse.",
-                "ask": "Hvor lang tid tar gravingen (timer og minutter)?",
-                "hint": "Tid = volum / kapasitet.",
-                "solution": "52/18=2,89 timer ≈ 2 t 53 min.",
-                "lk20": "Beregne tid og kapasitet."
-            },
-            {
-                "title": "Areal – utlegging av duk",
-                "scenario": "Du legger fiberduk i et område 7,2×11,5 m. Overlapp gir 6 % ekstra.",
-                "ask": "Hvor mange m² duk bør bestilles?",
-                "hint": "A×1,06.",
-                "solution": "A=82,8 m². Med overlapp: 87,77 m².",
-                "lk20": "Areal og tillegg for overlapp."
-            },
-            {
-                "title": "Målestokk – grøfteplan",
-                "scenario": "Tegning 1:200. Du måler grøftelengde til 73 mm.",
-                "ask": "Hva er virkelig lengde i meter?",
-                "hint": "73×200=14600 mm=14,6 m.",
-                "solution": "14,6 m.",
-                "lk20": "Tolke tegninger og omregne."
-            },
-            {
-                "title": "Volum – asfalt (forenklet)",
-                "scenario": "Asfaltering: 120 m² med 4 cm tykkelse.",
-                "ask": "Hva er volum asfalt i m³?",
-                "hint": "V=A×t.",
-                "solution": "t=0,04 m. V=120×0,04=4,8 m³.",
-                "lk20": "Volum og mengdeberegning."
-            },
-        ],
-    }
-
-    def render_task_card(trade_name: str, idx: int, t: dict):
-        header = f"{idx}. {t['title']}"
+    def render_task_card(trade_name: str, idx: int, t: VtyCase):
+        header = f"{idx}. {t.title}"
         with st.expander(header, expanded=False):
-            st.markdown("**" + tt("Scenario", "Scenario") + ":** " + t["scenario"])
-            st.markdown("**" + tt("Oppgave", "Task") + ":** " + t["ask"])
-            st.markdown("**" + tt("Formel / hint", "Formula / hint") + ":** " + t["hint"])
-            st.caption("LK20: " + t["lk20"])
+            st.markdown("**" + tt("Scenario", "Scenario") + ":** " + t.scenario)
+            st.markdown("**" + tt("Oppgave", "Task") + ":** " + t.ask)
+            st.markdown("**" + tt("Formel / hint", "Formula / hint") + ":** " + t.hint)
+            st.caption("LK20: " + t.lk20)
 
             if st.session_state.get("vty_teacher_mode", False):
-                st.success(tt("Løsningsforslag", "Proposed solution") + ": " + t["solution"])
+                st.success(tt("Løsningsforslag", "Proposed solution") + ": " + t.solution)
             else:
                 st.info(tt("Fasit er skjult. Spør lærer ved behov.", "Solutions are hidden. Ask your teacher if needed."))
 
@@ -3392,15 +1878,15 @@ This mainly supports VET subjects where students **measure, calculate, plan, exe
             "Use the calculators in the app to verify your results."
         ))
 
-        trade_tabs = st.tabs([f"🛠️ {name}" for name in tasks.keys()])
-        for tab, trade_name in zip(trade_tabs, tasks.keys()):
+        trade_tabs = st.tabs([f"🛠️ {name}" for name in VTY_CASES])
+        for tab, trade_name in zip(trade_tabs, VTY_CASES):
             with tab:
                 st.markdown("#### " + trade_name)
                 st.caption(tt(
                     "10 oppgaver – start med de du mestrer, og jobb deg oppover. Skriv alltid **enhet** i svaret.",
                     "10 tasks – start with what you master and work upwards. Always include **units**."
                 ))
-                for i, task in enumerate(tasks[trade_name], start=1):
+                for i, task in enumerate(VTY_CASES[trade_name], start=1):
                     render_task_card(trade_name, i, task)
 
     with main_tabs[1]:
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modulene ligger flatt i rotmappen (ingen pakke)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,24 @@
+import pytest
+
+from answers import answer_value, parse_quantity
+
+
+@pytest.mark.parametrize("text", ["2pi", "5 abc", "2 E"])
+@pytest.mark.parametrize("unit", ["", "m"])
+def test_unknown_unit_is_invalid(text, unit):
+    assert answer_value(text, unit) is None
+
+
+@pytest.mark.parametrize("text, unit, expected", [
+    ("5 stk", "", 5.0),
+    ("1200 mm", "m", 1.2),
+    ("3 kvm", "m²", 3.0),
+    ("4 pakker", "pakker", 4.0),  # oppgavens egen enhet godtas selv om den ikke står i UNITS
+])
+def test_known_units(text, unit, expected):
+    assert answer_value(text, unit) == pytest.approx(expected)
+
+
+def test_scientific_notation():
+    assert parse_quantity("1e3") == (1000.0, None)
+    assert parse_quantity("1,5e3 mm") == (1500.0, "mm")
@@ -0,0 +1,22 @@
+from arena_questions import templates_for
+
+
+def _template(topic: str, level: int, prompt_start: str):
+    return next(t for t in templates_for(topic, level) if t.prompt.startswith(prompt_start))
+
+
+def test_solution_keeps_all_digits_in_intermediates():
+    t = _template("diagonal", 4, "Ramme:")
+    steps = dict(t.solve({"a": 7.5, "b": 10.0}))
+    assert steps["innsetting"] == "C = √(7.5² + 10.0²) = √156.25"
+    assert steps["svar"] == "C = 12.5 m"
+
+
+def test_multi_step_solution_text():
+    t = _template("omkrets", 6, "Du skal ha lister")
+    assert [text for _, text in t.solve({"L": 4.35, "B": 3.2, "waste": 12})] == [
+        "Bestilling = O × (1 + svinn / 100), O = 2 × (L + B)",
+        "O = 2 × (4.35 m + 3.2 m) = 15.1 m",
+        "Bestilling = 15.1 m × (1 + 12 / 100) = 15.1 m × 1.12",
+        "16.91 m",
+    ]
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from progress_io import export_bytes, import_records, read_records
+from progress_store import ProgressBackend, new_student_record
+
+
+class MemoryBackend(ProgressBackend):
+    def __init__(self):
+        self.db = {}
+
+    def get(self, student_id: str) -> dict:
+        return json.loads(json.dumps(self.db.get(student_id) or new_student_record(student_id)))
+
+    def put(self, record: dict) -> None:
+        self.db[record["student_id"]] = record
+
+    def class_records(self, class_name: str = "") -> dict:
+        return {sid: r for sid, r in self.db.items() if not class_name or r.get("class_name") == class_name}
+
+
+def _cell(**stats):
+    return {"q_index": 0, "correct": 0, "answered": 0, "total_correct": 0, "total_answered": 0,
+            "passed": False, **stats}
+
+
+def test_jsonl_import_skips_and_reports_bad_lines():
+    lines = [
+        {"student_id": "ok1", "class_name": "1A", "global_level": 2,
+         "topics": {"areal": {"levels": {"2": _cell(answered=5, correct=4)}}},
+         "completed_topics": {"1": ["areal"]}},
+        {"student_id": "bad_topic", "topics": {"areal": 5}},
+        {"student_id": "bad_completed", "completed_topics": ["areal"]},
+        {"student_id": "bad_stat", "topics": {"volum": {"levels": {"1": _cell(answered="mange")}}}},
+        {"student_id": 42, "class_name": "1A"},
+        {"student_id": "ok2", "class_name": "1B"},
+    ]
+    f = [json.dumps(rec) for rec in lines] + ["ikke json"]
+    store, errors = MemoryBackend(), []
+
+    n = import_records(read_records(f, "jsonl", errors), store, chunk=2)
+
+    assert n == 2
+    assert set(store.db) == {"ok1", "ok2"}
+    ok1 = store.db["ok1"]
+    assert ok1["class_name"] == "1A" and ok1["global_level"] == 2
+    assert ok1["topics"]["areal"]["levels"]["2"]["correct"] == 4
+    assert ok1["completed_topics"]["1"] == ["areal"]
+    assert store.db["ok2"]["class_name"] == "1B"
+    assert [e.split(":")[0] for e in errors] == ["linje 2", "linje 3", "linje 4", "linje 5", "linje 7"]
+
+
+def test_export_bytes_is_one_class_at_a_time():
+    store = MemoryBackend()
+    store.put_many([{**new_student_record("a"), "class_name": "1A"}, {**new_student_record("b"), "class_name": "1B"}])
+
+    lines = export_bytes("jsonl", store, "1A").decode("utf-8").splitlines()
+
+    assert [json.loads(line)["student_id"] for line in lines] == ["a"]
+    with pytest.raises(ValueError):
+        export_bytes("jsonl", store, "")
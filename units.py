@@ -0,0 +1,132 @@
+"""
+Enheter: tabell over enheter med dimensjon og faktor, omregning mellom dem, og
+hjelpefunksjonene kalkulatorene bruker. Svar-tolkingen i answers.py bruker tabellen
+til å regne elevens enhet om til oppgavens enhet.
+"""
+
+# enhet -> (dimensjon, faktor til grunnenhet i dimensjonen)
+UNITS = {
+    "mm": ("lengde", 0.001), "cm": ("lengde", 0.01), "dm": ("lengde", 0.1), "m": ("lengde", 1.0), "km": ("lengde", 1000.0),
+    "mm²": ("areal", 1e-6), "cm²": ("areal", 1e-4), "dm²": ("areal", 1e-2), "m²": ("areal", 1.0),
+    "mm³": ("volum", 1e-9), "cm³": ("volum", 1e-6), "dm³": ("volum", 1e-3), "liter": ("volum", 1e-3), "m³": ("volum", 1.0),
+    "g": ("masse", 0.001), "kg": ("masse", 1.0), "tonn": ("masse", 1000.0),
+    "%": ("prosent", 1.0),
+    "kr": ("kroner", 1.0),
+    "stk": ("antall", 1.0),
+    "°": ("vinkel", 1.0),
+}
+
+# Andre skrivemåter elevene bruker (små bokstaver, uten punktum til slutt)
+UNIT_ALIASES = {
+    "m2": "m²", "m^2": "m²", "kvm": "m²", "cm2": "cm²", "cm^2": "cm²", "mm2": "mm²", "mm^2": "mm²", "dm2": "dm²",
+    "m3": "m³", "m^3": "m³", "cm3": "cm³", "cm^3": "cm³", "mm3": "mm³", "mm^3": "mm³", "dm3": "dm³",
+    "l": "liter", "ltr": "liter", "kilo": "kg", "t": "tonn",
+    "prosent": "%", "nok": "kr", "kroner": "kr", "stykk": "stk", "grader": "°", "deg": "°",
+}
+_UNIT_LOOKUP = {**{u.lower(): u for u in UNITS}, **UNIT_ALIASES}
+
+
+def canonical_unit(unit: str) -> str:
+    """Standard skrivemåte for en enhet; ukjente enheter returneres med små bokstaver."""
+    u = (unit or "").strip().lower().rstrip(".")
+    return _UNIT_LOOKUP.get(u, u)
+
+
+def convert_unit(value: float, from_unit: str, to_unit: str) -> float | None:
+    """Regn om mellom enheter i samme dimensjon. None hvis de ikke kan sammenlignes."""
+    a, b = canonical_unit(from_unit), canonical_unit(to_unit)
+    if a == b:
+        return value
+    fa, fb = UNITS.get(a), UNITS.get(b)
+    if fa is None or fb is None or fa[0] != fb[0]:
+        return None
+    return value * fa[1] / fb[1]
+
+
+LENGTH_UNITS = ["mm", "cm", "m"]
+MASS_UNITS = ["g", "kg", "tonn"]
+AREA_UNITS = ["mm²", "cm²", "m²"]
+
+def to_m(value: float, unit: str) -> float:
+    if unit == "mm":
+        return value / 1000.0
+    if unit == "cm":
+        return value / 100.0
+    return value
+
+def from_m(value_m: float, unit: str) -> float:
+    if unit == "mm":
+        return value_m * 1000.0
+    if unit == "cm":
+        return value_m * 100.0
+    return value_m
+
+
+def to_mm(value: float, unit: str) -> float:
+    """Konverter lengde til millimeter."""
+    return to_m(value, unit) * 1000.0
+
+
+def mm_to_all(mm: float) -> dict:
+    """Hjelpevisning: mm -> mm/cm/m."""
+    return {"mm": mm, "cm": mm / 10.0, "m": mm / 1000.0}
+
+
+def area_from_m2(value_m2: float, unit: str) -> float:
+    if unit == "mm":
+        return value_m2 * (1000.0 ** 2)
+    if unit == "cm":
+        return value_m2 * (100.0 ** 2)
+    return value_m2
+
+def volume_from_m3(value_m3: float, unit: str) -> float:
+    if unit == "mm":
+        return value_m3 * (1000.0 ** 3)
+    if unit == "cm":
+        return value_m3 * (100.0 ** 3)
+    return value_m3
+
+
+
+def mass_to_kg(value: float, unit: str) -> float:
+    """Konverter masse til kilogram."""
+    if unit == "g":
+        return value / 1000.0
+    if unit == "tonn":
+        return value * 1000.0
+    return value
+
+def mass_from_kg(value_kg: float, unit: str) -> float:
+    """Konverter kilogram til ønsket enhet."""
+    if unit == "g":
+        return value_kg * 1000.0
+    if unit == "tonn":
+        return value_kg / 1000.0
+    return value_kg
+
+def area_to_m2(value: float, unit: str) -> float:
+    """Konverter areal til m²."""
+    if unit == "mm²":
+        return value / (1000.0 ** 2)
+    if unit == "cm²":
+        return value / (100.0 ** 2)
+    return value  # m²
+
+def area_from_m2_unit(value_m2: float, unit: str) -> float:
+    """Konverter m² til ønsket arealenhet (mm²/cm²/m²)."""
+    if unit == "mm²":
+        return value_m2 * (1000.0 ** 2)
+    if unit == "cm²":
+        return value_m2 * (100.0 ** 2)
+    return value_m2
+
+
+def fmt(x: float) -> str:
+    if abs(x) >= 1000:
+        return f"{x:,.2f}".replace(",", " ")
+    return f"{x:.4g}"
+
+
+def fmt_exact(x: float) -> str:
+    """Som fmt, men uten å kutte siffer (mellomregninger): 156.25, 1 234.5, 15.1."""
+    return f"{x:,.10g}".replace(",", " ")
@@ -0,0 +1,1311 @@
+"""
+Oppgavebanken i Veien til yrkeslivet (BETA).
+
+Før ble innholdet bygd på nytt ved hver kjøring av siden: vty_tasks_data() laget 60
+oppgaver med rundt 300 tt()-kall og utregninger, og show_vty_content() hadde en egen,
+like stor dict inline. Nå bygges det én gang:
+
+- vty_tasks(language): oppgaver med fasit (VtyTask) per yrke, én gang per språk (LRU).
+- VTY_CASES: case-kortene i show_vty_content (VtyCase), bygd ved import. De finnes bare
+  på norsk.
+
+Begge er frosne dataklasser med __slots__ i tupler bak MappingProxyType, så ingen økt kan
+endre innholdet de andre øktene ser.
+"""
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class VtyTask:
+    """Realistisk oppgave med svar-sjekk (se _task_check_ui i appen)."""
+    title: str
+    scenario: str
+    question: str
+    formula_hint: str
+    answer: float
+    unit: str
+    tol: float
+    lk20: str
+    rounding: int | None = None
+    integer: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class VtyCase:
+    """Case-kort med hint og løsningsforslag (løsningen vises bare i lærermodus)."""
+    title: str
+    scenario: str
+    ask: str
+    hint: str
+    solution: str
+    lk20: str
+
+
+# ============================================================
+# Oppgaver med fasit (10 per yrke)
+# ============================================================
+def _task_source(language: str) -> dict:
+    """
+    Oppgaver per yrke som dicts. 10 oppgaver per yrke.
+    Tallene er bevisst realistiske og enhetsnære.
+    """
+    def tt(no: str, en: str) -> str:
+        return en if language == "EN" else no
+
+    LK20 = tt(
+        "Knyttes typisk til programfag i BA (f.eks. Praktisk yrkesutøvelse): måle og beregne, planlegge og gjennomføre arbeidsoppdrag, velge materialer, dokumentere og gjøre egenkontroll.",
+        "Typically linked to VET outcomes (e.g., Practical trade practice): measure and calculate, plan and carry out tasks, choose materials, document work, and perform self-checks."
+    )
+
+    return {
+        tt("Tømrer", "Carpenter"): [
+            {
+                "title": tt("1) Stendere i vegg", "1) Wall studs"),
+                "scenario": tt("Du skal bygge en bindingsverksvegg på byggeplass.", "You are framing a stud wall on site."),
+                "question": tt("Vegg: 4,8 m lang. Senteravstand 0,6 m. Hvor mange stendere trenger du hvis du alltid har en stender i hver ende?", 
+                               "Wall: 4.8 m long. Stud spacing 0.6 m. How many studs do you need if you always have one at each end?"),
+                "formula_hint": "antall = (lengde / c/c) + 1  (avrund opp)",
+                "answer": math.floor(4.8/0.6) + 1,
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("2) Gips på vegg med åpning", "2) Drywall with opening"),
+                "scenario": tt("Du skal bestille gipsplater til en vegg.", "You need drywall sheets for a wall."),
+                "question": tt("Vegg: 6,0 m × 2,4 m. Trekk fra én dør: 0,9 × 2,1 m. Hvor mange m² gips trenger du?",
+                               "Wall: 6.0 m × 2.4 m. Subtract one door: 0.9 × 2.1 m. How many m² of drywall do you need?"),
+                "formula_hint": "A_netto = (L×H) − (dør_b×dør_h)",
+                "answer": (6.0*2.4) - (0.9*2.1),
+                "unit": "m²",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("3) Diagonal for å sjekke vinkel", "3) Diagonal to check square"),
+                "scenario": tt("Du setter opp en rektangulær ramme og må kontrollere om den er i vinkel.", 
+                               "You build a rectangular frame and must verify it's square."),
+                "question": tt("Ramme: 3,0 m × 4,0 m. Hva skal diagonalen være (m) for at rammen er i vinkel?",
+                               "Frame: 3.0 m × 4.0 m. What should the diagonal be (m) if the frame is square?"),
+                "formula_hint": "c = √(a² + b²)",
+                "answer": math.sqrt(3.0**2 + 4.0**2),
+                "unit": "m",
+                "tol": 0.02,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("4) Takvinkel", "4) Roof angle"),
+                "scenario": tt("Du skal lage takstoler og må finne takvinkel.", "You are building roof trusses and need the roof angle."),
+                "question": tt("Horisontal (A)=4,8 m og høyde (B)=1,6 m. Finn takvinkel θ i grader.",
+                               "Run (A)=4.8 m and rise (B)=1.6 m. Find roof angle θ in degrees."),
+                "formula_hint": "θ = arctan(B/A)",
+                "answer": math.degrees(math.atan(1.6/4.8)),
+                "unit": "°",
+                "tol": 0.6,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("5) Gulvareal og svinn", "5) Floor area and waste"),
+                "scenario": tt("Du skal bestille gulv (parkett/laminat).", "You are ordering flooring (parquet/laminate)."),
+                "question": tt("Rom: 5,4 m × 3,6 m. Legg til 8% svinn. Hvor mange m² bestiller du?",
+                               "Room: 5.4 m × 3.6 m. Add 8% waste. How many m² do you order?"),
+                "formula_hint": "A = L×B;  A_bestill = A × (1 + svinn/100)",
+                "answer": (5.4*3.6) * 1.08,
+                "unit": "m²",
+                "tol": 0.1,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("6) Listverk (løpemeter)", "6) Trim (running meters)"),
+                "scenario": tt("Du skal bestille gulvlister.", "You need baseboards."),
+                "question": tt("Rom: 4,2 m × 3,0 m. Du skal IKKE ha list foran døråpning 0,9 m. Hvor mange meter list trenger du?",
+                               "Room: 4.2 m × 3.0 m. Do NOT place trim across a 0.9 m doorway. How many meters of trim do you need?"),
+                "formula_hint": "O = 2(L+B) − dørbredde",
+                "answer": (2*(4.2+3.0)) - 0.9,
+                "unit": "m",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("7) Materiallengde – kapp/svinn", "7) Length + cutting waste"),
+                "scenario": tt("Du skal kle en vegg med horisontale lekter.", "You are installing horizontal battens."),
+                "question": tt("Du trenger 18 stk lekter à 2,4 m. Legg til 10% svinn. Hvor mange løpemeter bestiller du?",
+                               "You need 18 battens of 2.4 m. Add 10% waste. How many running meters do you order?"),
+                "formula_hint": "LM = antall×lengde;  LM_bestill = LM×(1+svinn/100)",
+                "answer": (18*2.4)*1.10,
+                "unit": "m",
+                "tol": 0.2,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("8) Trapp – stigning", "8) Stairs – rise per step"),
+                "scenario": tt("Du skal beregne jevn stigning i en trapp.", "You need even risers in a stair."),
+                "question": tt("Etasjehøyde: 2,70 m. Du planlegger 15 opptrinn. Hvor høy blir hvert opptrinn (cm)?",
+                               "Floor-to-floor height: 2.70 m. You plan 15 risers. What is the rise per step (cm)?"),
+                "formula_hint": "opptrinn = total høyde / antall;  (m→cm: ×100)",
+                "answer": (2.70/15)*100,
+                "unit": "cm",
+                "tol": 0.2,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("9) Bjelkelag – c/c og antall bjelker", "9) Joists – spacing and count"),
+                "scenario": tt("Du legger bjelkelag i et gulv.", "You are laying floor joists."),
+                "question": tt("Spennvidde: 3,6 m. Bjelker c/c 0,6 m. Hvor mange bjelker trengs dersom du har bjelke i hver kant?",
+                               "Span: 3.6 m. Joist spacing 0.6 m. How many joists if you have one at each edge?"),
+                "formula_hint": "antall = (lengde / c/c) + 1",
+                "answer": math.floor(3.6/0.6)+1,
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("10) Areal av trekantet gavl", "10) Area of triangular gable"),
+                "scenario": tt("Du skal beregne kledning på en trekantet gavl.", "You need cladding area for a triangular gable."),
+                "question": tt("Gavl: grunnlinje 6,0 m og høyde 2,4 m. Finn arealet (m²).",
+                               "Gable: base 6.0 m and height 2.4 m. Find area (m²)."),
+                "formula_hint": "A_trekant = (grunnlinje × høyde) / 2",
+                "answer": (6.0*2.4)/2,
+                "unit": "m²",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+        ],
+
+        tt("Rørlegger", "Plumber"): [
+            {
+                "title": tt("1) Fall på avløpsrør", "1) Drain pipe slope"),
+                "scenario": tt("Avløpsrør skal ha fall for å sikre god avrenning.", "Drain pipes need slope for proper flow."),
+                "question": tt("Krav: 20 mm fall per meter. Rørlengde: 3,5 m. Hvor mange mm fall totalt?",
+                               "Requirement: 20 mm drop per meter. Pipe length: 3.5 m. How many mm total drop?"),
+                "formula_hint": "fall_tot = (mm per m) × lengde",
+                "answer": 20*3.5,
+                "unit": "mm",
+                "tol": 1.0,
+                "rounding": 0,
+                "lk20": LK20
+            },
+            {
+                "title": tt("2) Vanntrykk – enkel prosentvis reduksjon", "2) Pressure – percent reduction"),
+                "scenario": tt("Du må ta høyde for trykktap i en installasjon (forenklet).", "You account for pressure loss (simplified)."),
+                "question": tt("Starttrykk: 4,0 bar. Trykktap 12%. Hva blir trykket etter tapet?",
+                               "Start: 4.0 bar. Loss 12%. What is the resulting pressure?"),
+                "formula_hint": "ny = gammel × (1 − p/100)",
+                "answer": 4.0*(1-0.12),
+                "unit": "bar",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("3) Rørmengde – kapp", "3) Pipe length + cutting"),
+                "scenario": tt("Du skal bestille rør til en føringsvei.", "You order pipe for a run."),
+                "question": tt("Du trenger 9 lengder à 3,0 m. Legg til 8% kapp. Hvor mange meter bestiller du?",
+                               "You need 9 lengths of 3.0 m. Add 8% cutting waste. How many meters to order?"),
+                "formula_hint": "LM = antall×lengde;  LM_bestill = LM×(1+svinn/100)",
+                "answer": (9*3.0)*1.08,
+                "unit": "m",
+                "tol": 0.2,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("4) Sylinder – volum i rør", "4) Cylinder – water volume in pipe"),
+                "scenario": tt("Du vil vite omtrent hvor mye vann som står i et rør (forenklet).", "Estimate water volume in a pipe."),
+                "question": tt("Rør: innvendig diameter 25 mm, lengde 12 m. Finn volum (liter). (1 m³ = 1000 liter)",
+                               "Pipe: inner diameter 25 mm, length 12 m. Find volume (liters)."),
+                "formula_hint": "V = π·r²·L  (r = d/2). Husk mm→m. liter = m³×1000",
+                "answer": (math.pi*((0.025/2)**2)*12)*1000,
+                "unit": "liter",
+                "tol": 0.2,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("5) Blandingsforhold – prosent", "5) Mixing ratio – percent"),
+                "scenario": tt("Du blander frostvæske i et anlegg (forenklet).", "You mix antifreeze (simplified)."),
+                "question": tt("Du har 40 liter væske. 30% skal være frostvæske. Hvor mange liter frostvæske?",
+                               "You have 40 liters total. 30% should be antifreeze. How many liters antifreeze?"),
+                "formula_hint": "del = (p/100) × hel",
+                "answer": 0.30*40,
+                "unit": "liter",
+                "tol": 0.2,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("6) Areal for gulvvarme", "6) Area for floor heating"),
+                "scenario": tt("Du planlegger gulvvarmesløyfer i et rom.", "You plan underfloor heating loops."),
+                "question": tt("Rom: 4,8 m × 3,6 m. Trekk fra fast innredning 1,2 m². Finn areal som skal varmes (m²).",
+                               "Room: 4.8 m × 3.6 m. Subtract fixed fixtures 1.2 m². Find heated area."),
+                "formula_hint": "A = L×B − A_fast",
+                "answer": (4.8*3.6) - 1.2,
+                "unit": "m²",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("7) Rørisolasjon – omkrets", "7) Pipe insulation – circumference"),
+                "scenario": tt("Du skal beregne omkretsen for å anslå isolasjonsbehov.", "You estimate insulation needs from circumference."),
+                "question": tt("Ytre diameter på rør: 42 mm. Finn omkrets (mm).",
+                               "Outer diameter: 42 mm. Find circumference (mm)."),
+                "formula_hint": "O = π × d",
+                "answer": math.pi*42,
+                "unit": "mm",
+                "tol": 2.0,
+                "rounding": 0,
+                "lk20": LK20
+            },
+            {
+                "title": tt("8) Tappevann – volum i tank", "8) Hot water tank volume"),
+                "scenario": tt("Du sjekker kapasitet på varmtvannstank (forenklet boks).", "Estimate hot water tank capacity (box approximation)."),
+                "question": tt("Tank (forenklet): 0,5 m × 0,5 m × 1,2 m. Finn volum (liter).",
+                               "Tank: 0.5 m × 0.5 m × 1.2 m. Find volume (liters)."),
+                "formula_hint": "V = L×B×H; liter = m³×1000",
+                "answer": (0.5*0.5*1.2)*1000,
+                "unit": "liter",
+                "tol": 2.0,
+                "rounding": 0,
+                "lk20": LK20
+            },
+            {
+                "title": tt("9) Avstand mellom rørklammer", "9) Clamp spacing"),
+                "scenario": tt("Du skal sette rørklammer jevnt.", "You place pipe clamps evenly."),
+                "question": tt("Rørstrekk: 4,2 m. Klammer hver 0,6 m + én i hver ende. Hvor mange klammer?",
+                               "Run: 4.2 m. Clamps every 0.6 m + one at each end. How many clamps?"),
+                "formula_hint": "antall = (lengde / avstand) + 1",
+                "answer": math.floor(4.2/0.6)+1,
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("10) Temperaturfall – differanse", "10) Temperature drop"),
+                "scenario": tt("Du dokumenterer enkelt temperaturfall i et system (forenklet).", "Document a simple temperature drop."),
+                "question": tt("Turtemperatur: 42°C. Retur: 34°C. Hva er temperaturfallet (°C)?",
+                               "Supply: 42°C. Return: 34°C. What is the temperature drop?"),
+                "formula_hint": "ΔT = T_tur − T_retur",
+                "answer": 42-34,
+                "unit": "°C",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+        ],
+
+        tt("Blikkenslager", "Sheet metal worker"): [
+            {
+                "title": tt("1) Renne – total lengde", "1) Gutter length"),
+                "scenario": tt("Du skal bestille takrenner.", "You are ordering gutters."),
+                "question": tt("Bygg: 10,8 m × 7,2 m. Renner på to langsider (10,8 m). Legg til 5% kapp. Hvor mange meter bestilles?",
+                               "Building: 10.8 m × 7.2 m. Gutters on two long sides (10.8 m). Add 5% waste. How many meters?"),
+                "formula_hint": "LM = 2×lengde;  LM_bestill = LM×(1+svinn/100)",
+                "answer": (2*10.8)*1.05,
+                "unit": "m",
+                "tol": 0.2,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("2) Nedløp – antall rørstykker", "2) Downpipe count"),
+                "scenario": tt("Nedløp leveres i 3,0 m lengder.", "Downpipes come in 3.0 m lengths."),
+                "question": tt("Bygget har 2 etasjer, total høyde 5,4 m. Ett nedløp per hjørne (4 stk). Hvor mange 3,0 m rørstykker trengs totalt? (avrund opp per nedløp)",
+                               "Total height 5.4 m. One downpipe per corner (4). How many 3.0 m pieces total?"),
+                "formula_hint": "stykker per nedløp = ceil(høyde/3,0); total = per×4",
+                "answer": math.ceil(5.4/3.0)*4,
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("3) Luftkanal – tverrsnittsareal", "3) Vent duct cross-section area"),
+                "scenario": tt("Du dimensjonerer en rektangulær kanal (forenklet).", "You size a rectangular duct (simplified)."),
+                "question": tt("Kanal: 200 mm × 150 mm. Finn tverrsnittsareal i cm².",
+                               "Duct: 200 mm × 150 mm. Find cross-sectional area in cm²."),
+                "formula_hint": "A = L×B; mm→cm: ÷10",
+                "answer": (20*15),  # cm x cm
+                "unit": "cm²",
+                "tol": 1.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("4) Platekledning – areal med svinn", "4) Sheet area with waste"),
+                "scenario": tt("Du skal bestille plate/metall til en kasseinnkledning.", "You order sheet metal for a casing."),
+                "question": tt("Areal: 12,0 m². Legg til 12% svinn. Hvor mange m² bestiller du?",
+                               "Area: 12.0 m². Add 12% waste. How many m² to order?"),
+                "formula_hint": "A_bestill = A × (1 + svinn/100)",
+                "answer": 12.0*1.12,
+                "unit": "m²",
+                "tol": 0.1,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("5) Pipegjennomføring – omkrets", "5) Pipe penetration – circumference"),
+                "scenario": tt("Du lager en mansjett rundt et rundt rør.", "You make a collar around a round pipe."),
+                "question": tt("Diameter på rør: 110 mm. Hvor lang stripe trengs rundt (mm) uten overlapp?",
+                               "Pipe diameter: 110 mm. What strip length is needed around it (mm), no overlap?"),
+                "formula_hint": "O = π × d",
+                "answer": math.pi*110,
+                "unit": "mm",
+                "tol": 3.0,
+                "rounding": 0,
+                "lk20": LK20
+            },
+            {
+                "title": tt("6) Koning – enkel prosentvis avkorting", "6) Tapering – percent reduction"),
+                "scenario": tt("Du lager en kon (forenklet) og må redusere omkrets 8%.", "You taper a piece and reduce circumference by 8%."),
+                "question": tt("Opprinnelig omkrets: 520 mm. Reduser 8%. Hva blir ny omkrets?",
+                               "Original circumference: 520 mm. Reduce by 8%. New circumference?"),
+                "formula_hint": "ny = gammel × (1 − p/100)",
+                "answer": 520*(1-0.08),
+                "unit": "mm",
+                "tol": 2.0,
+                "rounding": 0,
+                "lk20": LK20
+            },
+            {
+                "title": tt("7) Beslag – lengde + overlapp", "7) Flashing – length + overlap"),
+                "scenario": tt("Du legger beslag med overlapp.", "You install flashing with overlap."),
+                "question": tt("Du har 14,4 m lengde. Overlapp 100 mm per skjøt. Du bruker 6 lengder (skjøter=5). Hvor mange meter beslag går med totalt?",
+                               "Run is 14.4 m. Overlap 100 mm per joint. You use 6 lengths (5 joints). Total length used?"),
+                "formula_hint": "total = lengde + (antall_skjøter × overlapp). 100 mm = 0,1 m",
+                "answer": 14.4 + (5*0.1),
+                "unit": "m",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("8) Takrennefall", "8) Gutter slope"),
+                "scenario": tt("Takrenne skal ha lite fall mot nedløp.", "Gutters need a slight fall to the downpipe."),
+                "question": tt("Krav: 3 mm fall per meter. Lengde: 8,0 m. Hvor mange mm fall totalt?",
+                               "Requirement: 3 mm per meter. Length: 8.0 m. Total drop (mm)?"),
+                "formula_hint": "fall_tot = mm per m × lengde",
+                "answer": 3*8.0,
+                "unit": "mm",
+                "tol": 1.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("9) Kanal – overflateareal (for isolasjon)", "9) Duct surface area (insulation)"),
+                "scenario": tt("Du skal anslå isolasjonsbehov rundt en rektangulær kanal.", "You estimate insulation for a rectangular duct."),
+                "question": tt("Kanal: 0,30 m × 0,20 m, lengde 6,0 m. Finn overflateareal av sideflatene (m²) (ikke endeflater).",
+                               "Duct: 0.30 m × 0.20 m, length 6.0 m. Find side surface area (m²), ignore ends."),
+                "formula_hint": "A_side = omkrets_tverrsnitt × lengde = 2(a+b)×L",
+                "answer": (2*(0.30+0.20))*6.0,
+                "unit": "m²",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("10) Platekutting – utnyttelse", "10) Sheet cutting utilization"),
+                "scenario": tt("Du vil se hvor stor andel av platen som faktisk brukes.", "You check how much of a sheet is used."),
+                "question": tt("Plate: 1,0 m². Du bruker 0,78 m². Hvor stor utnyttelse i %?",
+                               "Sheet: 1.0 m². You use 0.78 m². Utilization in %?"),
+                "formula_hint": "prosent = (del / hel) × 100",
+                "answer": (0.78/1.0)*100,
+                "unit": "%",
+                "tol": 0.5,
+                "rounding": 1,
+                "lk20": LK20
+            },
+        ],
+
+        tt("Mur og betong", "Masonry & concrete"): [
+            {
+                "title": tt("1) Betongplate – volum", "1) Slab concrete volume"),
+                "scenario": tt("Du skal bestille betong til en plate.", "You order concrete for a slab."),
+                "question": tt("Plate: 7,2 m × 3,6 m × 100 mm. Finn volum (m³).",
+                               "Slab: 7.2 m × 3.6 m × 100 mm. Find volume (m³)."),
+                "formula_hint": "V = L×B×t;  100 mm = 0,10 m",
+                "answer": 7.2*3.6*0.10,
+                "unit": "m³",
+                "tol": 0.02,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("2) Betong med svinn", "2) Concrete with waste"),
+                "scenario": tt("Du legger til svinn for søl og ujevnheter.", "Add waste for spillage and irregularities."),
+                "question": tt("Du har beregnet 2,59 m³ betong. Legg til 8% svinn. Hvor mye bestiller du (m³)?",
+                               "You calculated 2.59 m³. Add 8% waste. How much do you order?"),
+                "formula_hint": "V_bestill = V × (1 + svinn/100)",
+                "answer": 2.59*1.08,
+                "unit": "m³",
+                "tol": 0.03,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("3) Armering – antall jern", "3) Rebar count"),
+                "scenario": tt("Du legger armeringsjern med c/c-avstand.", "You place rebar at a given spacing."),
+                "question": tt("Platebredde: 3,6 m. Jern c/c 0,20 m. Hvor mange jern trengs hvis du har jern i hver kant?",
+                               "Width: 3.6 m. Spacing 0.20 m. How many bars if one at each edge?"),
+                "formula_hint": "antall = (bredde / c/c) + 1",
+                "answer": math.floor(3.6/0.20)+1,
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("4) Murstein – areal og antall", "4) Bricks – area and count"),
+                "scenario": tt("Du beregner antall murstein basert på areal og forbruk.", "Estimate bricks from wall area and rate."),
+                "question": tt("Vegg: 4,8 m × 2,4 m. Forbruk: 60 stein per m². Hvor mange stein (avrund opp)?",
+                               "Wall: 4.8 m × 2.4 m. Rate: 60 bricks per m². How many (round up)?"),
+                "formula_hint": "antall = areal × forbruk; avrund opp",
+                "answer": math.ceil((4.8*2.4)*60),
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("5) Puss – blanding (prosent)", "5) Plaster mix (percent)"),
+                "scenario": tt("Du blander mørtel (forenklet prosentandel).", "Mix mortar (simplified percent)."),
+                "question": tt("Du trenger 25 kg blanding. 12% skal være sement. Hvor mange kg sement?",
+                               "Need 25 kg total. 12% is cement. How many kg cement?"),
+                "formula_hint": "del = (p/100) × hel",
+                "answer": 0.12*25,
+                "unit": "kg",
+                "tol": 0.1,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("6) Fundament – volum", "6) Footing volume"),
+                "scenario": tt("Du støper fundamentstripe.", "You pour a strip footing."),
+                "question": tt("Stripe: 12,0 m lang × 0,4 m bred × 0,3 m høy. Finn volum (m³).",
+                               "Footing: 12.0 m × 0.4 m × 0.3 m. Volume (m³)?"),
+                "formula_hint": "V = L×B×H",
+                "answer": 12.0*0.4*0.3,
+                "unit": "m³",
+                "tol": 0.02,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("7) Forskaling – areal", "7) Formwork area"),
+                "scenario": tt("Du skal anslå forskalingsareal på sider av en bjelke (forenklet).", "Estimate formwork area on beam sides."),
+                "question": tt("Bjelke: lengde 6,0 m, høyde 0,5 m. To sider. Finn areal (m²).",
+                               "Beam: length 6.0 m, height 0.5 m. Two sides. Area (m²)?"),
+                "formula_hint": "A = 2 × (L × H)",
+                "answer": 2*(6.0*0.5),
+                "unit": "m²",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("8) Fall på betonggulv mot sluk", "8) Concrete floor slope to drain"),
+                "scenario": tt("Gulvet skal ha fall mot sluk.", "Floor needs slope to drain."),
+                "question": tt("Fallkrav: 1,5% over 3,0 m. Hvor mange mm fall?",
+                               "Slope: 1.5% over 3.0 m. How many mm drop?"),
+                "formula_hint": "fall(mm) = (pct/100) × lengde(m) × 1000",
+                "answer": (1.5/100)*3.0*1000,
+                "unit": "mm",
+                "tol": 2.0,
+                "rounding": 0,
+                "lk20": LK20
+            },
+            {
+                "title": tt("9) Blandingsvann – liter", "9) Mixing water liters"),
+                "scenario": tt("Sekketøy krever vann pr. sekk (forenklet).", "Bagged mix needs water per bag."),
+                "question": tt("Du bruker 12 sekker. 2,8 liter vann per sekk. Hvor mange liter vann totalt?",
+                               "You use 12 bags. 2.8 L per bag. Total liters?"),
+                "formula_hint": "liter = antall × liter_per_sekk",
+                "answer": 12*2.8,
+                "unit": "liter",
+                "tol": 0.2,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("10) Armeringsnett – antall nett", "10) Mesh sheets count"),
+                "scenario": tt("Armeringsnett leveres i plater.", "Rebar mesh comes in sheets."),
+                "question": tt("Plateareal: 25 m². Ett nett dekker 2,15 m × 5,0 m. Hvor mange nett trengs (avrund opp)?",
+                               "Slab area: 25 m². One mesh covers 2.15 m × 5.0 m. How many sheets (round up)?"),
+                "formula_hint": "antall = total_areal / nett_areal; avrund opp",
+                "answer": math.ceil(25 / (2.15*5.0)),
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+        ],
+
+        tt("Flislegger", "Tiler"): [
+            {
+                "title": tt("1) Antall fliser på gulv", "1) Number of tiles on floor"),
+                "scenario": tt("Du skal bestille fliser til et gulv.", "You are ordering tiles for a floor."),
+                "question": tt("Rom: 3,6 m × 2,4 m. Flis: 30 cm × 30 cm. Legg til 10% svinn. Hvor mange fliser bestiller du? (avrund opp)",
+                               "Room: 3.6 m × 2.4 m. Tile: 30 cm × 30 cm. Add 10% waste. How many tiles?"),
+                "formula_hint": "A_rom = L×B. A_flis = 0,30×0,30. antall = (A_rom/A_flis)×(1+svinn) avrund opp",
+                "answer": math.ceil(((3.6*2.4)/(0.30*0.30))*1.10),
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("2) Flis på vegg med dør", "2) Wall tiling with door"),
+                "scenario": tt("Du skal flislegge en vegg, men trekker fra dør.", "You tile a wall and subtract a door opening."),
+                "question": tt("Vegg: 4,8 m × 2,4 m. Dør: 0,9 × 2,1 m. Finn netto flisareal (m²).",
+                               "Wall: 4.8 m × 2.4 m. Door: 0.9 × 2.1 m. Net tiling area (m²)?"),
+                "formula_hint": "A_netto = (L×H) − (dør_b×dør_h)",
+                "answer": (4.8*2.4)-(0.9*2.1),
+                "unit": "m²",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("3) Limforbruk", "3) Adhesive consumption"),
+                "scenario": tt("Lim har forbruk per m².", "Adhesive has a consumption per m²."),
+                "question": tt("Du skal dekke 18 m². Forbruk 3,5 kg/m². Hvor mange kg lim trengs?",
+                               "Cover 18 m². Rate 3.5 kg/m². How many kg adhesive?"),
+                "formula_hint": "kg = areal × kg_per_m²",
+                "answer": 18*3.5,
+                "unit": "kg",
+                "tol": 0.5,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("4) Fugemasse", "4) Grout"),
+                "scenario": tt("Du legger til svinn på fugemasse.", "Add waste for grout."),
+                "question": tt("Beregnet behov: 12,0 kg. Legg til 8% svinn. Hvor mange kg bestiller du?",
+                               "Calculated: 12.0 kg. Add 8% waste. How many kg to order?"),
+                "formula_hint": "bestill = behov × (1 + svinn/100)",
+                "answer": 12.0*1.08,
+                "unit": "kg",
+                "tol": 0.2,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("5) Fall mot sluk", "5) Slope to drain"),
+                "scenario": tt("Baderomsgulv skal ha fall mot sluk.", "Bathroom floor needs slope to drain."),
+                "question": tt("Fall: 2,0% over 1,8 m. Hvor mange mm fall?",
+                               "Slope: 2.0% over 1.8 m. How many mm drop?"),
+                "formula_hint": "fall(mm) = (pct/100) × lengde(m) × 1000",
+                "answer": (2.0/100)*1.8*1000,
+                "unit": "mm",
+                "tol": 2.0,
+                "rounding": 0,
+                "lk20": LK20
+            },
+            {
+                "title": tt("6) Sokkel/flislist (løpemeter)", "6) Tile trim (running meters)"),
+                "scenario": tt("Du skal legge flislist langs vegg.", "You install tile trim along walls."),
+                "question": tt("Rom: 2,4 m × 2,0 m. Du har døråpning 0,8 m uten list. Hvor mange meter list?",
+                               "Room: 2.4 m × 2.0 m. Door opening 0.8 m without trim. How many meters?"),
+                "formula_hint": "O = 2(L+B) − dørbredde",
+                "answer": (2*(2.4+2.0)) - 0.8,
+                "unit": "m",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("7) Fliser per rad", "7) Tiles per row"),
+                "scenario": tt("Du planlegger flislegging uten kapp (forenklet).", "Plan tiling without cuts (simplified)."),
+                "question": tt("Vegglengde: 3,0 m. Flis: 25 cm bred. Hvor mange fliser går det per rad? (avrund opp)",
+                               "Wall length: 3.0 m. Tile width: 25 cm. Tiles per row (round up)?"),
+                "formula_hint": "antall = lengde / flisbredde. 25 cm = 0,25 m",
+                "answer": math.ceil(3.0/0.25),
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("8) Pris – rabatt", "8) Price – discount"),
+                "scenario": tt("Du får rabatt hos leverandør.", "You get a supplier discount."),
+                "question": tt("Fliser koster 19 800 kr. Rabatt 10%. Hva betaler du?",
+                               "Tiles cost 19,800 NOK. 10% discount. What do you pay?"),
+                "formula_hint": "ny pris = gammel × (1 − p/100)",
+                "answer": 19800*(1-0.10),
+                "unit": "kr",
+                "tol": 5.0,
+                "rounding": 0,
+                "lk20": LK20
+            },
+            {
+                "title": tt("9) Membran – areal", "9) Waterproofing membrane area"),
+                "scenario": tt("Du beregner membran på gulv.", "You calculate membrane on floor."),
+                "question": tt("Gulv: 2,6 m × 1,9 m. Legg til 5% svinn. Hvor mange m² membran?",
+                               "Floor: 2.6 m × 1.9 m. Add 5% waste. How many m² membrane?"),
+                "formula_hint": "A_bestill = (L×B) × (1+svinn/100)",
+                "answer": (2.6*1.9)*1.05,
+                "unit": "m²",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("10) Flis – areal per pakke", "10) Tiles – area per box"),
+                "scenario": tt("Fliser selges i pakker med oppgitt m².", "Tiles are sold by box with m² coverage."),
+                "question": tt("Du trenger 14,6 m². Én pakke dekker 1,44 m². Hvor mange pakker trenger du? (avrund opp)",
+                               "Need 14.6 m². One box covers 1.44 m². How many boxes?"),
+                "formula_hint": "pakker = total / per_pakke; avrund opp",
+                "answer": math.ceil(14.6/1.44),
+                "unit": "pakker",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+        ],
+
+        tt("Anleggsarbeider", "Construction worker (civil works)"): [
+            {
+                "title": tt("1) Masseutskifting – volum", "1) Earthworks – volume"),
+                "scenario": tt("Du skal grave ut og fylle på pukk.", "You excavate and refill with aggregate."),
+                "question": tt("Grøft: 12 m lang, 0,6 m bred, 0,4 m dyp. Finn volum (m³).",
+                               "Trench: 12 m long, 0.6 m wide, 0.4 m deep. Volume (m³)?"),
+                "formula_hint": "V = L×B×D",
+                "answer": 12*0.6*0.4,
+                "unit": "m³",
+                "tol": 0.02,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("2) Komprimering – ekstra masse", "2) Compaction – extra material"),
+                "scenario": tt("Du legger til 15% for komprimering og svinn.", "Add 15% for compaction/waste."),
+                "question": tt("Du har beregnet 2,88 m³ pukk. Legg til 15%. Hvor mye bestiller du (m³)?",
+                               "You calculated 2.88 m³. Add 15%. How much to order?"),
+                "formula_hint": "V_bestill = V × (1 + p/100)",
+                "answer": 2.88*1.15,
+                "unit": "m³",
+                "tol": 0.03,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("3) Areal for geotekstil", "3) Geotextile area"),
+                "scenario": tt("Du legger geotekstil i bunnen.", "You lay geotextile."),
+                "question": tt("Areal: 18 m × 3,0 m. Legg til 10% overlapp. Hvor mange m² trengs?",
+                               "Area: 18 m × 3.0 m. Add 10% overlap. How many m² needed?"),
+                "formula_hint": "A = L×B;  A_total = A×(1+overlapp/100)",
+                "answer": (18*3.0)*1.10,
+                "unit": "m²",
+                "tol": 0.2,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("4) Stigning på rampe", "4) Ramp gradient"),
+                "scenario": tt("Du skal sjekke stigning på en rampe.", "You check ramp gradient."),
+                "question": tt("Høydeforskjell 0,24 m over lengde 6,0 m. Finn stigning i %.",
+                               "Rise 0.24 m over 6.0 m. Find gradient in %."),
+                "formula_hint": "stigning(%) = (høyde / lengde) × 100",
+                "answer": (0.24/6.0)*100,
+                "unit": "%",
+                "tol": 0.2,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("5) Målestokk – virkelighet fra tegning", "5) Scale – real size from drawing"),
+                "scenario": tt("Du leser arbeidstegning.", "You read a construction drawing."),
+                "question": tt("På tegning (1:50) måler du 72 mm. Hvor mange meter er dette i virkeligheten?",
+                               "On a 1:50 drawing you measure 72 mm. How many meters in reality?"),
+                "formula_hint": "virkelighet = tegning × 50. 72 mm × 50 = 3600 mm = 3,6 m",
+                "answer": 3.6,
+                "unit": "m",
+                "tol": 0.02,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("6) Kantstein – antall", "6) Curb stones – count"),
+                "scenario": tt("Kantstein leveres i 1,0 m lengder.", "Curbstones come in 1.0 m lengths."),
+                "question": tt("Strekning: 34 m. Legg til 5% svinn/kapp. Hvor mange stein (avrund opp)?",
+                               "Length: 34 m. Add 5% waste. How many stones (round up)?"),
+                "formula_hint": "antall = lengde×(1+svinn) / 1,0; avrund opp",
+                "answer": math.ceil(34*1.05),
+                "unit": "stk",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+            {
+                "title": tt("7) Asfalt – volum", "7) Asphalt volume"),
+                "scenario": tt("Du skal legge asfalt på et område.", "You pave an area with asphalt."),
+                "question": tt("Areal: 120 m². Tykkelse: 45 mm. Finn volum (m³).",
+                               "Area: 120 m². Thickness: 45 mm. Volume (m³)?"),
+                "formula_hint": "V = areal × tykkelse. 45 mm = 0,045 m",
+                "answer": 120*0.045,
+                "unit": "m³",
+                "tol": 0.05,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("8) Rør i grøft – fall", "8) Pipe in trench – slope"),
+                "scenario": tt("Du legger overvannsrør med fall.", "You lay stormwater pipe with slope."),
+                "question": tt("Fallkrav: 1,0% over 18 m. Hvor mange cm fall?",
+                               "Slope: 1.0% over 18 m. How many cm drop?"),
+                "formula_hint": "fall(m) = (pct/100)×lengde; cm = m×100",
+                "answer": ((1.0/100)*18)*100,
+                "unit": "cm",
+                "tol": 0.5,
+                "rounding": 1,
+                "lk20": LK20
+            },
+            {
+                "title": tt("9) Grusdekke – areal og tonn (forenklet)", "9) Gravel – area and tonnes (simplified)"),
+                "scenario": tt("Du bestiller grus. (Forenklet regning med fast vekt).", "You order gravel (simplified with fixed density)."),
+                "question": tt("Areal 60 m², tykkelse 0,05 m. Tetthet (forenklet): 1,6 tonn per m³. Hvor mange tonn?",
+                               "Area 60 m², thickness 0.05 m. Density: 1.6 tonnes per m³. How many tonnes?"),
+                "formula_hint": "V = A×t; tonn = V × 1,6",
+                "answer": (60*0.05)*1.6,
+                "unit": "tonn",
+                "tol": 0.2,
+                "rounding": 2,
+                "lk20": LK20
+            },
+            {
+                "title": tt("10) Dreneringsrør – antall kveil", "10) Drain pipe – coil count"),
+                "scenario": tt("Dreneringsrør leveres i kveil på 25 m.", "Drain pipes come in 25 m coils."),
+                "question": tt("Du trenger 78 m drensrør. Hvor mange kveiler må du kjøpe? (avrund opp)",
+                               "You need 78 m. How many 25 m coils?"),
+                "formula_hint": "kveiler = ceil(total / 25)",
+                "answer": math.ceil(78/25),
+                "unit": "kveiler",
+                "tol": 0.0,
+                "integer": True,
+                "lk20": LK20
+            },
+        ],
+    }
+
+
+@lru_cache(maxsize=None)  # én gang per språk
+def vty_tasks(language: str = "NO"):
+    """Oppgavene per yrke på språket ("NO"/"EN"): {yrke: (VtyTask, ...)}, skrivebeskyttet."""
+    return MappingProxyType({trade: tuple(VtyTask(**t) for t in tasks)
+                             for trade, tasks in _task_source(language).items()})
+
+
+# ============================================================
+# Case-kort i show_vty_content (10 per yrke)
+# ============================================================
+_CASE_SOURCE = {
+    "Tømrer": [
+        {
+            "title": "Stenderverk – antall stendere",
+            "scenario": "Du skal bygge en vegg på 4,80 m. Stenderavstand c/c 600 mm. Husk stender i hver ende.",
+            "ask": "Hvor mange stendere trenger du?",
+            "hint": "Antall felt = lengde / c/c. Antall stendere = antall felt + 1.",
+            "solution": "4,80 m / 0,60 m = 8 felt → 9 stendere (inkludert endestendere).",
+            "lk20": "Måle/beregne materialforbruk og planlegge arbeid."
+        },
+        {
+            "title": "Gulv – areal og materialforbruk",
+            "scenario": "Et rom er 3,6 m × 4,2 m. Du skal legge gulvspon. Husk 10 % svinn.",
+            "ask": "Hvor stort areal er gulvet, og hvor mye areal må du bestille med svinn?",
+            "hint": "A = l × b. Bestilling = A × 1,10.",
+            "solution": "A = 3,6 × 4,2 = 15,12 m². Med svinn: 15,12 × 1,10 = 16,63 m² (avrund opp).",
+            "lk20": "Beregne areal, svinn og planlegge materialer."
+        },
+        {
+            "title": "Tak – fall og høydeforskjell",
+            "scenario": "Et tak har fall 1:40. Horisontal lengde fra møne til raft er 5,2 m.",
+            "ask": "Hva er høydeforskjellen mellom møne og raft?",
+            "hint": "Fall 1:40 betyr 1 enhet opp per 40 enheter bort. H = L/40.",
+            "solution": "H = 5,2/40 = 0,13 m = 130 mm.",
+            "lk20": "Bruke mål og beregne høyder/fall i konstruksjoner."
+        },
+        {
+            "title": "Kledning – antall bord",
+            "scenario": "En fasade er 6,0 m bred og 2,4 m høy. Du bruker stående kledning 148 mm med 5 mm spalte (effektiv bredde 143 mm).",
+            "ask": "Hvor mange bord trenger du i bredden?",
+            "hint": "Antall = bredde / effektiv bredde.",
+            "solution": "6,0 m / 0,143 m ≈ 41,96 → 42 bord.",
+            "lk20": "Beregne materialbehov og tilpasse til utførelse."
+        },
+        {
+            "title": "Betongforskaling – mengde forskalingsplater",
+            "scenario": "Du forskaler en stripefundament-side: 12 m lengde og 0,5 m høyde. Plateformat 1,2 × 2,4 m.",
+            "ask": "Hvor mange plater trengs (kun én side), uten svinn?",
+            "hint": "Flate = L × H. Plateareal = 1,2 × 2,4.",
+            "solution": "Flate = 12 × 0,5 = 6,0 m². Plateareal = 2,88 m². 6,0/2,88 = 2,08 → 3 plater.",
+            "lk20": "Beregne areal og materialbehov til forskaling."
+        },
+        {
+            "title": "Trapp – stigningsforhold",
+            "scenario": "Etasjeskille: 2,64 m. Du planlegger 15 opptrinn.",
+            "ask": "Hva blir opptrinnshøyden i mm?",
+            "hint": "Opptrinn = total høyde / antall opptrinn.",
+            "solution": "2,64 m / 15 = 0,176 m = 176 mm.",
+            "lk20": "Beregne dimensjoner og tilpasse ergonomi/utførelse."
+        },
+        {
+            "title": "Bjelkelag – volum trevirke",
+            "scenario": "Du skal bestille 48×198 mm bjelker. Det går 14 bjelker á 4,8 m.",
+            "ask": "Hva er totalt volum trevirke i m³?",
+            "hint": "Volum = b×h×L. Husk å omregne mm→m.",
+            "solution": "Én bjelke: 0,048×0,198×4,8=0,0456 m³. Totalt: 14×0,0456=0,638 m³.",
+            "lk20": "Beregne volum og materialmengder."
+        },
+        {
+            "title": "Isolasjon – m² og pakkebehov",
+            "scenario": "Vegger: 2 rom, hver med veggareal 22 m². Isolasjonspakke dekker 5,4 m². 10 % svinn.",
+            "ask": "Hvor mange pakker trenger du?",
+            "hint": "Total A × 1,10 / dekningsgrad.",
+            "solution": "Total A=44 m². Med svinn: 48,4 m². 48,4/5,4=8,96 → 9 pakker.",
+            "lk20": "Beregne materialforbruk og bestilling."
+        },
+        {
+            "title": "Målestokk – lese arbeidstegning",
+            "scenario": "På en tegning i målestokk 1:50 måler du en vegg til 84 mm på papiret.",
+            "ask": "Hva er virkelig lengde i meter?",
+            "hint": "1:50 → multipliser med 50. 84 mm×50 = mm i virkelighet.",
+            "solution": "84×50=4200 mm=4,2 m.",
+            "lk20": "Tolke tegninger og bruke målestokk."
+        },
+        {
+            "title": "Kapp – optimal kutting",
+            "scenario": "Du har 4,8 m lengder. Du trenger 12 stk á 1,55 m. Du kan ikke skjøte.",
+            "ask": "Hvor mange 4,8 m lengder må du kjøpe, og hvor mye svinn får du (i meter)?",
+            "hint": "Fra 4,8 m får du maks ⌊4,8/1,55⌋ biter. Svinn per lengde = 4,8 − (antall biter × 1,55).",
+            "solution": "⌊4,8/1,55⌋=3 biter per lengde. Trenger 12 biter → 4 lengder. Svinn per lengde: 4,8−4,65=0,15 m. Totalt svinn: 0,60 m.",
+            "lk20": "Planlegge materialbruk og redusere svinn."
+        },
+    ],
+    "Rørlegger": [
+        {
+            "title": "Fall på avløp",
+            "scenario": "Avløpsrør skal ha fall 1:50. Strekket er 7,5 m.",
+            "ask": "Hvor mange mm fall skal du ha totalt?",
+            "hint": "H = L/50.",
+            "solution": "7,5/50=0,15 m=150 mm.",
+            "lk20": "Beregne fall og sikre funksjon/utførelse."
+        },
+        {
+            "title": "Rørvolum – hvor mye vann står i røret?",
+            "scenario": "Et PEX-rør har innvendig diameter 16 mm og lengde 12 m.",
+            "ask": "Hvor mange liter vann rommer røret (omtrent)?",
+            "hint": "Volum sylinder: V = π·r²·L. 1 liter = 0,001 m³.",
+            "solution": "r=0,008 m. V=π·(0,008²)·12≈0,00241 m³≈2,41 liter.",
+            "lk20": "Bruke volumformel og enhetsomregning."
+        },
+        {
+            "title": "Blandingsforhold",
+            "scenario": "Glykolblanding: 35 % glykol. Du har 18 liter ferdig blanding.",
+            "ask": "Hvor mange liter glykol trenger du?",
+            "hint": "Mengde = total × prosent.",
+            "solution": "18×0,35=6,3 liter glykol.",
+            "lk20": "Prosentregning i praktisk arbeid."
+        },
+        {
+            "title": "Trykktap (forenklet)",
+            "scenario": "Du bruker en tommelfingerregel: 0,25 bar trykktap per 10 m i et strekk. Strekket er 26 m.",
+            "ask": "Hva blir trykktapet i bar?",
+            "hint": "Proporsjonal skalering.",
+            "solution": "26/10×0,25=0,65 bar.",
+            "lk20": "Forstå proporsjoner og beregne konsekvenser."
+        },
+        {
+            "title": "Rørkapping – vinkel og lengde",
+            "scenario": "Du skal lage en 45°-bend ved å kutte to rørstykker som møtes. Du trenger 300 mm fra bend til bend langs senterlinje.",
+            "ask": "Hva blir lengden på hvert stykke hvis du deler likt (forenklet) og ignorerer fittings-lengde?",
+            "hint": "Del total lengde på 2.",
+            "solution": "300/2 = 150 mm per stykke.",
+            "lk20": "Beregne lengder og planlegge montasje."
+        },
+        {
+            "title": "Varmekabel – effekt",
+            "scenario": "Bad: 6,2 m². Du skal ha 100 W/m². Nettspenning 230 V.",
+            "ask": "Hva blir total effekt (W) og strøm (A) omtrent?",
+            "hint": "P = A×W/m². I = P/V.",
+            "solution": "P=6,2×100=620 W. I=620/230≈2,70 A.",
+            "lk20": "Beregne effekt/strøm i praktiske installasjoner (tverrfaglig)."
+        },
+        {
+            "title": "Tappevann – tid til fylling",
+            "scenario": "En kran fyller 9 liter per minutt. Du skal fylle en bøtte på 25 liter.",
+            "ask": "Hvor lang tid tar det (minutter og sekunder)?",
+            "hint": "Tid = volum / flow.",
+            "solution": "25/9=2,78 min ≈ 2 min 47 sek.",
+            "lk20": "Beregne tid/kapasitet."
+        },
+        {
+            "title": "Isolasjon på rør – omkrets",
+            "scenario": "Et rør har utvendig diameter 28 mm. Du skal beregne omkrets for å velge isolasjon.",
+            "ask": "Hva er omkretsen i mm (omtrent)?",
+            "hint": "O = π·d.",
+            "solution": "O ≈ 3,14×28 ≈ 88 mm.",
+            "lk20": "Bruke omkretsformel og avrunding."
+        },
+        {
+            "title": "Materialbestilling – klammer",
+            "scenario": "Du skal klamre et 10 m rørstrekk. Klammeravstand 0,8 m. Klammer i hver ende.",
+            "ask": "Hvor mange klammer trenger du?",
+            "hint": "Antall felt = L/avstand. Antall klammer = felt + 1.",
+            "solution": "10/0,8=12,5 → 13 felt → 14 klammer.",
+            "lk20": "Beregne festepunkter og planlegge montering."
+        },
+        {
+            "title": "Målestokk – rørstrekk på tegning",
+            "scenario": "Tegning 1:100. Du måler rørstrekk til 62 mm på tegningen.",
+            "ask": "Hva er virkelig lengde i meter?",
+            "hint": "62 mm×100=6200 mm=6,2 m.",
+            "solution": "6,2 m.",
+            "lk20": "Tolke tegninger og bruke målestokk."
+        },
+    ],
+    "Blikkenslager": [
+        {
+            "title": "Takrenne – lengde og skjøter",
+            "scenario": "En langside er 12,6 m. Renner leveres i 3,0 m lengder. Du trenger 10 cm overlapp per skjøt.",
+            "ask": "Hvor mange lengder må du ha, og hvor mange skjøter blir det?",
+            "hint": "Antall lengder = taklengde / 3,0 (avrund opp). Skjøter = lengder − 1.",
+            "solution": "12,6/3,0=4,2 → 5 lengder. Skjøter: 4. (Overlapp håndteres i tilpasning).",
+            "lk20": "Planlegge materialer og tilpasning."
+        },
+        {
+            "title": "Nedløp – kapasitet (forenklet)",
+            "scenario": "Tommelfingerregel: 1 nedløp per 60 m² takflate. Takflate er 138 m².",
+            "ask": "Hvor mange nedløp trengs?",
+            "hint": "Antall = takflate / 60 (avrund opp).",
+            "solution": "138/60=2,3 → 3 nedløp.",
+            "lk20": "Beregne kapasitet og dimensjonering (forenklet)."
+        },
+        {
+            "title": "Beslag – areal og materialforbruk",
+            "scenario": "Du lager et beslag 0,25 m bredt og 8,0 m langt i 0,6 mm plate.",
+            "ask": "Hva er arealet av platen (m²)?",
+            "hint": "A = b×L.",
+            "solution": "0,25×8,0=2,0 m².",
+            "lk20": "Beregne flater og materialforbruk."
+        },
+        {
+            "title": "Knekking – utvikling (forenklet)",
+            "scenario": "Du skal knekkesette et U-profil: bunn 120 mm, sider 2×40 mm, pluss 2×10 mm fals.",
+            "ask": "Hva blir utviklet bredde (mm) før knekking, uten å ta hensyn til knekktillegg?",
+            "hint": "Summer alle delbredder.",
+            "solution": "120 + 40 + 40 + 10 + 10 = 220 mm.",
+            "lk20": "Forstå utvikling og beregne materialbredde."
+        },
+        {
+            "title": "Taktekking – svinn",
+            "scenario": "Du tekker 72 m² med plater. Du legger til 8 % svinn.",
+            "ask": "Hvor mye areal må bestilles?",
+            "hint": "Bestilling = A×1,08.",
+            "solution": "72×1,08=77,76 m².",
+            "lk20": "Prosent og bestilling."
+        },
+        {
+            "title": "Vinkel – grad og stigning",
+            "scenario": "Et tak har 1:3 stigning (1 opp per 3 bort).",
+            "ask": "Hva er vinkelen i grader (omtrent)?",
+            "hint": "tan(v) = 1/3 → v = arctan(1/3).",
+            "solution": "v ≈ 18,4°.",
+            "lk20": "Bruke trigonometri/forhold ved takarbeid (nivåtilpasset)."
+        },
+        {
+            "title": "Sirkulær kanal – omkrets",
+            "scenario": "Ventilasjonskanal Ø160 mm.",
+            "ask": "Hva er omkretsen (mm) omtrent?",
+            "hint": "O = π·d.",
+            "solution": "≈ 3,14×160 = 502 mm.",
+            "lk20": "Omkrets og dimensjonering."
+        },
+        {
+            "title": "Kanal – areal av rektangel",
+            "scenario": "Rektangulær kanal 200×100 mm (innvendig).",
+            "ask": "Hva er tverrsnittsarealet i cm²?",
+            "hint": "A = b×h. 1 cm² = 100 mm².",
+            "solution": "200×100=20000 mm² = 200 cm².",
+            "lk20": "Areal, enhetsomregning."
+        },
+        {
+            "title": "Nedløpsrør – kapp",
+            "scenario": "Du har 3,0 m rør. Du trenger 5 stk á 1,15 m.",
+            "ask": "Hvor mange 3,0 m rør trenger du, og svinn?",
+            "hint": "⌊3,0/1,15⌋ = 2 biter per rør.",
+            "solution": "2 biter per rør → 3 rør gir 6 biter. Svinn per rør: 3,0−2,30=0,70 m. Totalt svinn: 2,10 m (minus tilpasning).",
+            "lk20": "Planlegge kapping og redusere svinn."
+        },
+        {
+            "title": "Målestokk – pipebeslag",
+            "scenario": "Tegning 1:20. Du måler pipebredde til 38 mm på tegningen.",
+            "ask": "Virkelig bredde i mm og cm?",
+            "hint": "38×20=760 mm = 76 cm.",
+            "solution": "760 mm (76 cm).",
+            "lk20": "Tolke tegninger og omregne."
+        },
+    ],
+    "Mur og betong": [
+        {
+            "title": "Betong – volum i fundament",
+            "scenario": "Fundament: 8,0 m × 0,4 m × 0,25 m.",
+            "ask": "Hvor mange m³ betong trenger du?",
+            "hint": "V = l×b×h.",
+            "solution": "8,0×0,4×0,25=0,80 m³.",
+            "lk20": "Volum og materialforbruk."
+        },
+        {
+            "title": "Mørtel – blandingsforhold",
+            "scenario": "Du blander mørtel: 1 del sement til 4 deler sand. Total blanding 50 liter (volum).",
+            "ask": "Hvor mange liter sement og sand trenger du?",
+            "hint": "Total deler = 5. Sement = 1/5, sand = 4/5.",
+            "solution": "Sement: 10 L. Sand: 40 L.",
+            "lk20": "Forhold og blanding i praksis."
+        },
+        {
+            "title": "Armering – kapp og overlapp",
+            "scenario": "Du skal armerere en stripe på 11,2 m med 12 m jern, men krever 0,6 m overlapp ved skjøt.",
+            "ask": "Holder ett 12 m jern, eller må du skjøte? Hvis skjøt: hvor mye effektiv lengde får du ved 2 jern?",
+            "hint": "Ved skjøt mister du overlappen i effektiv lengde.",
+            "solution": "11,2 m < 12 m → ett jern holder (med tilpasning). Ved 2 jern: effektiv lengde = 12 + 12 − 0,6 = 23,4 m.",
+            "lk20": "Planlegge armering og forstå overlapp."
+        },
+        {
+            "title": "Puss – areal og mengde",
+            "scenario": "Du pusser en vegg 3,2×2,5 m. Forbruk 14 kg/m².",
+            "ask": "Hvor mange kg puss trenger du?",
+            "hint": "Mengde = A×forbruk.",
+            "solution": "A=8,0 m². Mengde=8,0×14=112 kg.",
+            "lk20": "Beregne mengde og bestilling."
+        },
+        {
+            "title": "Murstein – antall stein",
+            "scenario": "Veggareal 9,6 m². Tommelfingerregel 60 stein per m².",
+            "ask": "Hvor mange murstein trenger du?",
+            "hint": "Antall = A×60.",
+            "solution": "9,6×60=576 stein.",
+            "lk20": "Beregne materialforbruk."
+        },
+        {
+            "title": "Blanding – prosent vann",
+            "scenario": "Betongtilsetning: vannmengde er 8 % av tørrstoffmengde. Tørrstoff er 420 kg.",
+            "ask": "Hvor mange kg vann?",
+            "hint": "Prosent av mengde.",
+            "solution": "420×0,08=33,6 kg vann (≈33,6 liter).",
+            "lk20": "Prosent og enhetsforståelse."
+        },
+        {
+            "title": "Helning – rampe",
+            "scenario": "En rampe skal ha maks 1:15. Du har 0,72 m høydeforskjell.",
+            "ask": "Hvor lang må rampen være minst?",
+            "hint": "L = H×15.",
+            "solution": "0,72×15=10,8 m.",
+            "lk20": "Beregne helning og universell utforming (tverrfaglig)."
+        },
+        {
+            "title": "Forskaling – omkrets",
+            "scenario": "Du forskaler en søyle med tverrsnitt 0,35×0,35 m.",
+            "ask": "Hva er omkretsen rundt (m)?",
+            "hint": "O = 4×side.",
+            "solution": "O=4×0,35=1,40 m.",
+            "lk20": "Omkrets og materialbehov."
+        },
+        {
+            "title": "Betongplate – armeringsnett",
+            "scenario": "Plate: 5,0×3,0 m. Nett leveres i 2,4×5,0 m. Overlapp 0,2 m i én retning.",
+            "ask": "Hvor mange nett trengs (grovt)?",
+            "hint": "Se på dekning per nett og overlapp. Grov planlegging.",
+            "solution": "Én nett dekker 2,4×5,0. For 3,0 m bredde trengs 2 nett i bredden med overlapp. Totalt 2 nett.",
+            "lk20": "Planlegge materialer og forstå overlapp."
+        },
+        {
+            "title": "Målestokk – forskalingshøyde",
+            "scenario": "Tegning 1:25. Du måler en høyde til 36 mm.",
+            "ask": "Virkelig høyde i mm og meter?",
+            "hint": "36×25=900 mm=0,9 m.",
+            "solution": "900 mm (0,90 m).",
+            "lk20": "Tolke tegninger og omregne."
+        },
+    ],
+    "Flislegger": [
+        {
+            "title": "Baderomsgulv – antall fliser",
+            "scenario": "Gulv: 2,4×3,1 m. Fliser 30×60 cm. 12 % svinn.",
+            "ask": "Hvor mange fliser trenger du (avrundet opp)?",
+            "hint": "A gulv / A flis × (1+svinn).",
+            "solution": "A=7,44 m². A flis=0,18 m². Antall uten svinn=41,33. Med svinn: 46,29 → 47 fliser.",
+            "lk20": "Areal, enhetsomregning og svinn."
+        },
+        {
+            "title": "Fall til sluk",
+            "scenario": "Avstand til sluk 1,6 m. Du skal ha 1:60 fall.",
+            "ask": "Hvor mange mm høydeforskjell trengs?",
+            "hint": "H = L/60.",
+            "solution": "1,6/60=0,0267 m=26,7 mm.",
+            "lk20": "Beregne fall i våtrom."
+        },
+        {
+            "title": "Sokkel – omkrets og lengde",
+            "scenario": "Rom: 3,2×4,6 m. Sokkel skal legges rundt hele rommet.",
+            "ask": "Hvor mange meter sokkel trenger du?",
+            "hint": "O=2(l+b).",
+            "solution": "O=2(3,2+4,6)=15,6 m.",
+            "lk20": "Omkrets og planlegging."
+        },
+        {
+            "title": "Flislim – forbruk",
+            "scenario": "Veggflate 18 m². Flislim forbruk 3,5 kg/m².",
+            "ask": "Hvor mange kg lim?",
+            "hint": "Mengde=A×forbruk.",
+            "solution": "18×3,5=63 kg.",
+            "lk20": "Beregne mengde og bestilling."
+        },
+        {
+            "title": "Fugemasse – volum",
+            "scenario": "Du fuger 10 m² med 5 mm fugebredde og 8 mm dybde. Forenklet: 1 m² gir 0,04 liter fugemasse.",
+            "ask": "Hvor mange liter fugemasse trengs?",
+            "hint": "Liter = areal × 0,04.",
+            "solution": "10×0,04=0,40 liter.",
+            "lk20": "Bruke forbrukstall og beregne mengde."
+        },
+        {
+            "title": "Mønster – diagonallinje",
+            "scenario": "Du skal legge fliser diagonalt i et kvadratisk felt 1,2×1,2 m.",
+            "ask": "Hva er diagonalen (m)?",
+            "hint": "Pythagoras: d = √(1,2²+1,2²).",
+            "solution": "d=√(1,44+1,44)=√2,88=1,70 m.",
+            "lk20": "Pythagoras i praktiske mål."
+        },
+        {
+            "title": "Kapp – antall kutt",
+            "scenario": "En vegg er 2,1 m høy. Fliser er 0,6 m høye. Du starter med hel flis nede.",
+            "ask": "Hvor mange hele rader får du, og hvor høy blir siste kapp (cm)?",
+            "hint": "Antall hele = ⌊2,1/0,6⌋. Rest = 2,1 − antall×0,6.",
+            "solution": "⌊2,1/0,6⌋=3 hele rader. Rest=2,1−1,8=0,3 m=30 cm.",
+            "lk20": "Planlegge kapping og tilpasning."
+        },
+        {
+            "title": "Målestokk – nisje",
+            "scenario": "Tegning 1:10. Nisjebredde måles til 52 mm.",
+            "ask": "Virkelig bredde i cm?",
+            "hint": "52×10=520 mm=52 cm.",
+            "solution": "52 cm.",
+            "lk20": "Tolke tegninger og omregne."
+        },
+        {
+            "title": "Pris – kalkyle",
+            "scenario": "Fliser koster 349 kr/m². Du skal legge 7,8 m². Legg til 12 % svinn i innkjøp.",
+            "ask": "Hva blir ca. materialkostnad (kr) for fliser?",
+            "hint": "Kost = A×1,12×pris.",
+            "solution": "7,8×1,12=8,736 m². 8,736×349 ≈ 3049 kr.",
+            "lk20": "Beregne kostnader og svinn."
+        },
+        {
+            "title": "Fallsoner – deling av gulv",
+            "scenario": "Gulv 2,0×2,0 m med sluk i midten. Du deler i 4 trekanter for fall.",
+            "ask": "Hva er arealet av én trekant (m²)?",
+            "hint": "Total A / 4.",
+            "solution": "Total A=4,0 m². Én trekant=1,0 m².",
+            "lk20": "Areal og oppdeling for planlegging."
+        },
+    ],
+    "Anleggsarbeider": [
+        {
+            "title": "Masseberegning – grus",
+            "scenario": "Du skal legge 12 cm bærelag på et område 6,0×9,5 m.",
+            "ask": "Hvor mange m³ grus trenger du?",
+            "hint": "V = areal × tykkelse.",
+            "solution": "A=57,0 m². Tykkelse=0,12 m. V=6,84 m³.",
+            "lk20": "Volum og masseberegning."
+        },
+        {
+            "title": "Fall – avrenning på vei",
+            "scenario": "En vei skal ha tverrfall 2 %. Veibredde er 4,5 m.",
+            "ask": "Hvor mange cm høydeforskjell fra midt til kant (halv bredde)?",
+            "hint": "2 % = 0,02. Halv bredde=2,25 m. H=0,02×2,25.",
+            "solution": "H=0,045 m=4,5 cm.",
+            "lk20": "Prosent og fall i anlegg."
+        },
+        {
+            "title": "Utskråning – vinkel",
+            "scenario": "Skråning 1:1,5 (1 opp per 1,5 bort).",
+            "ask": "Hva er vinkelen i grader (omtrent)?",
+            "hint": "tan(v) = 1/1,5.",
+            "solution": "v ≈ arctan(0,6667) ≈ 33,7°.",
+            "lk20": "Forhold og vinkler i terreng."
+        },
+        {
+            "title": "Rørgrøft – volum",
+            "scenario": "Grøft: 18 m lang, 0,6 m bred og 0,9 m dyp.",
+            "ask": "Hvor stort volum masse skal graves ut (m³)?",
+            "hint": "V = l×b×h.",
+            "solution": "18×0,6×0,9=9,72 m³.",
+            "lk20": "Volum og planlegging."
+        },
+        {
+            "title": "Kantstein – antall",
+            "scenario": "Du skal legge kantstein langs 24 m. Hver kantstein er 0,5 m.",
+            "ask": "Hvor mange kantstein trenger du?",
+            "hint": "Antall = lengde / 0,5.",
+            "solution": "24/0,5=48 stk.",
+            "lk20": "Lengde og materialbehov."
+        },
+        {
+            "title": "Komprimering – lagtykkelse",
+            "scenario": "Du fyller opp 0,36 m. Du legger maks 12 cm per lag.",
+            "ask": "Hvor mange lag må du komprimere?",
+            "hint": "Antall = total/lagtykkelse.",
+            "solution": "0,36/0,12=3 lag.",
+            "lk20": "Planlegge utførelse og kvalitet."
+        },
+        {
+            "title": "Maskintid – produksjon",
+            "scenario": "Gravemaskin graver 18 m³ per time. Du har 52 m³ masse.",
+            "ask": "Hvor lang tid tar gravingen (timer og minutter)?",
+            "hint": "Tid = volum / kapasitet.",
+            "solution": "52/18=2,89 timer ≈ 2 t 53 min.",
+            "lk20": "Beregne tid og kapasitet."
+        },
+        {
+            "title": "Areal – utlegging av duk",
+            "scenario": "Du legger fiberduk i et område 7,2×11,5 m. Overlapp gir 6 % ekstra.",
+            "ask": "Hvor mange m² duk bør bestilles?",
+            "hint": "A×1,06.",
+            "solution": "A=82,8 m². Med overlapp: 87,77 m².",
+            "lk20": "Areal og tillegg for overlapp."
+        },
+        {
+            "title": "Målestokk – grøfteplan",
+            "scenario": "Tegning 1:200. Du måler grøftelengde til 73 mm.",
+            "ask": "Hva er virkelig lengde i meter?",
+            "hint": "73×200=14600 mm=14,6 m.",
+            "solution": "14,6 m.",
+            "lk20": "Tolke tegninger og omregne."
+        },
+        {
+            "title": "Volum – asfalt (forenklet)",
+            "scenario": "Asfaltering: 120 m² med 4 cm tykkelse.",
+            "ask": "Hva er volum asfalt i m³?",
+            "hint": "V=A×t.",
+            "solution": "t=0,04 m. V=120×0,04=4,8 m³.",
+            "lk20": "Volum og mengdeberegning."
+        },
+    ],
+}
+
+VTY_CASES = MappingProxyType({trade: tuple(VtyCase(**c) for c in cases) for trade, cases in _CASE_SOURCE.items()})
+del _CASE_SOURCE
@@ -0,0 +1,158 @@
+"""
+Arbeidsark og fasit for utskrift (HTML, ett ark per elev).
+
+export_worksheets() lager arkene i en prosesspool. Hver arbeider skriver sitt ark
+rett til disk og sender bare fasitradene tilbake, og fasiten (fasit.html) skrives
+fortløpende, så et helt årstrinn aldri ligger i minnet. Til slutt pakkes alt i én zip.
+WorksheetJob kjører eksporten i en bakgrunnstråd, så Streamlit-skriptet ikke blokkeres.
+
+Arkene er vanlig HTML med utskrifts-CSS (sideskift per elev); PDF lages med
+nettleserens "Skriv ut / Lagre som PDF".
+"""
+import hashlib
+import html
+import multiprocessing
+import re
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from arena_questions import make_tasks, question_set
+from curriculum import LEVELS, TOPIC_KEYS, TOPICS
+from progress_store import DATA_DIR
+from units import fmt
+
+WORKSHEET_DIR = DATA_DIR / "worksheets"
+WORKSHEET_CHUNK = 8  # elever per oppgave til en arbeider
+
+_TOPIC_NAMES = {k: no for k, no, _ in TOPICS}
+_LEVEL_NAMES = {lv: no for lv, no, _ in LEVELS}
+
+_CSS = """
+body { font-family: Arial, sans-serif; font-size: 12pt; margin: 2cm; }
+h1 { font-size: 18pt; margin-bottom: 0; }
+h2 { font-size: 13pt; margin: 1.2em 0 0.4em; border-bottom: 1px solid #999; }
+.meta { color: #555; margin-bottom: 1em; }
+ol li { margin: 0.5em 0; }
+.line { display: inline-block; width: 6cm; border-bottom: 1px solid #000; margin-left: 0.5em; }
+table { border-collapse: collapse; width: 100%; margin-bottom: 1em; }
+td, th { border: 1px solid #bbb; padding: 3px 6px; text-align: left; font-size: 10pt; }
+.sheet { page-break-after: always; }
+"""
+
+
+def _safe_filename(name: str) -> str:
+    """Elev-ID som filnavn; IDer med spesialtegn får en kort hash så de ikke kolliderer."""
+    safe = re.sub(r"[^0-9A-Za-z_-]", "_", name)
+    if safe != name or not safe:
+        safe += "-" + hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+    return safe
+
+
+def worksheet_sections(student_id: str, level: int, topics=TOPIC_KEYS, include_legacy: bool = True) -> list:
+    """(overskrift, spørsmål) per del: elevens egne arena-spørsmål per tema, evt. det faste settet."""
+    sections = [(_TOPIC_NAMES.get(k, k), list(question_set(student_id, k, level))) for k in topics]
+    if include_legacy:
+        legacy = [{**t, "tol": t.get("tolerance", 0.0)} for t in make_tasks(level)]
+        sections.append((f"Fast øvingssett (nivå {level})", legacy))
+    return sections
+
+
+def render_worksheet(student_id: str, class_name: str, level: int, sections: list) -> tuple:
+    """HTML for ett ark og fasitradene (del, nr, svar) for eleven."""
+    parts = [
+        '<div class="sheet">',
+        "<h1>Byggmatte – arbeidsark</h1>",
+        f'<div class="meta">Elev: <b>{html.escape(student_id)}</b> · Klasse: {html.escape(class_name or "–")}'
+        f" · Nivå: {html.escape(_LEVEL_NAMES.get(level, str(level)))}</div>",
+    ]
+    key = []
+    for title, questions in sections:
+        parts.append(f"<h2>{html.escape(title)}</h2><ol>")
+        for i, q in enumerate(questions, 1):
+            unit = html.escape(q.get("unit", ""))
+            parts.append(f'<li>{html.escape(q["prompt"])}<br>Svar:<span class="line"></span> {unit}</li>')
+            key.append((title, i, fmt(q["answer"]) + (f" {q['unit']}" if q.get("unit") else ""), fmt(q.get("tol", 0.0))))
+        parts.append("</ol>")
+    parts.append("</div>")
+    return "\n".join(parts), key
+
+
+def _page(title: str, body: str = "") -> str:
+    return (f'<!DOCTYPE html>\n<html lang="no"><head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+            f"<style>{_CSS}</style></head><body>\n{body}")
+
+
+def _render_one(job: tuple) -> tuple:
+    """Kjører i arbeiderprosessen: skriv arket til disk, returner bare fasiten."""
+    out_dir, student_id, class_name, level, topics, include_legacy = job
+    sheet, key = render_worksheet(student_id, class_name, level,
+                                  worksheet_sections(student_id, level, topics, include_legacy))
+    path = Path(out_dir) / f"ark-{_safe_filename(student_id)}.html"
+    path.write_text(_page(f"Arbeidsark {student_id}", sheet) + "\n</body></html>\n", encoding="utf-8")
+    return student_id, class_name, key
+
+
+def export_worksheets(students, level: int, out_dir: Path | None = None, topics=TOPIC_KEYS,
+                      include_legacy: bool = True, workers: int | None = None, progress=None) -> Path:
+    """
+    students: (student_id, class_name)-par. Lager ark-<elev>.html per elev, fasit.html og
+    arbeidsark.zip i out_dir. progress(ferdig) kalles etter hver elev. Returnerer zip-stien.
+    """
+    out_dir = Path(out_dir or WORKSHEET_DIR / time.strftime("%Y%m%d-%H%M%S"))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = ((str(out_dir), sid, cls, level, tuple(topics), include_legacy) for sid, cls in students)
+    key_path = out_dir / "fasit.html"
+    done = 0
+    # spawn: trygt å starte fra en tråd i Streamlit-serveren (fork kopierer låser og tråder)
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool, key_path.open("w", encoding="utf-8") as key_file:
+        key_file.write(_page(f"Fasit nivå {level}", f"<h1>Fasit – {html.escape(_LEVEL_NAMES.get(level, str(level)))}</h1>\n"))
+        for student_id, class_name, key in pool.map(_render_one, jobs, chunksize=WORKSHEET_CHUNK):
+            rows = "".join(
+                f"<tr><td>{html.escape(title)}</td><td>{i}</td><td>{html.escape(ans)}</td><td>±{tol}</td></tr>"
+                for title, i, ans, tol in key
+            )
+            key_file.write(f"<h2>{html.escape(student_id)} ({html.escape(class_name or '–')})</h2>"
+                           f"<table><tr><th>Del</th><th>Nr</th><th>Svar</th><th>Toleranse</th></tr>{rows}</table>\n")
+            done += 1
+            if progress is not None:
+                progress(done)
+        key_file.write("</body></html>\n")
+
+    zip_path = out_dir / "arbeidsark.zip"
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(out_dir.glob("*.html")):
+            zf.write(path, path.name)
+    return zip_path
+
+
+class WorksheetJob:
+    """Eksport i bakgrunnstråd. Appen leser done/total/error/result ved hver rerun."""
+
+    def __init__(self, students: list, level: int, **options):
+        self.students = list(students)
+        self.total = len(self.students)
+        self.done = 0
+        self.result = None
+        self.error = None
+        self._thread = threading.Thread(target=self._run, args=(level, options), name="worksheet-export", daemon=True)
+
+    def start(self) -> "WorksheetJob":
+        self._thread.start()
+        return self
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def _progress(self, done: int) -> None:
+        self.done = done
+
+    def _run(self, level: int, options: dict) -> None:
+        try:
+            self.result = export_worksheets(self.students, level, progress=self._progress, **options)
+        except Exception as e:
+            self.error = e